@@ -1,58 +1,680 @@
 import ast
+import asyncio
 import os
+import re
+import sys
 import json
+import mmap
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache, partial
+from itertools import chain, repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Callable, FrozenSet, Iterator, Optional, Tuple, Type, Union
 import logging
 
-from models.schemas import ASTNode, FileInfo, RepositoryAnalysis, CodeMetrics
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+from config.settings import settings
+from models.schemas import ASTNode, FileInfo, RepositoryAnalysis, CodeMetrics, build_ast_nodes
 from analyzers.enhanced import EnhancedAnalyzer, TreeSitterAnalyzer
+from tree_sitter import Language, Node, Parser
+from utils.disk_cache import DiskCache
+from utils.process_pool import process_pool_context
 
 logger = logging.getLogger(__name__)
 
+# 분석 중 노드 표현 (ASTNode 필드와 같은 키의 dict, 파일 단위로 한 번에 ASTNode로 변환)
+RawNode = Dict[str, Any]
+
+# 분석기에 전달되는 원본 소스 (작은 파일은 bytes, 큰 파일은 읽기 전용 mmap)
+SourceBuffer = Union[bytes, mmap.mmap]
+
+# 정규식 스캐너 패턴은 바이트 패턴으로 원본 버퍼(bytes/mmap)에 직접 적용하고 캡처한 조각만 디코딩
+# (\x80-\xff는 UTF-8 다중 바이트 문자를 식별자에 포함시키기 위함)
+LinePatterns = Tuple['re.Pattern[bytes]', 're.Pattern[bytes]']
+
+
+def _compile_line_patterns(body: bytes) -> LinePatterns:
+    """줄 시작에 적용할 패턴을 (첫 줄용, 나머지 줄용) 쌍으로 컴파일
+
+    re.MULTILINE의 ^는 모든 바이트 위치에서 매치를 시도하지만, 리터럴 \n으로 시작하는 패턴은
+    정규식 엔진이 줄바꿈 위치로 바로 건너뛰므로 선언이 아닌 줄에 드는 비용이 줄어듭니다.
+    """
+    return re.compile(body), re.compile(rb'\n' + body)
+
+
+# JavaScript/TypeScript 선언 패턴 (줄 단위 앵커, 대안 순서가 곧 분류 우선순위)
+_JS_DECLARATION_PATTERNS = _compile_line_patterns(
+    rb'[ \t]*(?:'
+    rb'(?P<function>(?:async[ \t]+)?function\b[ \t]*\*?[ \t]*(?P<function_name>[\w$\x80-\xff]*))'
+    rb'|(?P<bound_function>(?:(?:const|let|var)[ \t]+)?(?P<bound_name>[\w$.\x80-\xff]+)[ \t]*[:=][ \t]*(?:async[ \t]*)?'
+    rb'(?:function\b|(?:\([^)\n]*\)|[\w$\x80-\xff]+)[ \t]*=>))'
+    rb'|(?P<class>class[ \t]+(?P<class_name>[\w$\x80-\xff]+))'
+    rb'|(?P<module>(?:import|export)\b)'
+    rb'|(?P<require>[^\n]*\brequire\()'
+    rb'|(?P<variable>(?P<variable_kind>const|let|var)[ \t]+'
+    rb'(?P<variable_name>\[[^\]\n]*\]|\{[^}\n]*\}|[\w$\x80-\xff]+))'
+    rb')'
+)
+
+# Lua 선언 패턴 (주석 줄 제외, 대안 순서가 곧 분류 우선순위)
+_LUA_DECLARATION_PATTERNS = _compile_line_patterns(
+    rb'[ \t]*(?!--)(?:'
+    rb'(?P<function>(?:local[ \t]+)?function[ \t]+(?P<function_name>[^\s(]+))'
+    rb'|(?P<love_callback>[^\n]*?\b(?P<callback_name>love\.(?:load|update|draw|keypressed|keyreleased'
+    rb'|mousepressed|mousereleased))\b)'
+    rb'|(?P<assigned_function>[^\n]*?(?P<assigned_name>[^\s=]+)[ \t]*=[ \t]*function\b)'
+    rb'|(?P<variable>(?!if|while)(?:local[ \t]+)?(?P<variable_name>[^\s=]+)[^\n=]*=)'
+    rb')'
+)
+
+# Lua 정규식 스캐너에서 분류별로 이름을 담는 그룹
+_LUA_NAME_GROUPS: Dict[str, str] = {
+    'function': 'function_name',
+    'love_callback': 'callback_name',
+    'assigned_function': 'assigned_name',
+}
+
+# Love2D 프레임워크 콜백 함수 이름
+_LOVE2D_CALLBACKS: FrozenSet[str] = frozenset({
+    'love.load', 'love.update', 'love.draw', 'love.keypressed', 'love.keyreleased',
+    'love.mousepressed', 'love.mousereleased',
+})
+
+# Java 선언 패턴 (클래스 / 접근 제어자가 있는 메소드·생성자 / import)
+# 첫 바이트 전방 탐색으로 '}', '//', '*' 등으로 시작하는 줄은 대안들을 시도하기 전에 바로 제외
+_JAVA_DECLARATION_PATTERNS = _compile_line_patterns(
+    rb'[ \t]*(?=[\w<>\[\],.?@\x80-\xff])(?:'
+    rb'(?P<class>(?:(?:public|protected|private|abstract|final|static)[ \t]+)*class[ \t]+(?P<class_name>[\w\x80-\xff]+))'
+    rb'|(?P<method>(?=[^\n]*\b(?:public|private|protected)[ \t])(?:[\w<>\[\],.?@\x80-\xff]+[ \t]+)+?'
+    rb'(?P<method_name>[\w\x80-\xff]+)[ \t]*\((?=[^\n]*\)))'
+    rb'|(?P<import>import[ \t][^\n]*)'
+    rb')'
+)
+
+
+# import 문 이름은 파일마다 같은 값('os', 'from typing import List' 등)이 반복되므로 intern하여 한 객체를 공유
+def _python_import_name(node: ast.Import) -> str:
+    return sys.intern(', '.join(alias.name for alias in node.names))
+
+
+def _python_import_from_name(node: ast.ImportFrom) -> str:
+    module = node.module or ''
+    names = ', '.join(alias.name for alias in node.names)
+    return sys.intern(f"from {module} import {names}")
+
+
+def _python_assign_name(node: ast.Assign) -> Optional[str]:
+    targets = []
+    for target in node.targets:
+        if isinstance(target, ast.Name):
+            targets.append(target.id)
+        elif isinstance(target, ast.Attribute):
+            targets.append(f"{target.attr}")
+    return ', '.join(targets) if targets else None
+
+
+# 분석 결과 형태가 바뀌면 올려서 이전 캐시 항목을 무효화
+ANALYZER_VERSION = 6
+
+# 캐시 항목 버전 (인터프리터 버전이 바뀌어도 이전 항목을 쓰지 않도록 함께 기록)
+_AST_CACHE_VERSION = (sys.version_info[:2], ANALYZER_VERSION)
+
+# ASTNode로 변환할 Python 노드 타입 (루트 Module은 항상 포함)
+_PYTHON_INTERESTING_NODES: FrozenSet[Type[ast.AST]] = frozenset({
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Import,
+    ast.ImportFrom,
+    ast.Assign,
+})
+
+# shallow 모드에서 본문으로 내려가지 않는 노드 (함수 본문 안의 중첩 선언은 생략)
+_PYTHON_FUNCTION_NODES: FrozenSet[Type[ast.AST]] = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+
+# 선언을 담을 수 있는 문장 목록 필드 (ast 필드 순서대로, 표현식 하위 트리는 순회하지 않음)
+# 예: Try는 body → handlers → orelse → finalbody, Match는 cases, match_case/ExceptHandler는 body
+_PYTHON_BODY_FIELDS: Tuple[str, ...] = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+# 노드 타입별로 실제 가진 문장 목록 필드 (처음 만난 타입만 계산해 두고 이후에는 조회만 함)
+_PYTHON_BODY_FIELDS_BY_TYPE: Dict[Type[ast.AST], Tuple[str, ...]] = {}
+
+# 노드 타입 → 이름 추출 함수 (그 외 타입은 `name` 속성으로 대체)
+_PYTHON_NAME_HANDLERS: Dict[Type[ast.AST], Callable[[Any], Optional[str]]] = {
+    ast.FunctionDef: attrgetter('name'),
+    ast.AsyncFunctionDef: attrgetter('name'),
+    ast.ClassDef: attrgetter('name'),
+    ast.Import: _python_import_name,
+    ast.ImportFrom: _python_import_from_name,
+    ast.Assign: _python_assign_name,
+}
+
+# tree-sitter JS/TS 선언 노드 분류
+_JS_FUNCTION_DECLARATIONS = frozenset({'function_declaration', 'generator_function_declaration'})
+_JS_CLASS_DECLARATIONS = frozenset({'class_declaration', 'abstract_class_declaration'})
+_JS_FUNCTION_EXPRESSIONS = frozenset({'arrow_function', 'function_expression', 'function', 'generator_function'})
+
+# tree-sitter Java 노드 타입 → ASTNode 타입
+_JAVA_DECLARATION_TYPES = {
+    'class_declaration': 'ClassDeclaration',
+    'method_declaration': 'MethodDeclaration',
+    'constructor_declaration': 'MethodDeclaration',
+    'import_declaration': 'ImportDeclaration',
+}
+
+
+def _is_js_require_call(source: SourceBuffer, call_node: Node) -> bool:
+    function_node = call_node.child_by_field_name('function')
+    return function_node is not None and _ts_node_text(source, function_node) == 'require'
+
+
+# 장시간 실행되는 서비스에서 같은 파일을 반복 분석하지 않도록 (경로, mtime, 크기 …) → 결과 LRU
+# (반환된 노드 리스트는 호출자 사이에 공유되므로 수정하지 않아야 함)
+_AST_MEMORY_CACHE: "OrderedDict[Tuple[Any, ...], List[ASTNode]]" = OrderedDict()
+_AST_MEMORY_CACHE_SIZE = 4096
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+# 프로세스 풀에 한 번에 넘기는 최대 파일 수
+_PARALLEL_CHUNKSIZE = 32
+
+# 순차 분석 시 파일 읽기 선행 스레드 수 / 한 작업으로 읽는 파일 수 / 동시에 미리 읽어 둘 최대 배치 수
+_PREFETCH_WORKERS = 8
+_PREFETCH_BATCH_SIZE = 16
+_PREFETCH_WINDOW = 4
+
+# get_ast_summary에서 노드 목록의 열을 뽑는 접근자 (map과 함께 C 수준에서 호출됨)
+_get_type = attrgetter('type')
+_get_metadata = attrgetter('metadata')
+
+
+@lru_cache(maxsize=1)
+def _load_tree_sitter_languages() -> Dict[str, Language]:
+    """JS/TS/Java/Lua tree-sitter 언어 객체 로드 (프로세스당 한 번, 로드에 실패한 언어는 제외)"""
+    languages = {}
+    try:
+        import tree_sitter
+        import tree_sitter_javascript
+        import tree_sitter_java
+        import tree_sitter_typescript
+        
+        languages.update({
+            'JavaScript': tree_sitter.Language(tree_sitter_javascript.language()),
+            'TypeScript': tree_sitter.Language(tree_sitter_typescript.language_typescript()),
+            'TSX': tree_sitter.Language(tree_sitter_typescript.language_tsx()),
+            'Java': tree_sitter.Language(tree_sitter_java.language()),
+        })
+    except Exception as e:
+        logger.warning(f"Tree-sitter grammars unavailable, using regex scanners for JS/TS/Java: {e}")
+    
+    # Lua 문법은 별도 패키지이므로 따로 로드 (없어도 다른 언어는 tree-sitter 사용)
+    try:
+        import tree_sitter
+        import tree_sitter_lua
+        
+        languages['Lua'] = tree_sitter.Language(tree_sitter_lua.language())
+    except Exception as e:
+        logger.warning(f"Tree-sitter Lua grammar unavailable, using regex scanner for Lua: {e}")
+    return languages
+
+
+def _iter_tree_sitter_nodes(root: Node) -> Iterator[Node]:
+    """TreeCursor로 트리를 전위 순회 (자식 리스트를 만들지 않음)"""
+    cursor = root.walk()
+    while True:
+        yield cursor.node
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+
+
+def _ts_node_text(source: SourceBuffer, node: Node) -> str:
+    return str(source[node.start_byte:node.end_byte], 'utf-8', 'ignore')
+
+
+def _ts_node_name(source: SourceBuffer, node: Node) -> str:
+    """식별자 노드의 텍스트 (같은 이름이 파일/노드마다 반복되므로 intern)"""
+    return sys.intern(_ts_node_text(source, node))
+
+
+def _ts_first_line(source: SourceBuffer, node: Node) -> str:
+    return _ts_node_text(source, node).split('\n', 1)[0].strip()
+
+
+def _count_newlines(source: SourceBuffer) -> int:
+    """버퍼의 줄바꿈 수 (mmap에는 count가 없으므로 1 MiB 단위로 잘라 셈)"""
+    step = 1 << 20
+    return sum(source[pos:pos + step].count(b'\n') for pos in range(0, len(source), step))
+
+
+def _scan_declarations(patterns: LinePatterns,
+                       source: SourceBuffer) -> Iterator[Tuple[str, 're.Match[bytes]', int, str]]:
+    """선언 패턴 매치마다 (분류, 매치, 1부터 시작하는 줄 번호, 선언 시작부터 줄 끝까지) 생성
+
+    파일 전체를 디코딩하지 않고 바이트 버퍼에 바로 패턴을 적용합니다. 매치가 오프셋 순서로 나오므로
+    줄 번호는 직전 매치 이후 구간의 줄바꿈만 세어 누적합니다 (줄 오프셋 표를 만들지 않음).
+    """
+    first_line_pattern, line_pattern = patterns
+    first_match = first_line_pattern.match(source)
+    matches = line_pattern.finditer(source)
+    if first_match is not None:
+        matches = chain((first_match,), matches)
+    
+    line_no = 1
+    last_pos = 0
+    find = source.find
+    for match in matches:
+        kind = match.lastgroup
+        start = match.start(kind)
+        line_no += source[last_pos:start].count(b'\n')
+        last_pos = start
+        
+        # 패턴이 줄 앞 공백을 이미 건너뛰었으므로 선언 시작부터 줄 끝까지만 잘라 디코딩
+        line_end = find(b'\n', start)
+        line = str(source[start:line_end if line_end >= 0 else len(source)], 'utf-8', 'ignore').rstrip()
+        yield kind, match, line_no, line
+
+
+def _match_text(match: 're.Match[bytes]', group: str) -> Optional[str]:
+    """바이트 매치의 그룹을 문자열로 디코딩 (그룹이 매치되지 않았으면 None, 반복되는 식별자는 intern)"""
+    value = match.group(group)
+    return None if value is None else sys.intern(str(value, 'utf-8', 'ignore'))
+
+
+def _raw_node(type: str, name: Optional[str] = None, line_start: Optional[int] = None,
+              line_end: Optional[int] = None, metadata: Optional[Dict[str, Any]] = None) -> RawNode:
+    """분석 중에 사용하는 가벼운 노드 표현 (ASTNode 필드와 같은 키를 가진 dict)"""
+    return {
+        'type': type,
+        'name': name,
+        'line_start': line_start,
+        'line_end': line_end,
+        'children': [],
+        'metadata': {} if metadata is None else metadata
+    }
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON 기본 타입이 아닌 메타데이터 값 처리 (집합은 리스트, 그 외 객체는 속성 dict)"""
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return getattr(obj, '__dict__', str(obj))
+
+
+def _memory_cache_get(key: Tuple[Any, ...]) -> Optional[List[ASTNode]]:
+    with _MEMORY_CACHE_LOCK:
+        ast_nodes = _AST_MEMORY_CACHE.get(key)
+        if ast_nodes is not None:
+            _AST_MEMORY_CACHE.move_to_end(key)
+        return ast_nodes
+
+
+def _memory_cache_put(key: Tuple[Any, ...], ast_nodes: List[ASTNode]) -> None:
+    # stat에 실패한 파일의 키 (경로, None)는 저장하지 않음
+    if key[1] is None:
+        return
+    with _MEMORY_CACHE_LOCK:
+        _AST_MEMORY_CACHE[key] = ast_nodes
+        _AST_MEMORY_CACHE.move_to_end(key)
+        while len(_AST_MEMORY_CACHE) > _AST_MEMORY_CACHE_SIZE:
+            _AST_MEMORY_CACHE.popitem(last=False)
+
+
+def _advise_sequential(fd: int) -> None:
+    """한 번 처음부터 끝까지 읽고 버리는 파일임을 커널에 알림 (적극적 readahead, 페이지 캐시 재사용 안 함)
+
+    저장소 전체를 스캔할 때 다른 프로세스의 자주 쓰는 페이지가 밀려나지 않도록 하며,
+    posix_fadvise가 없는 플랫폼에서는 아무것도 하지 않습니다.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """fstat으로 얻은 크기만큼 파일 디스크립터에서 바로 읽음 (파일 객체/버퍼 계층 생성 없음)"""
+    data = os.read(fd, size)
+    if len(data) < size:
+        # 드물게 짧게 읽힌 경우(파일이 읽는 중에 바뀐 경우 등) EOF까지 이어서 읽음
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        data = b''.join(chunks)
+    return data
+
+
+def _prefetch_source(file_path: str) -> Optional[bytes]:
+    """분석 전에 파일을 미리 읽음 (mmap 대상인 큰 파일은 커널 readahead만 요청하고 None 반환)"""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size >= mmap.PAGESIZE:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            return None
+        return _read_fd(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _prefetch_sources(file_paths: List[str]) -> List[Union[bytes, None, OSError]]:
+    """파일 묶음을 한 작업으로 미리 읽음 (읽기 실패는 예외 객체로 담아 해당 파일에서만 오류 처리)"""
+    sources: List[Union[bytes, None, OSError]] = []
+    for file_path in file_paths:
+        try:
+            sources.append(_prefetch_source(file_path))
+        except OSError as e:
+            sources.append(e)
+    return sources
+
+
+# 프로세스 풀 워커마다 한 번만 생성하는 분석기 (파서/캐시 초기화 비용을 파일마다 반복하지 않음)
+_worker_analyzer: Optional['ASTAnalyzer'] = None
+
+
+def _init_analyzer_worker(use_cache: bool, max_python_lines: int, python_shallow: bool) -> None:
+    """프로세스 풀 initializer: 워커 프로세스 전용 ASTAnalyzer 생성"""
+    global _worker_analyzer
+    _worker_analyzer = ASTAnalyzer(use_cache=use_cache, max_python_lines=max_python_lines,
+                                   python_shallow=python_shallow)
+
+
+def _analyze_file_worker(task: Tuple[str, str]) -> Tuple[Optional[List[ASTNode]], int, Optional[str]]:
+    """프로세스 풀 워커: 단일 파일 AST 분석 (pickle 가능하도록 모듈 수준에 정의)
+    
+    map으로 묶어 실행하므로 예외를 올리지 않고 (결과, 캐시 쓰기 수, 오류 메시지)로 반환합니다.
+    """
+    file_path, language = task
+    analyzer = _worker_analyzer
+    writes_before = analyzer._cache_writes
+    try:
+        ast_nodes = analyzer._analyze_with_cache(file_path, language)
+        return ast_nodes, analyzer._cache_writes - writes_before, None
+    except Exception as e:
+        return None, analyzer._cache_writes - writes_before, str(e)
+
 
 class ASTAnalyzer:
     """AST(Abstract Syntax Tree) 분석을 담당하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, use_cache: Optional[bool] = None, max_file_bytes: Optional[int] = None,
+                 max_python_lines: Optional[int] = None, python_shallow: Optional[bool] = None) -> None:
         self.supported_languages = {
             'Python': self._analyze_python_ast,
             'JavaScript': self._analyze_javascript_ast,
-            'TypeScript': self._analyze_typescript_ast,
+            # TypeScript는 JavaScript 분석기를 언어 라벨만 바꿔 직접 호출 (전달용 메소드 프레임 없음)
+            'TypeScript': partial(self._analyze_javascript_ast, language='TypeScript'),
             'Java': self._analyze_java_ast,
             'Lua': self._analyze_lua_ast
         }
+        
+        # JS/TS/Java/Lua용 tree-sitter 파서 (문법 패키지가 없으면 정규식 스캐너 사용)
+        self._ts_parsers = {}
+        for lang_name, language in _load_tree_sitter_languages().items():
+            parser = Parser()
+            parser.language = language
+            self._ts_parsers[lang_name] = parser
+        
+        # 파일 내용 해시 기반 디스크 캐시 (변경 없는 파일은 파싱 생략)
+        if use_cache is None:
+            use_cache = settings.ENABLE_AST_CACHE
+        self.cache = DiskCache(
+            settings.AST_CACHE_DIR, settings.AST_CACHE_MAX_ENTRIES, version=_AST_CACHE_VERSION
+        ) if use_cache else None
+        self._cache_writes = 0
+        
+        # 이 크기를 넘는 파일은 분석하지 않음 (대부분 생성/압축된 코드로 파싱 시간만 차지)
+        self.max_file_bytes = settings.AST_MAX_FILE_BYTES if max_file_bytes is None else max_file_bytes
+        self.max_python_lines = settings.AST_MAX_PYTHON_LINES if max_python_lines is None else max_python_lines
+        
+        # True면 Python 함수 본문으로 내려가지 않고 모듈/클래스 수준 선언만 수집
+        self.python_shallow = settings.AST_PYTHON_SHALLOW if python_shallow is None else python_shallow
     
-    def analyze_files(self, clone_path: str, files: List[FileInfo]) -> Dict[str, List[ASTNode]]:
-        """파일들의 AST 분석 수행"""
-        ast_results = {}
+    def analyze_files(self, clone_path: str, files: List[FileInfo], parallel: bool = True) -> Dict[str, List[ASTNode]]:
+        """파일들의 AST 분석 수행 (parallel=False면 현재 프로세스에서만 분석)"""
+        self._cache_writes = 0
         
+        # 같은 경로가 여러 번 전달되어도 한 번만 분석하고, 프로세스 메모리 캐시에 있으면 재사용
+        ordered_paths = []
+        cached_results = {}
+        memory_keys = {}
+        tasks = []
         for file_info in files:
-            if file_info.language in self.supported_languages:
-                try:
-                    file_path = os.path.join(clone_path, file_info.path)
-                    analyzer = self.supported_languages[file_info.language]
-                    ast_nodes = analyzer(file_path)
-                    
-                    if ast_nodes:
-                        ast_results[file_info.path] = ast_nodes
-                        logger.info(f"Successfully analyzed AST for {file_info.path}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to analyze AST for {file_info.path}: {e}")
-                    continue
+            if file_info.language not in self.supported_languages or file_info.path in memory_keys:
+                continue
+            
+            file_path = os.path.join(clone_path, file_info.path)
+            memory_key = self._memory_cache_key(file_path, file_info)
+            if memory_key is None:
+                continue
+            memory_keys[file_info.path] = memory_key
+            ordered_paths.append(file_info.path)
+            
+            ast_nodes = _memory_cache_get(memory_key)
+            if ast_nodes is not None:
+                cached_results[file_info.path] = ast_nodes
+            else:
+                tasks.append(file_info)
+        
+        workers = min(settings.PARALLEL_ANALYSIS_WORKERS, os.cpu_count() or 1, len(tasks))
+        if parallel and workers > 1:
+            try:
+                analyzed = self._analyze_files_parallel(clone_path, tasks, workers)
+            except Exception as e:
+                # 프로세스 풀을 사용할 수 없는 환경에서는 순차 분석으로 대체
+                logger.warning(f"Parallel AST analysis unavailable, falling back to serial: {e}")
+                analyzed = self._analyze_files_serial(clone_path, tasks)
+        else:
+            analyzed = self._analyze_files_serial(clone_path, tasks)
+        
+        for path, ast_nodes in analyzed.items():
+            _memory_cache_put(memory_keys[path], ast_nodes)
         
+        # 새 항목이 추가된 경우에만 캐시 크기 정리
+        if self.cache is not None and self._cache_writes:
+            self.cache.prune()
+        
+        # 입력 파일 순서대로 결과 구성
+        ast_results = {}
+        for path in ordered_paths:
+            ast_nodes = cached_results.get(path) or analyzed.get(path)
+            if ast_nodes:
+                ast_results[path] = ast_nodes
         return ast_results
     
-    def _analyze_python_ast(self, file_path: str) -> List[ASTNode]:
-        """Python 파일의 AST 분석"""
+    async def analyze_files_async(self, clone_path: str, files: List[FileInfo],
+                                  parallel: bool = True) -> Dict[str, List[ASTNode]]:
+        """analyze_files를 워커 스레드에서 실행 (분석 중에도 이벤트 루프가 다른 요청을 처리하도록 함)
+        
+        파일 읽기와 파싱의 겹침은 analyze_files 내부(선행 읽기 스레드 풀/프로세스 풀)에서 처리합니다.
+        """
+        return await asyncio.to_thread(self.analyze_files, clone_path, files, parallel)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """프로세스 내 AST 결과 캐시 비우기 (디스크 캐시는 유지)"""
+        with _MEMORY_CACHE_LOCK:
+            _AST_MEMORY_CACHE.clear()
+    
+    def _memory_cache_key(self, file_path: str, file_info: FileInfo) -> Optional[Tuple[Any, ...]]:
+        """(경로, mtime_ns, 크기, 언어, 줄 수 제한, shallow 여부) 키 생성. 크기 제한을 넘는 파일은 None
+        
+        stat에 실패한 파일은 분석 단계에서 오류로 기록되도록 캐시되지 않는 키를 반환합니다.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                source_code = f.read()
+            stat = os.stat(file_path)
+        except OSError:
+            return (file_path, None)
+        
+        if stat.st_size > self.max_file_bytes:
+            logger.info(f"Skipping AST analysis for oversized file {file_info.path} ({stat.st_size} bytes)")
+            return None
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+                file_info.language, self.max_python_lines, self.python_shallow)
+    
+    def _analyze_files_serial(self, clone_path: str, tasks: List[FileInfo]) -> Dict[str, List[ASTNode]]:
+        """현재 프로세스에서 파일을 하나씩 분석 (다음 파일들의 읽기는 스레드 풀로 미리 수행)"""
+        ast_results = {}
+        if not tasks:
+            return ast_results
+        
+        # 파일이 하나뿐이면 선행 읽기 없이 바로 분석
+        if len(tasks) == 1:
+            return self._analyze_batch(clone_path, tasks, [None])
+        
+        batches = [tasks[i:i + _PREFETCH_BATCH_SIZE] for i in range(0, len(tasks), _PREFETCH_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(_PREFETCH_WORKERS, len(batches))) as pool:
+            pending = deque()
+            batch_iter = iter(batches)
+            
+            def submit_next() -> None:
+                batch = next(batch_iter, None)
+                if batch is not None:
+                    file_paths = [os.path.join(clone_path, file_info.path) for file_info in batch]
+                    pending.append((batch, pool.submit(_prefetch_sources, file_paths)))
+            
+            # 읽기 선행 범위를 배치 단위로 제한해 메모리에 올라오는 파일 수를 묶어 둠
+            for _ in range(_PREFETCH_WINDOW):
+                submit_next()
+            
+            while pending:
+                batch, future = pending.popleft()
+                submit_next()
+                ast_results.update(self._analyze_batch(clone_path, batch, future.result()))
+        
+        return ast_results
+    
+    def _analyze_batch(self, clone_path: str, batch: List[FileInfo],
+                       sources: List[Union[bytes, None, OSError]]) -> Dict[str, List[ASTNode]]:
+        """미리 읽은 내용으로 파일 묶음 분석 (None이면 분석 시점에 직접 읽음)"""
+        ast_results = {}
+        for file_info, source in zip(batch, sources):
+            try:
+                if isinstance(source, OSError):
+                    raise source
+                file_path = os.path.join(clone_path, file_info.path)
+                ast_nodes = self._analyze_with_cache(file_path, file_info.language, source)
+                
+                if ast_nodes:
+                    ast_results[file_info.path] = ast_nodes
+                    logger.info(f"Successfully analyzed AST for {file_info.path}")
+                
+            except Exception as e:
+                logger.error(f"Failed to analyze AST for {file_info.path}: {e}")
+                continue
+        
+        return ast_results
+    
+    def _analyze_files_parallel(self, clone_path: str, tasks: List[FileInfo], workers: int) -> Dict[str, List[ASTNode]]:
+        """파일별 분석을 프로세스 풀로 분산 (파일 간 공유 상태가 없으므로 독립 실행 가능)"""
+        ast_results = {}
+        # 작은 파일이 많을 때 IPC 왕복을 줄이도록 여러 파일을 한 번에 전달
+        chunksize = max(1, min(_PARALLEL_CHUNKSIZE, len(tasks) // (workers * 4)))
+        
+        # fork 대신 forkserver/spawn으로 시작 (to_thread 등 다른 스레드가 잡은 잠금을 물려받지 않도록)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=process_pool_context(__name__),
+            initializer=_init_analyzer_worker,
+            initargs=(self.cache is not None, self.max_python_lines, self.python_shallow)
+        ) as executor:
+            worker_tasks = [(os.path.join(clone_path, file_info.path), file_info.language) for file_info in tasks]
+            results = executor.map(_analyze_file_worker, worker_tasks, chunksize=chunksize)
+            
+            # map은 입력 순서대로 결과를 돌려주므로 별도 정렬 불필요
+            for file_info, (ast_nodes, cache_writes, error) in zip(tasks, results):
+                self._cache_writes += cache_writes
+                if error is not None:
+                    logger.error(f"Failed to analyze AST for {file_info.path}: {error}")
+                elif ast_nodes:
+                    ast_results[file_info.path] = ast_nodes
+                    logger.info(f"Successfully analyzed AST for {file_info.path}")
+        
+        return ast_results
+    
+    def _analyze_with_cache(self, file_path: str, language: str,
+                            prefetched: Optional[bytes] = None) -> List[ASTNode]:
+        """파일을 한 번만 읽어 내용 해시로 캐시를 조회하고, 미스인 경우에만 분석 수행"""
+        analyzer = self.supported_languages[language]
+        
+        source_context = nullcontext(prefetched) if prefetched is not None else self._open_source(file_path)
+        with source_context as source:
+            if self.cache is None:
+                return build_ast_nodes(analyzer(source, file_path))
+            
+            # 줄 수 제한/shallow 여부에 따라 결과가 달라지므로 해당 설정도 키에 포함
+            cache_key = DiskCache.make_key(
+                f"{_AST_CACHE_VERSION}\0{language}\0{self.max_python_lines}\0{self.python_shallow}\0".encode('utf-8'),
+                source
+            )
+            cached_nodes = self.cache.get(cache_key)
+            if cached_nodes is not None:
+                return cached_nodes
+            
+            # 분석기가 만든 dict 트리를 복사 없이 ASTNode 트리로 변환
+            ast_nodes = build_ast_nodes(analyzer(source, file_path))
+        
+        self.cache.set(cache_key, ast_nodes)
+        self._cache_writes += 1
+        return ast_nodes
+    
+    @contextmanager
+    def _open_source(self, file_path: str) -> Iterator[SourceBuffer]:
+        """파일 내용을 바이트 버퍼로 제공 (페이지 크기 이상이면 mmap으로 복사 없이 매핑)"""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size < mmap.PAGESIZE:
+                # 작은 파일(빈 파일 포함)은 매핑 비용이 더 크므로 그대로 읽음
+                yield _read_fd(fd, size)
+                return
+            
+            # 큰 파일은 분석기가 앞에서부터 한 번 훑고 버리므로 순차 접근으로 표시
+            _advise_sequential(fd)
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                yield mapped
+        finally:
+            os.close(fd)
+    
+    def _decode_source(self, source: SourceBuffer) -> str:
+        """이미 읽은 버퍼를 문자열로 변환 (잘못된 UTF-8 바이트는 버림)"""
+        return str(source, 'utf-8', 'ignore')
+    
+    def _analyze_python_ast(self, source: SourceBuffer, file_path: str) -> List[RawNode]:
+        """Python 파일의 AST 분석 (바이트를 그대로 파싱하여 인코딩 선언도 파서가 처리)"""
+        try:
+            # ast.parse 비용은 토큰 수에 비례하므로 줄 수가 너무 많은 파일은 건너뜀
+            if len(source) > self.max_python_lines and _count_newlines(source) > self.max_python_lines:
+                logger.info(f"Skipping AST analysis for {file_path}: more than {self.max_python_lines} lines")
+                return []
             
             # Python AST 파싱
-            tree = ast.parse(source_code)
-            return self._convert_python_ast_to_nodes(tree)
+            # compile에 직접 AST 플래그를 넘겨 호출 측 __future__ 플래그 상속 없이 파싱
+            # (파일 경로를 넘겨 SyntaxError 메시지가 실제 파일을 가리키도록 함)
+            try:
+                tree = compile(source, file_path, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+            except SyntaxError as e:
+                if not str(e.msg).startswith('(unicode error)'):
+                    raise
+                # 잘못된 UTF-8 바이트가 섞인 파일은 해당 바이트를 버리고 다시 파싱
+                tree = compile(self._decode_source(source), file_path, 'exec',
+                               flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+            return self._convert_python_ast_to_nodes(tree, shallow=self.python_shallow)
             
         except SyntaxError as e:
             logger.warning(f"Syntax error in Python file {file_path}: {e}")
@@ -61,278 +683,378 @@ class ASTAnalyzer:
             logger.error(f"Error analyzing Python AST for {file_path}: {e}")
             return []
     
-    def _convert_python_ast_to_nodes(self, node: ast.AST, parent_name: str = "") -> List[ASTNode]:
-        """Python AST 노드를 ASTNode 객체로 변환"""
-        nodes = []
-        
-        node_type = type(node).__name__
-        node_name = self._get_python_node_name(node)
-        
-        # 라인 번호 정보
-        line_start = getattr(node, 'lineno', None)
-        line_end = getattr(node, 'end_lineno', None)
+    def _convert_python_ast_to_nodes(self, node: ast.AST, shallow: bool = False) -> List[RawNode]:
+        """Python AST 노드를 ASTNode 객체로 변환 (재귀 없이 명시적 스택으로 순회)
         
-        # 메타데이터 수집
-        metadata = self._get_python_node_metadata(node)
+        의미 있는 노드(_PYTHON_INTERESTING_NODES)만 ASTNode로 만들고, 그 외 문장은
+        중첩된 함수/클래스를 찾기 위해 순회만 한 뒤 가장 가까운 상위 노드에 연결합니다.
+        표현식 하위 트리는 선언을 포함하지 않으므로 내려가지 않습니다.
+        shallow=True면 함수 본문도 건너뛰어 모듈/클래스 수준의 선언만 남깁니다.
+        """
+        root: Optional[RawNode] = None
+        # (원본 노드, 연결될 부모 ASTNode) 쌍을 스택으로 관리
+        stack: List[Tuple[ast.AST, Optional[RawNode]]] = [(node, None)]
         
-        # 현재 노드 생성
-        ast_node = ASTNode(
-            type=node_type,
-            name=node_name,
-            line_start=line_start,
-            line_end=line_end,
-            metadata=metadata
-        )
+        # 반복문 안에서 전역/속성 조회를 피하도록 지역 변수로 바인딩
+        pop = stack.pop
+        extend = stack.extend
+        interesting_nodes = _PYTHON_INTERESTING_NODES
+        skipped_bodies = _PYTHON_FUNCTION_NODES if shallow else frozenset()
+        body_fields = _PYTHON_BODY_FIELDS
+        body_fields_by_type = _PYTHON_BODY_FIELDS_BY_TYPE
+        name_handlers = _PYTHON_NAME_HANDLERS
+        metadata_handlers = self._PYTHON_METADATA_HANDLERS
         
-        # 자식 노드들 처리
-        for child in ast.iter_child_nodes(node):
-            child_nodes = self._convert_python_ast_to_nodes(child, node_name or parent_name)
-            ast_node.children.extend(child_nodes)
+        while stack:
+            current, parent = pop()
+            current_type = type(current)
+            
+            if parent is None or current_type in interesting_nodes:
+                # _get_python_node_name / _get_python_node_metadata와 같은 분기를 메소드 호출 없이 수행
+                name_handler = name_handlers.get(current_type)
+                metadata_handler = metadata_handlers.get(current_type)
+                ast_node = _raw_node(
+                    type=current_type.__name__,
+                    name=name_handler(current) if name_handler is not None else getattr(current, 'name', None),
+                    line_start=getattr(current, 'lineno', None),
+                    line_end=getattr(current, 'end_lineno', None),
+                    metadata=metadata_handler(self, current) if metadata_handler is not None else None
+                )
+                
+                if parent is None:
+                    root = ast_node
+                else:
+                    parent['children'].append(ast_node)
+            else:
+                ast_node = parent
+            
+            if current_type in skipped_bodies:
+                continue
+            
+            # 문장 목록 필드만 따라 내려감 (Expr/Return 등 필드가 없는 문장은 getattr 없이 건너뜀)
+            fields = body_fields_by_type.get(current_type)
+            if fields is None:
+                fields = tuple(field for field in body_fields if field in current_type._fields)
+                body_fields_by_type[current_type] = fields
+            if not fields:
+                continue
+            
+            children = []
+            for field in fields:
+                statements = getattr(current, field, None)
+                if statements:
+                    children.extend(statements)
+            # 스택은 LIFO이므로 역순으로 넣어야 자식 순서가 유지됨
+            extend(zip(reversed(children), repeat(ast_node)))
         
-        nodes.append(ast_node)
-        return nodes
+        return [root]
     
     def _get_python_node_name(self, node: ast.AST) -> Optional[str]:
-        """Python AST 노드에서 이름 추출"""
-        if hasattr(node, 'name'):
-            return node.name
-        elif isinstance(node, ast.FunctionDef):
-            return node.name
-        elif isinstance(node, ast.ClassDef):
-            return node.name
-        elif isinstance(node, ast.Import):
-            return ', '.join(alias.name for alias in node.names)
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ''
-            names = ', '.join(alias.name for alias in node.names)
-            return f"from {module} import {names}"
-        elif isinstance(node, ast.Assign):
-            targets = []
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    targets.append(target.id)
-                elif isinstance(target, ast.Attribute):
-                    targets.append(f"{target.attr}")
-            return ', '.join(targets) if targets else None
-        return None
+        """Python AST 노드에서 이름 추출 (노드 타입별 핸들러 테이블로 분기)"""
+        handler = _PYTHON_NAME_HANDLERS.get(type(node))
+        if handler is not None:
+            return handler(node)
+        return getattr(node, 'name', None)
+    
+    def _get_python_function_metadata(self, node: ast.AST) -> Dict[str, Any]:
+        """함수/비동기 함수 정의 메타데이터"""
+        return {
+            'args': [arg.arg for arg in node.args.args],
+            'decorators': [self._ast_to_string(dec) for dec in node.decorator_list],
+            'returns': self._ast_to_string(node.returns) if node.returns else None,
+            'is_async': type(node) is ast.AsyncFunctionDef
+        }
+    
+    def _get_python_class_metadata(self, node: ast.AST) -> Dict[str, Any]:
+        """클래스 정의 메타데이터"""
+        return {
+            'bases': [self._ast_to_string(base) for base in node.bases],
+            'decorators': [self._ast_to_string(dec) for dec in node.decorator_list],
+            'methods': []
+        }
+    
+    def _get_python_import_metadata(self, node: ast.AST) -> Dict[str, Any]:
+        """import 문 메타데이터"""
+        return {'import_type': 'import' if type(node) is ast.Import else 'from_import'}
+    
+    # isinstance 연쇄 대신 type(node)로 한 번에 조회하는 메타데이터 핸들러 테이블
+    _PYTHON_METADATA_HANDLERS: Dict[Type[ast.AST], Callable[['ASTAnalyzer', Any], Dict[str, Any]]] = {
+        ast.FunctionDef: _get_python_function_metadata,
+        ast.AsyncFunctionDef: _get_python_function_metadata,
+        ast.ClassDef: _get_python_class_metadata,
+        ast.Import: _get_python_import_metadata,
+        ast.ImportFrom: _get_python_import_metadata,
+    }
     
     def _get_python_node_metadata(self, node: ast.AST) -> Dict[str, Any]:
         """Python AST 노드에서 메타데이터 추출"""
-        metadata = {}
-        
-        if isinstance(node, ast.FunctionDef):
-            metadata.update({
-                'args': [arg.arg for arg in node.args.args],
-                'decorators': [self._ast_to_string(dec) for dec in node.decorator_list],
-                'returns': self._ast_to_string(node.returns) if node.returns else None,
-                'is_async': False
-            })
-        elif isinstance(node, ast.AsyncFunctionDef):
-            metadata.update({
-                'args': [arg.arg for arg in node.args.args],
-                'decorators': [self._ast_to_string(dec) for dec in node.decorator_list],
-                'returns': self._ast_to_string(node.returns) if node.returns else None,
-                'is_async': True
-            })
-        elif isinstance(node, ast.ClassDef):
-            metadata.update({
-                'bases': [self._ast_to_string(base) for base in node.bases],
-                'decorators': [self._ast_to_string(dec) for dec in node.decorator_list],
-                'methods': []
-            })
-        elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-            metadata['import_type'] = 'import' if isinstance(node, ast.Import) else 'from_import'
-        
-        return metadata
+        handler = self._PYTHON_METADATA_HANDLERS.get(type(node))
+        if handler is not None:
+            return handler(self, node)
+        return {}
     
     def _ast_to_string(self, node: ast.AST) -> str:
-        """AST 노드를 문자열로 변환"""
+        """AST 노드를 문자열로 변환 (단순 이름/속성/상수/호출/첨자는 ast.unparse 없이 직접 구성)"""
+        node_type = type(node)
+        if node_type is ast.Name:
+            return node.id
+        if node_type is ast.Attribute:
+            return f"{self._ast_to_string(node.value)}.{node.attr}"
+        if node_type is ast.Constant:
+            return '...' if node.value is Ellipsis else repr(node.value)
+        if node_type is ast.Call:
+            return f"{self._ast_to_string(node.func)}(...)"
+        if node_type is ast.Subscript:
+            # 제네릭 타입 표기 (Optional[str], Dict[str, Any] 등). 인덱스의 튜플은 괄호 없이 표기
+            index = node.slice
+            if type(index) is ast.Tuple and len(index.elts) > 1:
+                return f"{self._ast_to_string(node.value)}[{', '.join(map(self._ast_to_string, index.elts))}]"
+            if type(index) is not ast.Tuple:
+                return f"{self._ast_to_string(node.value)}[{self._ast_to_string(index)}]"
         try:
             return ast.unparse(node)
-        except:
+        except Exception:
             return str(node)
     
-    def _analyze_javascript_ast(self, file_path: str) -> List[ASTNode]:
-        """JavaScript 파일의 AST 분석 (개선된 패턴 매칭)"""
+    def _analyze_javascript_ast(self, source: SourceBuffer, file_path: str,
+                                language: str = 'JavaScript') -> List[RawNode]:
+        """JavaScript/TypeScript 파일의 AST 분석 (tree-sitter 우선, 없으면 정규식 스캔)"""
+        parser_key = language
+        if language == 'TypeScript' and file_path.endswith('.tsx'):
+            parser_key = 'TSX'
+        if parser_key not in self._ts_parsers:
+            return self._scan_javascript_ast(source, file_path, language)
+        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            tree = self._ts_parsers[parser_key].parse(source)
+            nodes = self._convert_js_tree(tree.root_node, source, language)
             
-            nodes = []
-            lines = content.split('\n')
+            logger.info(f"{language} AST analysis completed for {file_path}: {len(nodes)} nodes found")
+            return nodes
             
-            for i, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # 함수 선언 감지 (다양한 패턴)
-                if (line.startswith('function ') or 'function(' in line or 
-                    '=>' in line or line.startswith('const ') and '=>' in line or
-                    line.startswith('let ') and '=>' in line or
-                    line.startswith('var ') and '=>' in line):
-                    func_name = self._extract_js_function_name(line)
-                    if func_name:
-                        nodes.append(ASTNode(
-                            type='FunctionDeclaration',
-                            name=func_name,
-                            line_start=i,
+        except Exception as e:
+            logger.error(f"Error analyzing {language} AST for {file_path}: {e}")
+            return []
+    
+    def _convert_js_tree(self, root: Node, source: SourceBuffer, language: str) -> List[RawNode]:
+        """JS/TS tree-sitter 트리에서 선언 노드만 골라 정규식 스캐너와 같은 형태의 ASTNode로 변환"""
+        nodes = []
+        
+        for node in _iter_tree_sitter_nodes(root):
+            node_type = node.type
+            
+            # 함수 선언
+            if node_type in _JS_FUNCTION_DECLARATIONS:
+                name_node = node.child_by_field_name('name')
+                nodes.append(self._make_js_function_node(
+                    node, source, language,
+                    _ts_node_name(source, name_node) if name_node else 'anonymous',
+                    is_arrow_function=False, is_const=False
+                ))
+            
+            # 클래스 선언
+            elif node_type in _JS_CLASS_DECLARATIONS:
+                name_node = node.child_by_field_name('name')
+                nodes.append(_raw_node(
+                    type='ClassDeclaration',
+                    name=_ts_node_name(source, name_node) if name_node else None,
+                    line_start=node.start_point[0] + 1,
+                    line_end=node.end_point[0] + 1,
+                    metadata={
+                        'language': language,
+                        'has_extends': any(child.type == 'class_heritage' for child in node.children),
+                        'raw_line': _ts_first_line(source, node)
+                    }
+                ))
+            
+            # import/export
+            elif node_type in ('import_statement', 'export_statement'):
+                nodes.append(self._make_js_module_node(
+                    node, source, language,
+                    'ImportDeclaration' if node_type == 'import_statement' else 'ExportDeclaration',
+                    is_require=False
+                ))
+            
+            # 변수 선언 (함수 표현식 / 화살표 함수 / require 포함)
+            elif node_type in ('lexical_declaration', 'variable_declaration'):
+                declaration_kind = sys.intern(node.children[0].type)
+                for declarator in node.named_children:
+                    if declarator.type != 'variable_declarator':
+                        continue
+                    name_node = declarator.child_by_field_name('name')
+                    value_node = declarator.child_by_field_name('value')
+                    name = _ts_node_name(source, name_node) if name_node else None
+                    value_type = value_node.type if value_node else None
+                    
+                    if value_type in _JS_FUNCTION_EXPRESSIONS:
+                        nodes.append(self._make_js_function_node(
+                            declarator, source, language, name,
+                            is_arrow_function=value_type == 'arrow_function',
+                            is_const=declaration_kind == 'const'
+                        ))
+                    elif value_type == 'call_expression' and _is_js_require_call(source, value_node):
+                        nodes.append(self._make_js_module_node(
+                            node, source, language, 'RequireDeclaration', is_require=True
+                        ))
+                    else:
+                        nodes.append(_raw_node(
+                            type='VariableDeclaration',
+                            name=name,
+                            line_start=declarator.start_point[0] + 1,
+                            line_end=declarator.end_point[0] + 1,
                             metadata={
-                                'language': 'JavaScript',
-                                'is_arrow_function': '=>' in line,
-                                'is_const': line.startswith('const '),
-                                'raw_line': line
+                                'language': language,
+                                'declaration_type': declaration_kind,
+                                'raw_line': _ts_first_line(source, node)
                             }
                         ))
+            
+            # 속성에 함수 대입 (module.exports.x = function ...)
+            elif node_type == 'assignment_expression':
+                right_node = node.child_by_field_name('right')
+                if right_node is not None and right_node.type in _JS_FUNCTION_EXPRESSIONS:
+                    nodes.append(self._make_js_function_node(
+                        node, source, language,
+                        _ts_node_text(source, node.child_by_field_name('left')),
+                        is_arrow_function=right_node.type == 'arrow_function',
+                        is_const=False
+                    ))
+        
+        return nodes
+    
+    def _make_js_function_node(self, node: Node, source: SourceBuffer, language: str, name: Optional[str],
+                               is_arrow_function: bool, is_const: bool) -> RawNode:
+        return _raw_node(
+            type='FunctionDeclaration',
+            name=name,
+            line_start=node.start_point[0] + 1,
+            line_end=node.end_point[0] + 1,
+            metadata={
+                'language': language,
+                'is_arrow_function': is_arrow_function,
+                'is_const': is_const,
+                'raw_line': _ts_first_line(source, node)
+            }
+        )
+    
+    def _make_js_module_node(self, node: Node, source: SourceBuffer, language: str, node_type: str,
+                             is_require: bool) -> RawNode:
+        line = _ts_first_line(source, node)
+        return _raw_node(
+            type=node_type,
+            name=line,
+            line_start=node.start_point[0] + 1,
+            line_end=node.end_point[0] + 1,
+            metadata={
+                'language': language,
+                'is_require': is_require,
+                'raw_line': line
+            }
+        )
+    
+    def _scan_javascript_ast(self, source: SourceBuffer, file_path: str,
+                             language: str = 'JavaScript') -> List[RawNode]:
+        """JavaScript 파일의 정규식 기반 분석 (사전 컴파일된 정규식으로 파일 전체를 한 번에 스캔)"""
+        try:
+            nodes = []
+            for kind, match, line_no, line in _scan_declarations(_JS_DECLARATION_PATTERNS, source):
+                # 함수 선언 / 함수 표현식 / 화살표 함수
+                if kind in ('function', 'bound_function'):
+                    if kind == 'function':
+                        func_name = _match_text(match, 'function_name') or 'anonymous'
+                    else:
+                        func_name = _match_text(match, 'bound_name')
+                    nodes.append(_raw_node(
+                        type='FunctionDeclaration',
+                        name=func_name,
+                        line_start=line_no,
+                        metadata={
+                            'language': language,
+                            'is_arrow_function': '=>' in line,
+                            'is_const': line.startswith('const '),
+                            'raw_line': line
+                        }
+                    ))
                 
-                # 클래스 선언 감지
-                elif line.startswith('class '):
-                    class_name = line.split()[1].split('(')[0].split('{')[0].split(' extends')[0]
-                    nodes.append(ASTNode(
+                # 클래스 선언
+                elif kind == 'class':
+                    nodes.append(_raw_node(
                         type='ClassDeclaration',
-                        name=class_name,
-                        line_start=i,
+                        name=_match_text(match, 'class_name'),
+                        line_start=line_no,
                         metadata={
-                            'language': 'JavaScript',
+                            'language': language,
                             'has_extends': 'extends' in line,
                             'raw_line': line
                         }
                     ))
                 
-                # import/export 감지 (개선된 패턴)
-                elif (line.startswith('import ') or line.startswith('export ') or
-                      'require(' in line):
+                # import/export/require
+                elif kind in ('module', 'require'):
                     import_type = 'ImportDeclaration'
                     if line.startswith('export'):
                         import_type = 'ExportDeclaration'
-                    elif 'require(' in line:
+                    elif kind == 'require':
                         import_type = 'RequireDeclaration'
                     
-                    nodes.append(ASTNode(
+                    nodes.append(_raw_node(
                         type=import_type,
                         name=line,
-                        line_start=i,
+                        line_start=line_no,
                         metadata={
-                            'language': 'JavaScript',
+                            'language': language,
                             'is_require': 'require(' in line,
                             'raw_line': line
                         }
                     ))
                 
-                # 변수 선언 감지
-                elif (line.startswith('const ') or line.startswith('let ') or 
-                      line.startswith('var ')):
-                    var_name = self._extract_js_variable_name(line)
-                    if var_name:
-                        nodes.append(ASTNode(
-                            type='VariableDeclaration',
-                            name=var_name,
-                            line_start=i,
-                            metadata={
-                                'language': 'JavaScript',
-                                'declaration_type': line.split()[0],
-                                'raw_line': line
-                            }
-                        ))
+                # 변수 선언
+                elif kind == 'variable':
+                    nodes.append(_raw_node(
+                        type='VariableDeclaration',
+                        name=_match_text(match, 'variable_name'),
+                        line_start=line_no,
+                        metadata={
+                            'language': language,
+                            'declaration_type': _match_text(match, 'variable_kind'),
+                            'raw_line': line
+                        }
+                    ))
             
-            logger.info(f"JavaScript AST analysis completed for {file_path}: {len(nodes)} nodes found")
+            logger.info(f"{language} AST analysis completed for {file_path}: {len(nodes)} nodes found")
             return nodes
             
         except Exception as e:
-            logger.error(f"Error analyzing JavaScript AST for {file_path}: {e}")
+            logger.error(f"Error analyzing {language} AST for {file_path}: {e}")
             return []
     
-    def _extract_js_function_name(self, line: str) -> Optional[str]:
-        """JavaScript 함수 이름 추출 (개선된 버전)"""
-        try:
-            # 일반 함수 선언
-            if 'function ' in line:
-                parts = line.split('function ')
-                if len(parts) > 1:
-                    name_part = parts[1].split('(')[0].strip()
-                    return name_part if name_part else 'anonymous'
-            
-            # 화살표 함수 (const/let/var name = () => {})
-            elif '=>' in line and ('const ' in line or 'let ' in line or 'var ' in line):
-                for keyword in ['const ', 'let ', 'var ']:
-                    if line.startswith(keyword):
-                        after_keyword = line[len(keyword):].strip()
-                        name_part = after_keyword.split('=')[0].strip()
-                        return name_part if name_part else 'anonymous'
-            
-            # 메서드 선언 (객체 내부)
-            elif ':' in line and 'function' in line:
-                name_part = line.split(':')[0].strip()
-                return name_part if name_part else 'anonymous'
-            
-            return None
-        except:
-            return None
-    
-    def _extract_js_variable_name(self, line: str) -> Optional[str]:
-        """JavaScript 변수 이름 추출"""
-        try:
-            for keyword in ['const ', 'let ', 'var ']:
-                if line.startswith(keyword):
-                    after_keyword = line[len(keyword):].strip()
-                    # 구조 분해 할당이나 복잡한 패턴 처리
-                    if '=' in after_keyword:
-                        var_part = after_keyword.split('=')[0].strip()
-                        # 배열이나 객체 구조분해 할당 처리
-                        if var_part.startswith('[') or var_part.startswith('{'):
-                            return var_part  # 전체 패턴 반환
-                        else:
-                            return var_part.split(',')[0].strip()  # 첫 번째 변수만
-                    else:
-                        return after_keyword.split(',')[0].strip()
-            return None
-        except:
-            return None
-    
-    def _analyze_typescript_ast(self, file_path: str) -> List[ASTNode]:
-        """TypeScript 파일의 AST 분석 (JavaScript와 유사하게 처리)"""
-        return self._analyze_javascript_ast(file_path)
-    
-    def _analyze_java_ast(self, file_path: str) -> List[ASTNode]:
-        """Java 파일의 AST 분석 (기본 구현)"""
+    def _analyze_java_ast(self, source: SourceBuffer, file_path: str) -> List[RawNode]:
+        """Java 파일의 AST 분석 (tree-sitter 우선, 없으면 정규식 스캔)"""
+        if 'Java' not in self._ts_parsers:
+            return self._scan_java_ast(source, file_path)
+        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            tree = self._ts_parsers['Java'].parse(source)
             
             nodes = []
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # 클래스 선언 감지
-                if line.startswith('public class ') or line.startswith('class '):
-                    class_name = self._extract_java_class_name(line)
-                    if class_name:
-                        nodes.append(ASTNode(
-                            type='ClassDeclaration',
-                            name=class_name,
-                            line_start=i,
-                            metadata={'language': 'Java'}
-                        ))
+            for node in _iter_tree_sitter_nodes(tree.root_node):
+                node_type = _JAVA_DECLARATION_TYPES.get(node.type)
+                if node_type is None:
+                    continue
                 
-                # 메소드 선언 감지
-                elif ('public ' in line or 'private ' in line or 'protected ' in line) and '(' in line and ')' in line:
-                    method_name = self._extract_java_method_name(line)
-                    if method_name:
-                        nodes.append(ASTNode(
-                            type='MethodDeclaration',
-                            name=method_name,
-                            line_start=i,
-                            metadata={'language': 'Java'}
-                        ))
+                if node_type == 'ImportDeclaration':
+                    name = _ts_node_text(source, node).strip()
+                else:
+                    name_node = node.child_by_field_name('name')
+                    name = _ts_node_name(source, name_node) if name_node else None
                 
-                # import 감지
-                elif line.startswith('import '):
-                    nodes.append(ASTNode(
-                        type='ImportDeclaration',
-                        name=line,
-                        line_start=i,
-                        metadata={'language': 'Java'}
-                    ))
+                nodes.append(_raw_node(
+                    type=node_type,
+                    name=name,
+                    line_start=node.start_point[0] + 1,
+                    line_end=node.end_point[0] + 1,
+                    metadata={'language': 'Java'}
+                ))
             
             return nodes
             
@@ -340,30 +1062,30 @@ class ASTAnalyzer:
             logger.error(f"Error analyzing Java AST for {file_path}: {e}")
             return []
     
-    def _extract_java_class_name(self, line: str) -> Optional[str]:
-        """Java 클래스 이름 추출"""
+    def _scan_java_ast(self, source: SourceBuffer, file_path: str) -> List[RawNode]:
+        """Java 파일의 정규식 기반 분석 (사전 컴파일된 정규식으로 파일 전체를 한 번에 스캔)"""
         try:
-            if 'class ' in line:
-                parts = line.split('class ')
-                if len(parts) > 1:
-                    name_part = parts[1].split()[0].split('{')[0].split('extends')[0].split('implements')[0].strip()
-                    return name_part if name_part else None
-            return None
-        except:
-            return None
-    
-    def _extract_java_method_name(self, line: str) -> Optional[str]:
-        """Java 메소드 이름 추출"""
-        try:
-            # 간단한 패턴 매칭으로 메소드 이름 추출
-            if '(' in line and ')' in line:
-                before_paren = line.split('(')[0]
-                parts = before_paren.split()
-                if len(parts) >= 2:
-                    return parts[-1]  # 마지막 부분이 메소드 이름
-            return None
-        except:
-            return None
+            nodes = []
+            for kind, match, line_no, line in _scan_declarations(_JAVA_DECLARATION_PATTERNS, source):
+                if kind == 'class':
+                    node_type, name = 'ClassDeclaration', _match_text(match, 'class_name')
+                elif kind == 'method':
+                    node_type, name = 'MethodDeclaration', _match_text(match, 'method_name')
+                else:
+                    node_type, name = 'ImportDeclaration', line
+                
+                nodes.append(_raw_node(
+                    type=node_type,
+                    name=name,
+                    line_start=line_no,
+                    metadata={'language': 'Java'}
+                ))
+            
+            return nodes
+            
+        except Exception as e:
+            logger.error(f"Error analyzing Java AST for {file_path}: {e}")
+            return []
     
     def get_ast_summary(self, ast_results: Dict[str, List[ASTNode]]) -> Dict[str, Any]:
         """AST 분석 결과 요약"""
@@ -374,75 +1096,110 @@ class ASTAnalyzer:
             'total_nodes': 0
         }
         
-        for file_path, nodes in ast_results.items():
-            for node in nodes:
-                summary['total_nodes'] += 1
-                
-                # 언어별 통계
-                language = node.metadata.get('language', 'Unknown')
-                if language not in summary['languages']:
-                    summary['languages'][language] = 0
-                summary['languages'][language] += 1
-                
-                # 노드 타입별 통계
-                if node.type not in summary['node_types']:
-                    summary['node_types'][node.type] = 0
-                summary['node_types'][node.type] += 1
+        # 최상위 노드만 집계 (자식 노드는 포함하지 않음)
+        # 전체 노드 목록을 만들지 않고 타입/언어 열만 map으로 뽑아 Counter에 넘기므로 집계 루프가 C 수준에서 실행됨
+        nodes_per_file = ast_results.values()
+        summary['total_nodes'] = sum(map(len, nodes_per_file))
+        
+        # 언어별 / 노드 타입별 통계
+        summary['languages'] = dict(Counter(map(
+            dict.get, map(_get_metadata, chain.from_iterable(nodes_per_file)), repeat('language'), repeat('Unknown')
+        )))
+        summary['node_types'] = dict(Counter(map(_get_type, chain.from_iterable(nodes_per_file))))
         
         return summary
     
-    def _analyze_lua_ast(self, file_path: str) -> List[ASTNode]:
-        """Lua 파일의 AST 분석 (기본적인 패턴 매칭 기반)"""
+    @staticmethod
+    def dump(ast_results: Dict[str, List[ASTNode]], indent: bool = False) -> bytes:
+        """AST 분석 결과를 한 번에 JSON 바이트로 직렬화 (orjson 우선, 없으면 표준 json)"""
+        payload = {
+            file_path: [node.to_dict() for node in nodes]
+            for file_path, nodes in ast_results.items()
+        }
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(payload, default=_json_default, option=option)
+        return json.dumps(payload, default=_json_default, indent=2 if indent else None).encode('utf-8')
+
+    @staticmethod
+    def to_columns(ast_results: Dict[str, List[ASTNode]]) -> Dict[str, List[Any]]:
+        """AST 분석 결과를 열 단위(파일 경로/타입/이름/시작·끝 줄/언어)의 평탄한 목록으로 변환
+
+        자식 노드까지 전위 순회 순서로 모두 포함하며, 같은 인덱스가 같은 노드를 가리킵니다.
+        DataFrame/Arrow 테이블 생성이나 열 단위 집계에 그대로 넘길 수 있습니다.
+        """
+        columns: Dict[str, List[Any]] = {
+            'file_path': [], 'type': [], 'name': [], 'line_start': [], 'line_end': [], 'language': []
+        }
+        file_paths = columns['file_path']
+        types = columns['type']
+        names = columns['name']
+        line_starts = columns['line_start']
+        line_ends = columns['line_end']
+        languages = columns['language']
+
+        for file_path, nodes in ast_results.items():
+            # 원래 순서대로 꺼내도록 역순으로 스택에 쌓음
+            stack = list(reversed(nodes))
+            while stack:
+                node = stack.pop()
+                file_paths.append(file_path)
+                types.append(node.type)
+                names.append(node.name)
+                line_starts.append(node.line_start)
+                line_ends.append(node.line_end)
+                languages.append(node.metadata.get('language', 'Unknown'))
+                if node.children:
+                    stack.extend(reversed(node.children))
+
+        return columns
+
+    def _analyze_lua_ast(self, source: SourceBuffer, file_path: str) -> List[RawNode]:
+        """Lua 파일의 AST 분석 (tree-sitter 우선, 없으면 정규식 스캔)"""
+        if 'Lua' not in self._ts_parsers:
+            return self._scan_lua_ast(source, file_path)
+        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                source_code = f.read()
+            tree = self._ts_parsers['Lua'].parse(source)
             
             nodes = []
-            lines = source_code.split('\n')
-            
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line or line.startswith('--'):  # 빈 줄이나 주석 제외
-                    continue
+            for node in _iter_tree_sitter_nodes(tree.root_node):
+                node_type = node.type
                 
-                # 함수 정의 감지
-                if line.startswith('function ') or ' function ' in line:
-                    func_name = self._extract_lua_function_name(line)
-                    if func_name:
-                        node = ASTNode(
-                            type='function',
-                            name=func_name,
-                            line_start=line_num,
-                            line_end=line_num,
-                            metadata={'language': 'Lua', 'raw_line': line}
-                        )
-                        nodes.append(node)
+                # 함수 정의 (function name / local function name)
+                if node_type == 'function_declaration':
+                    name_node = node.child_by_field_name('name')
+                    nodes.append(self._make_lua_function_node(
+                        _ts_node_name(source, name_node) if name_node else None,
+                        node.start_point[0] + 1, node.end_point[0] + 1, _ts_first_line(source, node)
+                    ))
                 
-                # Love2D 콜백 함수 감지
-                elif any(callback in line for callback in ['love.load', 'love.update', 'love.draw', 'love.keypressed']):
-                    callback_name = self._extract_love2d_callback(line)
-                    if callback_name:
-                        node = ASTNode(
-                            type='love2d_callback',
-                            name=callback_name,
-                            line_start=line_num,
-                            line_end=line_num,
-                            metadata={'language': 'Lua', 'framework': 'Love2D', 'raw_line': line}
-                        )
-                        nodes.append(node)
+                # 값 없는 지역 변수 선언 (local x)
+                elif node_type == 'variable_declaration':
+                    declared = node.named_children[0] if node.named_child_count else None
+                    if declared is not None and declared.type == 'variable_list':
+                        nodes.append(self._make_lua_variable_node(
+                            _ts_node_name(source, declared),
+                            node.start_point[0] + 1, node.end_point[0] + 1, _ts_first_line(source, node)
+                        ))
                 
-                # 변수 할당 감지
-                elif '=' in line and not line.startswith('if') and not line.startswith('while'):
-                    var_name = self._extract_lua_variable_name(line)
-                    if var_name:
-                        node = ASTNode(
-                            type='variable',
-                            name=var_name,
-                            line_start=line_num,
-                            line_end=line_num,
-                            metadata={'language': 'Lua', 'raw_line': line}
-                        )
-                        nodes.append(node)
+                # 변수 할당 / 함수 대입 (name = function ...), local 선언 안의 할당은 선언 줄 기준
+                elif node_type == 'assignment_statement':
+                    parent = node.parent
+                    statement = parent if parent is not None and parent.type == 'variable_declaration' else node
+                    targets = node.named_children[0]
+                    values = node.named_children[1] if node.named_child_count > 1 else None
+                    name = _ts_node_name(source, targets)
+                    
+                    is_function = values is not None and values.named_child_count > 0 and \
+                        values.named_children[0].type == 'function_definition'
+                    make_node = self._make_lua_function_node if is_function else self._make_lua_variable_node
+                    nodes.append(make_node(
+                        name, statement.start_point[0] + 1, statement.end_point[0] + 1,
+                        _ts_first_line(source, statement)
+                    ))
             
             logger.info(f"Extracted {len(nodes)} AST nodes from Lua file: {file_path}")
             return nodes
@@ -451,52 +1208,60 @@ class ASTAnalyzer:
             logger.error(f"Failed to analyze Lua AST for {file_path}: {e}")
             return []
     
-    def _extract_lua_function_name(self, line: str) -> Optional[str]:
-        """Lua 함수 이름 추출"""
-        try:
-            # function name(...) 패턴
-            if line.startswith('function '):
-                parts = line.split('(')[0].split()
-                if len(parts) >= 2:
-                    return parts[1]
-            # local function name(...) 패턴
-            elif 'local function ' in line:
-                parts = line.split('local function ')[1].split('(')[0].strip()
-                return parts
-            # name = function(...) 패턴
-            elif ' = function' in line:
-                parts = line.split(' = function')[0].strip()
-                return parts.split()[-1]
-            return None
-        except:
-            return None
+    def _make_lua_function_node(self, name: Optional[str], line_start: int, line_end: int,
+                                raw_line: str) -> RawNode:
+        """Lua 함수 노드 생성 (love.load 등 Love2D 콜백은 별도 타입으로 구분)"""
+        if name in _LOVE2D_CALLBACKS:
+            return _raw_node(
+                type='love2d_callback',
+                name=name,
+                line_start=line_start,
+                line_end=line_end,
+                metadata={'language': 'Lua', 'framework': 'Love2D', 'raw_line': raw_line}
+            )
+        return _raw_node(
+            type='function',
+            name=name,
+            line_start=line_start,
+            line_end=line_end,
+            metadata={'language': 'Lua', 'raw_line': raw_line}
+        )
     
-    def _extract_love2d_callback(self, line: str) -> Optional[str]:
-        """Love2D 콜백 함수 이름 추출"""
-        try:
-            love2d_callbacks = ['love.load', 'love.update', 'love.draw', 'love.keypressed', 
-                               'love.keyreleased', 'love.mousepressed', 'love.mousereleased']
-            for callback in love2d_callbacks:
-                if callback in line:
-                    return callback
-            return None
-        except:
-            return None
+    def _make_lua_variable_node(self, name: Optional[str], line_start: int, line_end: int,
+                                raw_line: str) -> RawNode:
+        """Lua 변수 노드 생성"""
+        return _raw_node(
+            type='variable',
+            name=name,
+            line_start=line_start,
+            line_end=line_end,
+            metadata={'language': 'Lua', 'raw_line': raw_line}
+        )
     
-    def _extract_lua_variable_name(self, line: str) -> Optional[str]:
-        """Lua 변수 이름 추출"""
+    def _scan_lua_ast(self, source: SourceBuffer, file_path: str) -> List[RawNode]:
+        """Lua 파일의 정규식 기반 분석 (사전 컴파일된 정규식으로 파일 전체를 한 번에 스캔)"""
         try:
-            if '=' in line:
-                var_part = line.split('=')[0].strip()
-                # local 키워드 제거
-                if var_part.startswith('local '):
-                    var_part = var_part[6:].strip()
-                # 첫 번째 단어만 반환 (복합 할당 제외)
-                return var_part.split()[0] if var_part else None
-            return None
-        except:
-            return None
-
+            nodes = []
+            for kind, match, line_num, line in _scan_declarations(_LUA_DECLARATION_PATTERNS, source):
+                # 변수 할당 감지
+                if kind == 'variable':
+                    nodes.append(self._make_lua_variable_node(
+                        _match_text(match, 'variable_name'), line_num, line_num, line
+                    ))
+                
+                # 함수 정의 (function name / local function name / name = function) / Love2D 콜백
+                else:
+                    nodes.append(self._make_lua_function_node(
+                        _match_text(match, _LUA_NAME_GROUPS[kind]), line_num, line_num, line
+                    ))
+            
+            logger.info(f"Extracted {len(nodes)} AST nodes from Lua file: {file_path}")
+            return nodes
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze Lua AST for {file_path}: {e}")
+            return []
+    
     async def perform_analysis(self, analysis_id: str, request, analysis_results: dict):
         """AST 분석 수행 - Enhanced Analyzer 우선 사용, 실패 시 기본 Analyzer로 fallback"""
         try:
@@ -555,7 +1320,7 @@ class ASTAnalyzer:
                         if not ast_results:
                             logger.info(f"Using basic AST analyzer as fallback for: {repo.repository.url}")
                             try:
-                                ast_results = basic_ast_analyzer.analyze_files(repo.clone_path, repo.files)
+                                ast_results = await basic_ast_analyzer.analyze_files_async(repo.clone_path, repo.files)
                                 logger.info(f"Basic AST analysis completed: {len(ast_results)} files analyzed")
                             except Exception as e:
                                 logger.error(f"Basic AST analysis also failed for {repo.repository.url}: {e}")
@@ -563,7 +1328,7 @@ class ASTAnalyzer:
                         
                         # AST 분석 결과를 저장소에 저장
                         repo.ast_analysis = ast_results
-                        logger.info(f"AST analysis data for {repo.repository.url}: {json.dumps(repo.ast_analysis, default=lambda o: o.__dict__, indent=2)}")
+                        logger.info(f"AST analysis data for {repo.repository.url}: {self.dump(repo.ast_analysis, indent=True).decode('utf-8')}")
                         
                         # Enhanced 분석 결과가 있으면 추가 정보도 저장
                         if enhanced_results:
@@ -2,7 +2,7 @@
 
 from .tree_sitter_analyzer import TreeSitterAnalyzer
 from .static_analyzer import StaticAnalyzer, StaticAnalysisResult
-from .dependency_analyzer import DependencyAnalyzer, DependencyAnalysisResult
+from .dependency_analyzer import DependencyAnalyzer, DependencyAnalysisResult, VulnRecord
 from .enhanced_analyzer import EnhancedAnalyzer
 
 __all__ = [
@@ -11,5 +11,6 @@ __all__ = [
     'StaticAnalysisResult',
     'DependencyAnalyzer', 
     'DependencyAnalysisResult',
+    'VulnRecord',
     'EnhancedAnalyzer'
 ]
\ No newline at end of file
@@ -1,18 +1,160 @@
 """Dependency analysis tools integration for package and security analysis"""
 
 import os
+import re
+import sys
 import json
+import mmap
+import shutil
 import subprocess
+import time
 import tempfile
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
 
+from config.settings import settings
 from models.schemas import FileInfo
+from utils.disk_cache import DiskCache
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 파싱
+    orjson = None
+
+# 도구 JSON 출력 파서 (둘 다 bytes를 직접 받으며, orjson의 예외는 json.JSONDecodeError 하위 클래스)
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 logger = logging.getLogger(__name__)
 
+# 사용 가능 여부를 확인할 의존성 분석 도구
+_DEPENDENCY_TOOLS = ('pipdeptree', 'pip-audit')
+
+# pip-audit 결과 디스크 캐시 (requirements 내용 + pip-audit 버전 -> (결과, 저장 시각))
+# 취약점 DB는 계속 갱신되므로 저장 후 TTL이 지난 결과는 다시 조회
+_PIP_AUDIT_TTL = 3600
+_PIP_AUDIT_CACHE_VERSION = (sys.version_info[:2], 1)
+
+# 의존성 분석 대상 파일명
+_DEPENDENCY_PATTERNS = frozenset({
+    'requirements.txt',
+    'requirements-dev.txt',
+    'requirements-test.txt',
+    'setup.py',
+    'setup.cfg',
+    'pyproject.toml',
+    'Pipfile',
+    'poetry.lock',
+    'package.json',
+    'package-lock.json',
+    'yarn.lock',
+    'pom.xml',
+    'build.gradle',
+    'Cargo.toml'
+})
+
+# requirements에서 분석하지 않는 줄 (주석, `-r`/`--index-url` 등 옵션, 빈 줄)
+_REQ_SKIP_RE = re.compile(rb'^\s*(?:#|-|$)')
+
+# requirements 한 줄을 (패키지[extras], 비교 연산자, 나머지)로 한 번에 분리
+_REQ_RE = re.compile(r'^\s*([A-Za-z0-9_.\-\[\],]+)\s*(==|>=|<=|~=|!=|>|<)?\s*(.*)$')
+
+
+# 프로젝트 내 가상환경 후보 디렉터리
+_VENV_DIR_NAMES = ('.venv', 'venv', 'env')
+
+
+@lru_cache(maxsize=128)
+def _find_project_python(project_path: str) -> Optional[str]:
+    """프로젝트 전용 파이썬 인터프리터 경로 탐색 (없으면 None, 프로젝트별로 한 번만 탐색)
+    
+    프로젝트 내부 가상환경(.venv/venv/env)을 우선 확인하고, pyproject.toml이
+    poetry 프로젝트이면 `poetry env info -p`로 poetry 가상환경을 찾습니다.
+    """
+    bin_dir, exe_name = ('Scripts', 'python.exe') if os.name == 'nt' else ('bin', 'python')
+    for venv_name in _VENV_DIR_NAMES:
+        candidate = os.path.join(project_path, venv_name, bin_dir, exe_name)
+        if os.path.isfile(candidate):
+            return candidate
+    
+    pyproject_path = os.path.join(project_path, 'pyproject.toml')
+    if not os.path.isfile(pyproject_path) or not shutil.which('poetry'):
+        return None
+    try:
+        with open(pyproject_path, 'r', encoding='utf-8', errors='ignore') as f:
+            if '[tool.poetry' not in f.read():
+                return None
+        result = subprocess.run(['poetry', 'env', 'info', '-p'], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=30, cwd=project_path)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    env_path = result.stdout.strip()
+    if result.returncode != 0 or not env_path:
+        return None
+    candidate = os.path.join(env_path, bin_dir, exe_name)
+    return candidate if os.path.isfile(candidate) else None
+
+
+@lru_cache(maxsize=1)
+def _available_tools() -> Dict[str, bool]:
+    """사용 가능한 의존성 분석 도구들을 확인 (프로세스당 한 번만 수행)
+    
+    `--version` 실행(파이썬 인터프리터 기동) 없이 PATH 탐색만으로 판단합니다.
+    """
+    available_tools = {}
+    for tool_name in _DEPENDENCY_TOOLS:
+        if shutil.which(tool_name) is not None:
+            available_tools[tool_name] = True
+            logger.info(f"Dependency analysis tool '{tool_name}' is available")
+        else:
+            available_tools[tool_name] = False
+            logger.warning(f"Dependency analysis tool '{tool_name}' is not available")
+    return available_tools
+
+
+@lru_cache(maxsize=1)
+def _pip_audit_version() -> str:
+    """pip-audit 버전 문자열 (캐시 키용, 프로세스당 한 번만 확인)"""
+    try:
+        result = subprocess.run(['pip-audit', '--version'], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=30)
+        return result.stdout.strip() or 'unknown'
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+
+@dataclass(slots=True)
+class VulnRecord:
+    """pip-audit 취약점 한 건 (파싱 시 한 번만 정규화, severity는 소문자)"""
+    package: Optional[str]
+    version: Optional[str]
+    id: Optional[str]
+    severity: str
+    description: Optional[str]
+    fix_versions: List[str]
+    
+    @classmethod
+    def from_raw(cls, vuln: Dict[str, Any], package: Optional[str] = None,
+                 version: Optional[str] = None) -> 'VulnRecord':
+        """pip-audit 원본 취약점 dict에서 레코드 생성"""
+        return cls(
+            package=vuln.get('package', package),
+            version=vuln.get('version', version),
+            id=vuln.get('id'),
+            severity=(vuln.get('severity') or 'unknown').lower(),
+            description=vuln.get('description'),
+            fix_versions=vuln.get('fix_versions') or []
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict 변환"""
+        return asdict(self)
+
 
 @dataclass
 class DependencyAnalysisResult:
@@ -20,56 +162,33 @@ class DependencyAnalysisResult:
     tool: str
     project_path: str
     dependencies: List[Dict[str, Any]]
-    vulnerabilities: List[Dict[str, Any]]
+    vulnerabilities: List[VulnRecord]
     summary: Dict[str, Any]
 
 
 class DependencyAnalyzer:
     """의존성 분석 도구들을 통합한 분석기"""
     
-    def __init__(self):
-        self.available_tools = {}
-        self._check_available_tools()
-    
-    def _check_available_tools(self):
-        """사용 가능한 의존성 분석 도구들을 확인"""
-        tools_to_check = {
-            'pipdeptree': self._check_pipdeptree,
-            'pip-audit': self._check_pip_audit
-        }
-        
-        for tool_name, check_func in tools_to_check.items():
-            try:
-                if check_func():
-                    self.available_tools[tool_name] = True
-                    logger.info(f"Dependency analysis tool '{tool_name}' is available")
-                else:
-                    self.available_tools[tool_name] = False
-                    logger.warning(f"Dependency analysis tool '{tool_name}' is not available")
-            except Exception as e:
-                self.available_tools[tool_name] = False
-                logger.error(f"Error checking tool '{tool_name}': {e}")
-    
-    def _check_pipdeptree(self) -> bool:
-        """pipdeptree 도구 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(['pipdeptree', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
-    
-    def _check_pip_audit(self) -> bool:
-        """pip-audit 도구 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(['pip-audit', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
+    def __init__(self, use_cache: Optional[bool] = None):
+        self.available_tools = dict(_available_tools())
+        # 프로세스가 다시 떠도 같은 requirements 파일은 TTL 동안 pip-audit 재실행 생략
+        if use_cache is None:
+            use_cache = settings.ENABLE_AST_CACHE
+        self.pip_audit_cache = DiskCache(
+            settings.PIP_AUDIT_CACHE_DIR, settings.PIP_AUDIT_CACHE_MAX_ENTRIES,
+            version=_PIP_AUDIT_CACHE_VERSION, max_age_seconds=_PIP_AUDIT_TTL
+        ) if use_cache else None
     
     def analyze_project(self, clone_path: str, files: List[FileInfo]) -> List[DependencyAnalysisResult]:
         """프로젝트의 의존성 분석 수행"""
+        return self.analyze_project_with_status(clone_path, files)[0]
+    
+    def analyze_project_with_status(self, clone_path: str, files: List[FileInfo]
+                                    ) -> Tuple[List[DependencyAnalysisResult], bool]:
+        """프로젝트의 의존성 분석 수행 (결과, 실행한 도구의 전체 성공 여부 반환)
+        
+        실패한 도구의 결과는 목록에서 빠지므로, 호출 측은 성공 여부를 보고 결과 캐시 여부를 정합니다.
+        """
         results = []
         
         # requirements.txt, setup.py, pyproject.toml 등 의존성 파일 찾기
@@ -77,82 +196,110 @@ class DependencyAnalyzer:
         
         if not dependency_files:
             logger.info("No dependency files found for analysis")
-            return results
+            return results, True
         
-        # pipdeptree 분석
+        # 사용 가능한 도구 실행 목록 (pipdeptree → pip-audit 순서로 결과를 담음)
+        runners = []
         if self.available_tools.get('pipdeptree'):
-            pipdeptree_result = self._run_pipdeptree(clone_path, dependency_files)
-            if pipdeptree_result:
-                results.append(pipdeptree_result)
-        
-        # pip-audit 분석
+            runners.append(self._run_pipdeptree)
         if self.available_tools.get('pip-audit'):
-            pip_audit_result = self._run_pip_audit(clone_path, dependency_files)
-            if pip_audit_result:
-                results.append(pip_audit_result)
+            runners.append(self._run_pip_audit)
+        
+        if not runners:
+            return results, True
+        
+        # 두 도구는 서로 독립적인 서브프로세스이므로 동시에 실행해 전체 시간을 더 오래 걸리는 쪽으로 줄임
+        completed = True
+        with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+            futures = [executor.submit(runner, clone_path, dependency_files) for runner in runners]
+            for future in futures:
+                tool_result = future.result()
+                if tool_result is not None:
+                    results.append(tool_result)
+                else:
+                    completed = False
         
-        return results
+        return results, completed
     
-    def _find_dependency_files(self, clone_path: str, files: List[FileInfo]) -> List[str]:
-        """의존성 파일들을 찾기"""
-        dependency_files = []
-        dependency_patterns = [
-            'requirements.txt',
-            'requirements-dev.txt',
-            'requirements-test.txt',
-            'setup.py',
-            'setup.cfg',
-            'pyproject.toml',
-            'Pipfile',
-            'poetry.lock',
-            'package.json',
-            'package-lock.json',
-            'yarn.lock',
-            'pom.xml',
-            'build.gradle',
-            'Cargo.toml'
+    @staticmethod
+    def _load_json_file(path: str) -> Optional[Any]:
+        """JSON 파일을 mmap으로 매핑해 파싱 (빈 파일이면 None)"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if orjson is not None:
+                    # orjson은 버퍼 프로토콜 객체를 복사 없이 바로 파싱
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+                return json.loads(mapped[:])
+    
+    @staticmethod
+    def _flatten_pip_audit_vulns(dependencies: List[Dict[str, Any]]) -> List[VulnRecord]:
+        """pip-audit의 패키지별 `vulns` 목록을 평면 VulnRecord 목록으로 변환
+        
+        pip-audit JSON은 취약점을 `dependencies[].vulns` 아래에 두므로, 패키지명/버전을
+        각 취약점 레코드에 붙여 한 번에 정규화합니다.
+        """
+        return [
+            VulnRecord.from_raw(vuln, dep.get('name'), dep.get('version'))
+            for dep in dependencies
+            for vuln in dep.get('vulns') or ()
         ]
+    
+    def _find_dependency_files(self, clone_path: str, files: List[FileInfo]) -> List[str]:
+        """의존성 파일들을 찾기
         
+        파일마다 stat을 호출하는 대신, 후보 파일이 있는 디렉터리만 os.scandir로 한 번씩
+        읽어 DirEntry의 캐시된 정보로 실제 파일 존재 여부를 확인합니다.
+        """
+        # 후보 파일 경로 (FileInfo 순서 유지)와 확인할 상위 디렉터리 집합
+        candidates = []
         for file_info in files:
             file_name = os.path.basename(file_info.path)
-            if file_name in dependency_patterns:
-                full_path = os.path.join(clone_path, file_info.path)
-                if os.path.exists(full_path):
-                    dependency_files.append(full_path)
+            if file_name in _DEPENDENCY_PATTERNS:
+                candidates.append(os.path.join(clone_path, file_info.path))
+        
+        existing = set()
+        for directory in dict.fromkeys(map(os.path.dirname, candidates)):
+            try:
+                with os.scandir(directory) as entries:
+                    existing.update(
+                        entry.path for entry in entries
+                        if entry.name in _DEPENDENCY_PATTERNS and entry.is_file()
+                    )
+            except OSError:
+                continue
         
-        return dependency_files
+        return [path for path in candidates if path in existing]
     
     def _run_pipdeptree(self, project_path: str, dependency_files: List[str]) -> Optional[DependencyAnalysisResult]:
         """pipdeptree를 사용한 의존성 트리 분석"""
         try:
-            # JSON 형식으로 의존성 트리 출력
+            # 트리 출력 하나만 받아 플랫 목록은 파이썬에서 직접 계산 (pipdeptree 재실행 비용 제거)
+            # 출력은 디코딩 없이 bytes 그대로 JSON 파서에 전달
             cmd = ['pipdeptree', '--json-tree']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, cwd=project_path)
+            # 프로젝트 가상환경이 있으면 PATH의 환경 대신 해당 인터프리터의 패키지를 분석
+            project_python = _find_project_python(project_path)
+            if project_python:
+                cmd += ['--python', project_python]
+            result = subprocess.run(cmd, capture_output=True, timeout=60, cwd=project_path)
             
             dependencies = []
             if result.stdout:
                 try:
-                    data = json.loads(result.stdout)
+                    data = _json_loads(result.stdout)
                     dependencies = data
                 except json.JSONDecodeError:
                     logger.error("Failed to parse pipdeptree JSON output")
                     return None
             
-            # 플랫 형식으로도 분석
-            flat_cmd = ['pipdeptree', '--json']
-            flat_result = subprocess.run(flat_cmd, capture_output=True, text=True, timeout=60, cwd=project_path)
-            
-            flat_dependencies = []
-            if flat_result.stdout:
-                try:
-                    flat_data = json.loads(flat_result.stdout)
-                    flat_dependencies = flat_data
-                except json.JSONDecodeError:
-                    pass
+            # 트리를 평탄화해 `pipdeptree --json`과 같은 형식의 플랫 목록 생성
+            flat_dependencies = self._flatten_dependency_tree(dependencies)
             
             # 요약 정보 생성
             total_packages = len(flat_dependencies)
-            top_level_packages = len([dep for dep in dependencies if dep.get('package', {}).get('package_name')])
+            top_level_packages = len([dep for dep in dependencies if dep.get('package_name')])
             
             return DependencyAnalysisResult(
                 tool='pipdeptree',
@@ -174,40 +321,107 @@ class DependencyAnalyzer:
             logger.error(f"Error running pipdeptree on {project_path}: {e}")
             return None
     
+    @staticmethod
+    def _flatten_dependency_tree(tree: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """`pipdeptree --json-tree` 출력을 `--json` 형식의 플랫 목록으로 변환
+        
+        공유되는 하위 의존성은 패키지 키 기준으로 한 번만 포함하며,
+        재귀 대신 명시적 스택을 사용해 깊은 트리에서도 안전하게 순회합니다.
+        """
+        flat: Dict[str, Dict[str, Any]] = {}
+        stack = list(reversed(tree))
+        while stack:
+            node = stack.pop()
+            key = node.get('key') or node.get('package_name')
+            if not key or key in flat:
+                continue
+            children = node.get('dependencies') or []
+            flat[key] = {
+                'package': {
+                    'key': key,
+                    'package_name': node.get('package_name'),
+                    'installed_version': node.get('installed_version'),
+                },
+                'dependencies': [
+                    {
+                        'key': child.get('key') or child.get('package_name'),
+                        'package_name': child.get('package_name'),
+                        'installed_version': child.get('installed_version'),
+                        'required_version': child.get('required_version'),
+                    }
+                    for child in children
+                ],
+            }
+            stack.extend(reversed(children))
+        return list(flat.values())
+    
     def _run_pip_audit(self, project_path: str, dependency_files: List[str]) -> Optional[DependencyAnalysisResult]:
         """pip-audit를 사용한 보안 취약점 분석"""
         try:
             # requirements.txt 파일이 있는 경우 해당 파일 기준으로 분석
             requirements_files = [f for f in dependency_files if 'requirements' in os.path.basename(f)]
             
+            cache_key = None
             if requirements_files:
                 # requirements.txt 기준 분석
                 cmd = ['pip-audit', '--format=json', '--requirement', requirements_files[0]]
+                
+                # 같은 내용의 requirements 파일은 TTL 동안 캐시된 결과 재사용 (취약점 DB 조회 생략)
+                if self.pip_audit_cache is not None:
+                    with open(requirements_files[0], 'rb') as f:
+                        cache_key = DiskCache.make_key(f"{_pip_audit_version()}\0".encode('utf-8'), f.read())
+                    cached = self.pip_audit_cache.get(cache_key)
+                    if cached and time.time() - cached[1] < _PIP_AUDIT_TTL:
+                        logger.info(f"Using cached pip-audit result for {requirements_files[0]}")
+                        return replace(
+                            cached[0],
+                            project_path=project_path,
+                            summary={**cached[0].summary, 'dependency_files': dependency_files}
+                        )
             else:
                 # 현재 환경 기준 분석
                 cmd = ['pip-audit', '--format=json']
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120, cwd=project_path)
+            # 프로젝트 가상환경이 있으면 pip-audit이 해당 인터프리터의 pip로 환경을 조회하도록 지정
+            env = None
+            project_python = _find_project_python(project_path)
+            if project_python:
+                env = {**os.environ, 'PIPAPI_PYTHON_LOCATION': project_python}
             
-            vulnerabilities = []
-            dependencies = []
-            
-            if result.stdout:
+            # 파이프 대신 임시 파일로 JSON을 받아 mmap으로 읽음 (파이프 드레인/디코딩 생략)
+            with tempfile.NamedTemporaryFile(suffix='.json') as output_file:
+                result = subprocess.run(
+                    cmd + ['--output', output_file.name],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=120, cwd=project_path, env=env
+                )
                 try:
-                    data = json.loads(result.stdout)
-                    vulnerabilities = data.get('vulnerabilities', [])
-                    dependencies = data.get('dependencies', [])
+                    data = self._load_json_file(output_file.name)
                 except json.JSONDecodeError:
                     logger.error("Failed to parse pip-audit JSON output")
                     return None
             
-            # 심각도별 분류
-            critical_count = len([v for v in vulnerabilities if v.get('severity') == 'critical'])
-            high_count = len([v for v in vulnerabilities if v.get('severity') == 'high'])
-            medium_count = len([v for v in vulnerabilities if v.get('severity') == 'medium'])
-            low_count = len([v for v in vulnerabilities if v.get('severity') == 'low'])
+            # 취약점이 있어도 종료 코드가 1이므로 종료 코드 대신 리포트 생성 여부로 실패를 판단
+            # (실패한 실행을 취약점 0건 결과로 만들어 캐시에 남기지 않도록 함)
+            if data is None:
+                logger.error(f"pip-audit produced no report for {project_path} (exit code {result.returncode})")
+                return None
             
-            return DependencyAnalysisResult(
+            dependencies = data.get('dependencies', [])
+            raw_vulnerabilities = data.get('vulnerabilities')
+            if raw_vulnerabilities:
+                vulnerabilities = [VulnRecord.from_raw(vuln) for vuln in raw_vulnerabilities]
+            else:
+                vulnerabilities = self._flatten_pip_audit_vulns(dependencies)
+            
+            # 심각도별 분류 (한 번의 순회로 집계)
+            severity_counts = Counter(v.severity for v in vulnerabilities)
+            critical_count = severity_counts['critical']
+            high_count = severity_counts['high']
+            medium_count = severity_counts['medium']
+            low_count = severity_counts['low']
+            
+            audit_result = DependencyAnalysisResult(
                 tool='pip-audit',
                 project_path=project_path,
                 dependencies=dependencies,
@@ -222,6 +436,10 @@ class DependencyAnalyzer:
                     'dependency_files': dependency_files
                 }
             )
+            if cache_key:
+                self.pip_audit_cache.set(cache_key, (audit_result, time.time()))
+                self.pip_audit_cache.prune()
+            return audit_result
             
         except subprocess.TimeoutExpired:
             logger.error(f"pip-audit analysis timed out for {project_path}")
@@ -233,30 +451,29 @@ class DependencyAnalyzer:
     def analyze_requirements_file(self, requirements_file: str) -> Optional[Dict[str, Any]]:
         """requirements.txt 파일 직접 분석"""
         try:
-            with open(requirements_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
             dependencies = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#') and not line.startswith('-'):
-                    # 패키지명과 버전 분리
-                    if '==' in line:
-                        package, version = line.split('==', 1)
-                    elif '>=' in line:
-                        package, version = line.split('>=', 1)
-                    elif '<=' in line:
-                        package, version = line.split('<=', 1)
-                    elif '>' in line:
-                        package, version = line.split('>', 1)
-                    elif '<' in line:
-                        package, version = line.split('<', 1)
+            # 파일 전체를 리스트로 읽지 않고 한 줄씩 순회해 큰 파일에서도 메모리 사용을 일정하게 유지
+            # 바이트 단위로 읽고 주석/옵션/빈 줄은 정규식 한 번으로 건너뛴 뒤 남은 줄만 디코딩
+            with open(requirements_file, 'rb', buffering=1 << 16) as f:
+                for raw_line in f:
+                    if _REQ_SKIP_RE.match(raw_line):
+                        continue
+                    line = raw_line.decode('utf-8').strip()
+                    
+                    # 패키지명, 비교 연산자, 버전 분리 (환경 마커 `; python_version<...`는 버전에서 제외)
+                    match = _REQ_RE.match(line)
+                    if match and match.group(2):
+                        package = match.group(1)
+                        operator = match.group(2)
+                        version = match.group(3).split(';', 1)[0]
                     else:
-                        package = line
+                        package = line.split(';', 1)[0]
+                        operator = None
                         version = None
                     
                     dependencies.append({
                         'package': package.strip(),
+                        'operator': operator,
                         'version': version.strip() if version else None,
                         'raw_line': line
                     })
@@ -287,11 +504,13 @@ class DependencyAnalyzer:
             },
             'dependency_files_found': []
         }
+        # 발견 순서를 유지하는 중복 제거용 집합 (dict 키)
+        dependency_files_found = {}
         
         for result in results:
             if result.tool == 'pipdeptree':
                 summary['total_dependencies'] += result.summary.get('total_packages', 0)
-                summary['dependency_files_found'].extend(result.summary.get('dependency_files', []))
+                dependency_files_found.update(dict.fromkeys(result.summary.get('dependency_files', [])))
             
             elif result.tool == 'pip-audit':
                 summary['total_vulnerabilities'] += len(result.vulnerabilities)
@@ -299,10 +518,9 @@ class DependencyAnalyzer:
                 summary['vulnerability_breakdown']['high'] += result.summary.get('high_vulnerabilities', 0)
                 summary['vulnerability_breakdown']['medium'] += result.summary.get('medium_vulnerabilities', 0)
                 summary['vulnerability_breakdown']['low'] += result.summary.get('low_vulnerabilities', 0)
-                summary['dependency_files_found'].extend(result.summary.get('dependency_files', []))
+                dependency_files_found.update(dict.fromkeys(result.summary.get('dependency_files', [])))
         
-        # 중복 제거
-        summary['dependency_files_found'] = list(set(summary['dependency_files_found']))
+        summary['dependency_files_found'] = list(dependency_files_found)
         
         return summary
     
@@ -318,34 +536,30 @@ class DependencyAnalyzer:
             'recommendations': []
         }
         
+        # 심각도 -> 대상 이슈 목록 테이블 (알 수 없는 심각도는 이슈를 만들지 않고 건너뜀)
+        buckets = {
+            'critical': security_report['critical_issues'],
+            'high': security_report['high_issues'],
+            'medium': security_report['medium_issues'],
+            'low': security_report['low_issues'],
+        }
+        
         for result in results:
             if result.tool == 'pip-audit':
                 for vuln in result.vulnerabilities:
-                    severity = vuln.get('severity', 'unknown').lower()
+                    bucket = buckets.get(vuln.severity)
+                    if bucket is None:
+                        continue
                     
-                    issue = {
-                        'package': vuln.get('package'),
-                        'version': vuln.get('version'),
-                        'vulnerability_id': vuln.get('id'),
-                        'description': vuln.get('description'),
-                        'fix_versions': vuln.get('fix_versions', [])
-                    }
-                    
-                    if severity == 'critical':
-                        security_report['critical_issues'].append(issue)
-                    elif severity == 'high':
-                        security_report['high_issues'].append(issue)
-                    elif severity == 'medium':
-                        security_report['medium_issues'].append(issue)
-                    elif severity == 'low':
-                        security_report['low_issues'].append(issue)
+                    bucket.append({
+                        'package': vuln.package,
+                        'version': vuln.version,
+                        'vulnerability_id': vuln.id,
+                        'description': vuln.description,
+                        'fix_versions': vuln.fix_versions
+                    })
         
-        security_report['total_vulnerabilities'] = (
-            len(security_report['critical_issues']) +
-            len(security_report['high_issues']) +
-            len(security_report['medium_issues']) +
-            len(security_report['low_issues'])
-        )
+        security_report['total_vulnerabilities'] = sum(len(issues) for issues in buckets.values())
         
         # 권장사항 생성
         if security_report['critical_issues']:
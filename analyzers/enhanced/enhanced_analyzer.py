@@ -2,41 +2,190 @@
 
 import os
 import json
+import hashlib
+import itertools
 import logging
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from datetime import datetime
 
-from models.schemas import FileInfo
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+from models.schemas import ASTNode, FileInfo
 from .tree_sitter_analyzer import TreeSitterAnalyzer
 from .static_analyzer import StaticAnalyzer, StaticAnalysisResult
 from .dependency_analyzer import DependencyAnalyzer, DependencyAnalysisResult
 
 logger = logging.getLogger(__name__)
 
+# 같은 클론을 반복 분석하지 않도록 (경로, 커밋/파일 지문, 파일 목록, 분석 옵션) → 분석 결과 LRU
+# (반환된 결과의 하위 객체는 호출자 사이에 공유되므로 수정하지 않아야 함)
+_REPO_ANALYSIS_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_REPO_ANALYSIS_CACHE_SIZE = 64
+_REPO_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# 하위 분석기 가용성 비트 (EnhancedAnalyzer.capability_mask)
+CAP_TREE_SITTER = 1
+CAP_STATIC_ANALYSIS = 2
+CAP_DEPENDENCY_ANALYSIS = 4
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON 기본 타입이 아닌 값 처리 (ASTNode/데이터클래스는 dict, 집합은 리스트, 그 외는 속성 dict)"""
+    if isinstance(obj, ASTNode):
+        return obj.to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return getattr(obj, '__dict__', str(obj))
+
+
+def _repository_fingerprint(clone_path: str, files: List[FileInfo]) -> str:
+    """클론 상태 지문: git HEAD 커밋, git 저장소가 아니면 파일별 (경로, mtime, 크기) 해시"""
+    try:
+        result = subprocess.run(['git', '-C', clone_path, 'rev-parse', 'HEAD'], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=10)
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(file_info.path for file_info in files):
+        try:
+            stat = os.stat(os.path.join(clone_path, path))
+            digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode('utf-8'))
+        except OSError:
+            digest.update(f"{path}\0missing\0".encode('utf-8'))
+    return 'files:' + digest.hexdigest()
+
 
 class EnhancedAnalyzer:
     """통합 분석기 - Tree-sitter, 정적 분석, 의존성 분석을 모두 수행"""
     
+    # 분석 이름별 로그 표시명
+    _ANALYSIS_LABELS = {
+        'tree_sitter': 'Tree-sitter',
+        'static_analysis': 'Static',
+        'dependency_analysis': 'Dependency'
+    }
+    
+    # (분석 이름, 결과 키, 파일 단위 커버리지 여부)
+    _COVERAGE_SPEC = (
+        ('tree_sitter', 'tree_sitter_results', True),
+        ('static_analysis', 'static_analysis_results', True),
+        ('dependency_analysis', 'dependency_analysis_results', False),
+    )
+    
+    # 인스턴스 __dict__ 없이 지연 생성 값만 보관 (요청마다 생성되는 분석기의 메모리 절감)
+    __slots__ = (
+        '_tree_sitter_analyzer', '_static_analyzer', '_dependency_analyzer',
+        '_capabilities', '_capability_mask', '_capabilities_status'
+    )
+    
     def __init__(self):
-        self.tree_sitter_analyzer = TreeSitterAnalyzer()
-        self.static_analyzer = StaticAnalyzer()
-        self.dependency_analyzer = DependencyAnalyzer()
-        
-        # 분석기 가용성 확인
-        self.capabilities = {
-            'tree_sitter': self.tree_sitter_analyzer.is_available(),
-            'static_analysis': any(self.static_analyzer.available_tools.values()),
-            'dependency_analysis': any(self.dependency_analyzer.available_tools.values())
-        }
-        
-        logger.info(f"Enhanced analyzer initialized with capabilities: {self.capabilities}")
+        # 하위 분석기는 처음 사용할 때 생성 (문법 라이브러리 로드/도구 탐색 비용을 실제 사용 시점으로 미룸)
+        self._tree_sitter_analyzer: Optional[TreeSitterAnalyzer] = None
+        self._static_analyzer: Optional[StaticAnalyzer] = None
+        self._dependency_analyzer: Optional[DependencyAnalyzer] = None
+        self._capabilities: Optional[Dict[str, bool]] = None
+        self._capability_mask: Optional[int] = None
+        self._capabilities_status: Optional[Dict[str, Any]] = None
+    
+    @property
+    def tree_sitter_analyzer(self) -> TreeSitterAnalyzer:
+        if self._tree_sitter_analyzer is None:
+            self._tree_sitter_analyzer = TreeSitterAnalyzer()
+        return self._tree_sitter_analyzer
+    
+    @property
+    def static_analyzer(self) -> StaticAnalyzer:
+        if self._static_analyzer is None:
+            self._static_analyzer = StaticAnalyzer()
+        return self._static_analyzer
+    
+    @property
+    def dependency_analyzer(self) -> DependencyAnalyzer:
+        if self._dependency_analyzer is None:
+            self._dependency_analyzer = DependencyAnalyzer()
+        return self._dependency_analyzer
+    
+    @property
+    def capabilities(self) -> Dict[str, bool]:
+        """분석기 가용성 (처음 조회할 때 세 하위 분석기를 생성해 확인)"""
+        if self._capabilities is None:
+            self._capabilities = {
+                'tree_sitter': self.tree_sitter_analyzer.is_available(),
+                'static_analysis': any(self.static_analyzer.available_tools.values()),
+                'dependency_analysis': any(self.dependency_analyzer.available_tools.values())
+            }
+            
+            logger.info(f"Enhanced analyzer initialized with capabilities: {self._capabilities}")
+        return self._capabilities
+    
+    @property
+    def capability_mask(self) -> int:
+        """capabilities의 비트마스크 표현 (CAP_* 비트 조합)"""
+        if self._capability_mask is None:
+            capabilities = self.capabilities
+            self._capability_mask = (
+                (CAP_TREE_SITTER if capabilities['tree_sitter'] else 0)
+                | (CAP_STATIC_ANALYSIS if capabilities['static_analysis'] else 0)
+                | (CAP_DEPENDENCY_ANALYSIS if capabilities['dependency_analysis'] else 0)
+            )
+        return self._capability_mask
     
     def analyze_repository(self, clone_path: str, files: List[FileInfo], 
                           include_tree_sitter: bool = True,
                           include_static_analysis: bool = True,
                           include_dependency_analysis: bool = True) -> Dict[str, Any]:
-        """레포지토리 전체 분석 수행"""
+        """레포지토리 전체 분석 수행
+        
+        같은 클론(커밋)·파일 목록·옵션으로 다시 요청되면 이전 결과를 재사용하고 시각만 갱신합니다.
+        """
+        file_digest = hashlib.blake2b(
+            "\0".join(file_info.path for file_info in files).encode('utf-8'), digest_size=16
+        ).hexdigest()
+        cache_key = (
+            os.path.abspath(clone_path), _repository_fingerprint(clone_path, files), file_digest,
+            include_tree_sitter, include_static_analysis, include_dependency_analysis
+        )
+        with _REPO_ANALYSIS_CACHE_LOCK:
+            cached = _REPO_ANALYSIS_CACHE.get(cache_key)
+            if cached is not None:
+                _REPO_ANALYSIS_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached enhanced analysis for {clone_path}")
+            timestamp = datetime.now().isoformat()
+            summary = {**cached['summary'], 'overall': {**cached['summary']['overall'], 'analysis_timestamp': timestamp}}
+            return {**cached, 'timestamp': timestamp, 'summary': summary}
+        
+        analysis_results, completed = self._analyze_repository(
+            clone_path, files, include_tree_sitter, include_static_analysis, include_dependency_analysis
+        )
+        
+        # 실행한 분석이 모두 성공한 경우에만 저장 (일시적 실패가 캐시에 남지 않도록)
+        if completed:
+            with _REPO_ANALYSIS_CACHE_LOCK:
+                _REPO_ANALYSIS_CACHE[cache_key] = analysis_results
+                _REPO_ANALYSIS_CACHE.move_to_end(cache_key)
+                while len(_REPO_ANALYSIS_CACHE) > _REPO_ANALYSIS_CACHE_SIZE:
+                    _REPO_ANALYSIS_CACHE.popitem(last=False)
+        return analysis_results
+    
+    def _analyze_repository(self, clone_path: str, files: List[FileInfo], include_tree_sitter: bool,
+                            include_static_analysis: bool, include_dependency_analysis: bool
+                            ) -> Tuple[Dict[str, Any], bool]:
+        """분석 실행 (결과, 실행한 분석의 전체 성공 여부 반환)"""
         
         analysis_results = {
             'timestamp': datetime.now().isoformat(),
@@ -49,113 +198,142 @@ class EnhancedAnalyzer:
             'summary': {}
         }
         
-        # Tree-sitter AST 분석
-        if include_tree_sitter and self.capabilities['tree_sitter']:
-            try:
-                logger.info("Starting tree-sitter AST analysis...")
-                tree_sitter_results = self.tree_sitter_analyzer.analyze_files(clone_path, files)
-                analysis_results['tree_sitter_results'] = tree_sitter_results
-                analysis_results['capabilities_used']['tree_sitter'] = True
-                
-                # Tree-sitter 요약 생성
-                if tree_sitter_results:
-                    tree_sitter_summary = self.tree_sitter_analyzer.get_ast_summary(tree_sitter_results)
-                    analysis_results['summary']['tree_sitter'] = tree_sitter_summary
-                    logger.info(f"Tree-sitter analysis completed: {tree_sitter_summary.get('total_nodes', 0)} nodes analyzed")
-                
-            except Exception as e:
-                logger.error(f"Tree-sitter analysis failed: {e}")
-                analysis_results['capabilities_used']['tree_sitter'] = False
-        else:
-            analysis_results['capabilities_used']['tree_sitter'] = False
-            if include_tree_sitter:
-                logger.warning("Tree-sitter analysis requested but not available")
+        # (분석 이름, 가용성 비트, 요청 여부, 실행 메서드, 결과 키) - 요약/결과 병합 순서도 이 순서를 따름
+        analysis_specs = [
+            ('tree_sitter', CAP_TREE_SITTER, include_tree_sitter, self._run_tree_sitter, 'tree_sitter_results'),
+            ('static_analysis', CAP_STATIC_ANALYSIS, include_static_analysis, self._run_static, 'static_analysis_results'),
+            ('dependency_analysis', CAP_DEPENDENCY_ANALYSIS, include_dependency_analysis, self._run_dependency,
+             'dependency_analysis_results'),
+        ]
         
-        # 정적 분석
-        if include_static_analysis and self.capabilities['static_analysis']:
-            try:
-                logger.info("Starting static analysis...")
-                static_results = self.static_analyzer.analyze_files(clone_path, files)
-                analysis_results['static_analysis_results'] = self._serialize_static_results(static_results)
-                analysis_results['capabilities_used']['static_analysis'] = True
-                
-                # 정적 분석 요약 생성
-                if static_results:
-                    static_summary = self.static_analyzer.get_analysis_summary(static_results)
-                    analysis_results['summary']['static_analysis'] = static_summary
-                    logger.info(f"Static analysis completed: {static_summary.get('total_issues', 0)} issues found")
-                
-            except Exception as e:
-                logger.error(f"Static analysis failed: {e}")
-                analysis_results['capabilities_used']['static_analysis'] = False
-        else:
-            analysis_results['capabilities_used']['static_analysis'] = False
-            if include_static_analysis:
-                logger.warning("Static analysis requested but not available")
+        capability_mask = self.capability_mask
+        tasks = []
+        for name, capability_bit, include, runner, results_key in analysis_specs:
+            analysis_results['capabilities_used'][name] = False
+            if include and capability_mask & capability_bit:
+                tasks.append((name, runner, results_key))
+            elif include:
+                logger.warning(f"{self._ANALYSIS_LABELS[name]} analysis requested but not available")
         
-        # 의존성 분석
-        if include_dependency_analysis and self.capabilities['dependency_analysis']:
-            try:
-                logger.info("Starting dependency analysis...")
-                dependency_results = self.dependency_analyzer.analyze_project(clone_path, files)
-                analysis_results['dependency_analysis_results'] = self._serialize_dependency_results(dependency_results)
-                analysis_results['capabilities_used']['dependency_analysis'] = True
-                
-                # 의존성 분석 요약 생성
-                if dependency_results:
-                    dependency_summary = self.dependency_analyzer.get_analysis_summary(dependency_results)
-                    analysis_results['summary']['dependency_analysis'] = dependency_summary
-                    
-                    # 보안 리포트 생성
-                    security_report = self.dependency_analyzer.generate_security_report(dependency_results)
-                    analysis_results['summary']['security_report'] = security_report
-                    
-                    logger.info(f"Dependency analysis completed: {dependency_summary.get('total_dependencies', 0)} dependencies, {dependency_summary.get('total_vulnerabilities', 0)} vulnerabilities")
-                
-            except Exception as e:
-                logger.error(f"Dependency analysis failed: {e}")
-                analysis_results['capabilities_used']['dependency_analysis'] = False
-        else:
-            analysis_results['capabilities_used']['dependency_analysis'] = False
-            if include_dependency_analysis:
-                logger.warning("Dependency analysis requested but not available")
+        # 세 분석은 서로 독립적이고 대부분 서브프로세스/파일 I/O 대기이므로 동시에 실행하고,
+        # 공유 dict 병합은 메인 스레드에서 수행해 별도 잠금이 필요 없도록 함
+        completed = True
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    (name, results_key, executor.submit(runner, clone_path, files))
+                    for name, runner, results_key in tasks
+                ]
+                for name, results_key, future in futures:
+                    results, summary, used, complete = future.result()
+                    analysis_results['capabilities_used'][name] = used
+                    completed = completed and complete
+                    if used:
+                        analysis_results[results_key] = results
+                        analysis_results['summary'].update(summary)
         
         # 전체 요약 생성
         analysis_results['summary']['overall'] = self._generate_overall_summary(analysis_results)
         
-        return analysis_results
+        return analysis_results, completed
     
-    def _serialize_static_results(self, results: Dict[str, List[StaticAnalysisResult]]) -> Dict[str, Any]:
-        """정적 분석 결과를 직렬화 가능한 형태로 변환"""
-        serialized = {}
-        
-        for file_path, file_results in results.items():
-            serialized[file_path] = []
-            for result in file_results:
-                serialized[file_path].append({
-                    'tool': result.tool,
-                    'file_path': result.file_path,
-                    'issues': result.issues,
-                    'metrics': result.metrics,
-                    'summary': result.summary
-                })
+    def _run_tree_sitter(self, clone_path: str, files: List[FileInfo]
+                         ) -> Tuple[Dict[str, Any], Dict[str, Any], bool, bool]:
+        """Tree-sitter AST 분석 실행 (결과, 요약, 성공 여부, 전체 성공 여부 반환)"""
+        try:
+            logger.info("Starting tree-sitter AST analysis...")
+            tree_sitter_results = self.tree_sitter_analyzer.analyze_files_parallel(clone_path, files)
+            
+            # Tree-sitter 요약 생성
+            summary = {}
+            if tree_sitter_results:
+                tree_sitter_summary = self.tree_sitter_analyzer.get_ast_summary(tree_sitter_results)
+                summary['tree_sitter'] = tree_sitter_summary
+                logger.info(f"Tree-sitter analysis completed: {tree_sitter_summary.get('total_nodes', 0)} nodes analyzed")
+            
+            return tree_sitter_results, summary, True, True
+        except Exception as e:
+            logger.error(f"Tree-sitter analysis failed: {e}")
+            return {}, {}, False, False
+    
+    def _run_static(self, clone_path: str, files: List[FileInfo]
+                    ) -> Tuple[Dict[str, Any], Dict[str, Any], bool, bool]:
+        """정적 분석 실행 (직렬화된 결과, 요약, 성공 여부, 전체 성공 여부 반환)"""
+        try:
+            logger.info("Starting static analysis...")
+            static_results = self.static_analyzer.analyze_files(clone_path, files)
+            serialized = self._serialize_static_results(static_results)
+            
+            # 정적 분석 요약 생성
+            summary = {}
+            if static_results:
+                static_summary = self.static_analyzer.get_analysis_summary(static_results)
+                summary['static_analysis'] = static_summary
+                logger.info(f"Static analysis completed: {static_summary.get('total_issues', 0)} issues found")
+            
+            return serialized, summary, True, True
+        except Exception as e:
+            logger.error(f"Static analysis failed: {e}")
+            return {}, {}, False, False
+    
+    def _run_dependency(self, clone_path: str, files: List[FileInfo]
+                        ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], bool, bool]:
+        """의존성 분석 실행 (직렬화된 결과, 요약, 성공 여부, 전체 성공 여부 반환)
         
-        return serialized
+        일부 도구(예: pip-audit)가 실패하면 나머지 결과는 그대로 쓰되 전체 성공으로 보지 않아,
+        취약점이 빠진 결과가 레포지토리 분석 캐시에 남지 않도록 합니다.
+        """
+        try:
+            logger.info("Starting dependency analysis...")
+            dependency_results, complete = self.dependency_analyzer.analyze_project_with_status(clone_path, files)
+            serialized = self._serialize_dependency_results(dependency_results)
+            
+            # 의존성 분석 요약 생성
+            summary = {}
+            if dependency_results:
+                dependency_summary = self.dependency_analyzer.get_analysis_summary(dependency_results)
+                summary['dependency_analysis'] = dependency_summary
+                
+                # 보안 리포트 생성
+                summary['security_report'] = self.dependency_analyzer.generate_security_report(dependency_results)
+                
+                logger.info(f"Dependency analysis completed: {dependency_summary.get('total_dependencies', 0)} dependencies, {dependency_summary.get('total_vulnerabilities', 0)} vulnerabilities")
+            
+            return serialized, summary, True, complete
+        except Exception as e:
+            logger.error(f"Dependency analysis failed: {e}")
+            return [], {}, False, False
     
-    def _serialize_dependency_results(self, results: List[DependencyAnalysisResult]) -> List[Dict[str, Any]]:
-        """의존성 분석 결과를 직렬화 가능한 형태로 변환"""
-        serialized = []
+    @staticmethod
+    def dump(analysis_results: Dict[str, Any], indent: bool = False) -> bytes:
+        """analyze_repository 결과를 한 번에 JSON 바이트로 직렬화 (orjson 우선, 없으면 표준 json)
         
-        for result in results:
-            serialized.append({
-                'tool': result.tool,
-                'project_path': result.project_path,
-                'dependencies': result.dependencies,
-                'vulnerabilities': result.vulnerabilities,
-                'summary': result.summary
-            })
+        orjson은 데이터클래스를 직접 직렬화하므로 _serialize_* 변환 없이 원본 결과 객체도 넘길 수 있습니다.
+        """
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(analysis_results, default=_json_default, option=option)
+        return json.dumps(analysis_results, default=_json_default, ensure_ascii=False,
+                          indent=2 if indent else None).encode('utf-8')
+    
+    def _serialize_static_results(self, results: Dict[str, List[StaticAnalysisResult]]) -> Dict[str, Any]:
+        """정적 분석 결과를 직렬화 가능한 형태로 변환
         
-        return serialized
+        StaticAnalysisResult 필드(tool, file_path, issues, metrics, summary)를 그대로 담은 얕은 사본을 만듭니다.
+        """
+        return {
+            file_path: [dict(vars(result)) for result in file_results]
+            for file_path, file_results in results.items()
+        }
+    
+    def _serialize_dependency_results(self, results: List[DependencyAnalysisResult]) -> List[Dict[str, Any]]:
+        """의존성 분석 결과를 직렬화 가능한 형태로 변환 (취약점만 dict로 바꾸고 필드 순서는 유지)"""
+        return [
+            {**vars(result), 'vulnerabilities': [vuln.to_dict() for vuln in result.vulnerabilities]}
+            for result in results
+        ]
     
     def _generate_overall_summary(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """전체 분석 결과 요약 생성"""
@@ -166,28 +344,22 @@ class EnhancedAnalyzer:
             'analysis_coverage': {}
         }
         
-        # Tree-sitter 분석 커버리지
-        if analysis_results['capabilities_used'].get('tree_sitter'):
-            tree_sitter_files = len(analysis_results['tree_sitter_results'])
-            overall_summary['analysis_coverage']['tree_sitter'] = {
-                'files_analyzed': tree_sitter_files,
-                'coverage_percentage': (tree_sitter_files / analysis_results['total_files']) * 100 if analysis_results['total_files'] > 0 else 0
-            }
-        
-        # 정적 분석 커버리지
-        if analysis_results['capabilities_used'].get('static_analysis'):
-            static_files = len(analysis_results['static_analysis_results'])
-            overall_summary['analysis_coverage']['static_analysis'] = {
-                'files_analyzed': static_files,
-                'coverage_percentage': (static_files / analysis_results['total_files']) * 100 if analysis_results['total_files'] > 0 else 0
-            }
-        
-        # 의존성 분석 결과
-        if analysis_results['capabilities_used'].get('dependency_analysis'):
-            dependency_count = len(analysis_results['dependency_analysis_results'])
-            overall_summary['analysis_coverage']['dependency_analysis'] = {
-                'analyses_performed': dependency_count
-            }
+        # 분석별 커버리지 (파일 단위 분석은 분석 파일 수와 비율, 의존성 분석은 수행 횟수)
+        # 파일이 0개면 분석된 파일 수도 0이므로 1로 나눠도 0이 되어 별도 분기가 필요 없음
+        total_files = analysis_results['total_files'] or 1
+        for name, results_key, per_file in self._COVERAGE_SPEC:
+            if not analysis_results['capabilities_used'].get(name):
+                continue
+            count = len(analysis_results[results_key])
+            if per_file:
+                overall_summary['analysis_coverage'][name] = {
+                    'files_analyzed': count,
+                    'coverage_percentage': (count * 100) / total_files
+                }
+            else:
+                overall_summary['analysis_coverage'][name] = {
+                    'analyses_performed': count
+                }
         
         # 주요 지표 집계
         overall_summary['key_metrics'] = {}
@@ -220,140 +392,146 @@ class EnhancedAnalyzer:
     
     def generate_comprehensive_report(self, analysis_results: Dict[str, Any]) -> str:
         """종합 분석 리포트를 마크다운 형식으로 생성"""
-        
-        report_lines = []
-        report_lines.append("# 🔍 Enhanced Code Analysis Report")
-        report_lines.append("")
-        report_lines.append(f"**Analysis Date:** {analysis_results['timestamp']}")
-        report_lines.append(f"**Repository Path:** {analysis_results['clone_path']}")
-        report_lines.append("")
+        return "\n".join(self._iter_report_lines(analysis_results))
+    
+    def _iter_report_lines(self, analysis_results: Dict[str, Any]) -> Iterator[str]:
+        """종합 분석 리포트의 마크다운 줄을 순서대로 생성"""
+        yield "# 🔍 Enhanced Code Analysis Report"
+        yield ""
+        yield f"**Analysis Date:** {analysis_results['timestamp']}"
+        yield f"**Repository Path:** {analysis_results['clone_path']}"
+        yield ""
         
         # 전체 요약
         overall = analysis_results['summary'].get('overall', {})
-        report_lines.append("## 📊 Overall Summary")
-        report_lines.append("")
-        report_lines.append(f"- **Total Files:** {overall.get('total_files_analyzed', 0)}")
+        yield "## 📊 Overall Summary"
+        yield ""
+        yield f"- **Total Files:** {overall.get('total_files_analyzed', 0)}"
         
         # 사용된 분석 도구
         capabilities = overall.get('capabilities_used', {})
-        enabled_tools = [tool for tool, enabled in capabilities.items() if enabled]
-        report_lines.append(f"- **Analysis Tools Used:** {', '.join(enabled_tools)}")
-        report_lines.append("")
+        yield f"- **Analysis Tools Used:** {', '.join(tool for tool, enabled in capabilities.items() if enabled)}"
+        yield ""
         
         # 주요 지표
         metrics = overall.get('key_metrics', {})
         if metrics:
-            report_lines.append("### 🎯 Key Metrics")
-            report_lines.append("")
+            yield "### 🎯 Key Metrics"
+            yield ""
             
             if 'total_ast_nodes' in metrics:
-                report_lines.append(f"- **AST Nodes Analyzed:** {metrics['total_ast_nodes']}")
+                yield f"- **AST Nodes Analyzed:** {metrics['total_ast_nodes']}"
             
             if 'total_code_issues' in metrics:
-                report_lines.append(f"- **Code Issues Found:** {metrics['total_code_issues']}")
+                yield f"- **Code Issues Found:** {metrics['total_code_issues']}"
             
             if 'total_dependencies' in metrics:
-                report_lines.append(f"- **Dependencies:** {metrics['total_dependencies']}")
+                yield f"- **Dependencies:** {metrics['total_dependencies']}"
             
             if 'total_vulnerabilities' in metrics:
-                report_lines.append(f"- **Security Vulnerabilities:** {metrics['total_vulnerabilities']}")
+                yield f"- **Security Vulnerabilities:** {metrics['total_vulnerabilities']}"
                 
                 if 'critical_vulnerabilities' in metrics:
-                    report_lines.append(f"  - Critical: {metrics['critical_vulnerabilities']}")
+                    yield f"  - Critical: {metrics['critical_vulnerabilities']}"
                 if 'high_vulnerabilities' in metrics:
-                    report_lines.append(f"  - High: {metrics['high_vulnerabilities']}")
+                    yield f"  - High: {metrics['high_vulnerabilities']}"
             
-            report_lines.append("")
+            yield ""
         
         # Tree-sitter 분석 결과
         if 'tree_sitter' in analysis_results['summary']:
             ts_summary = analysis_results['summary']['tree_sitter']
-            report_lines.append("## 🌳 AST Analysis (Tree-sitter)")
-            report_lines.append("")
-            report_lines.append(f"- **Files Analyzed:** {ts_summary.get('total_files', 0)}")
-            report_lines.append(f"- **Total Nodes:** {ts_summary.get('total_nodes', 0)}")
+            yield "## 🌳 AST Analysis (Tree-sitter)"
+            yield ""
+            yield f"- **Files Analyzed:** {ts_summary.get('total_files', 0)}"
+            yield f"- **Total Nodes:** {ts_summary.get('total_nodes', 0)}"
             
             languages = ts_summary.get('languages', {})
             if languages:
-                report_lines.append("- **Languages:**")
+                yield "- **Languages:**"
                 for lang, count in languages.items():
-                    report_lines.append(f"  - {lang}: {count} nodes")
+                    yield f"  - {lang}: {count} nodes"
             
-            report_lines.append("")
+            yield ""
         
         # 정적 분석 결과
         if 'static_analysis' in analysis_results['summary']:
             static_summary = analysis_results['summary']['static_analysis']
-            report_lines.append("## 🔍 Static Analysis")
-            report_lines.append("")
-            report_lines.append(f"- **Files Analyzed:** {static_summary.get('total_files_analyzed', 0)}")
-            report_lines.append(f"- **Total Issues:** {static_summary.get('total_issues', 0)}")
+            yield "## 🔍 Static Analysis"
+            yield ""
+            yield f"- **Files Analyzed:** {static_summary.get('total_files_analyzed', 0)}"
+            yield f"- **Total Issues:** {static_summary.get('total_issues', 0)}"
             
             tools_used = static_summary.get('tools_used', [])
             if tools_used:
-                report_lines.append(f"- **Tools Used:** {', '.join(tools_used)}")
+                yield f"- **Tools Used:** {', '.join(tools_used)}"
             
             severity = static_summary.get('severity_breakdown', {})
             if severity:
-                report_lines.append("- **Issue Breakdown:**")
+                yield "- **Issue Breakdown:**"
                 for level, count in severity.items():
                     if count > 0:
-                        report_lines.append(f"  - {level.title()}: {count}")
+                        yield f"  - {level.title()}: {count}"
             
-            report_lines.append("")
+            yield ""
         
         # 의존성 분석 결과
         if 'dependency_analysis' in analysis_results['summary']:
             dep_summary = analysis_results['summary']['dependency_analysis']
-            report_lines.append("## 📦 Dependency Analysis")
-            report_lines.append("")
-            report_lines.append(f"- **Total Dependencies:** {dep_summary.get('total_dependencies', 0)}")
-            report_lines.append(f"- **Vulnerabilities Found:** {dep_summary.get('total_vulnerabilities', 0)}")
+            yield "## 📦 Dependency Analysis"
+            yield ""
+            yield f"- **Total Dependencies:** {dep_summary.get('total_dependencies', 0)}"
+            yield f"- **Vulnerabilities Found:** {dep_summary.get('total_vulnerabilities', 0)}"
             
             vuln_breakdown = dep_summary.get('vulnerability_breakdown', {})
             if any(vuln_breakdown.values()):
-                report_lines.append("- **Vulnerability Breakdown:**")
+                yield "- **Vulnerability Breakdown:**"
                 for level, count in vuln_breakdown.items():
                     if count > 0:
-                        report_lines.append(f"  - {level.title()}: {count}")
+                        yield f"  - {level.title()}: {count}"
             
-            report_lines.append("")
+            yield ""
         
         # 보안 리포트
         if 'security_report' in analysis_results['summary']:
             security = analysis_results['summary']['security_report']
-            report_lines.append("## 🛡️ Security Report")
-            report_lines.append("")
+            yield "## 🛡️ Security Report"
+            yield ""
             
-            critical_issues = security.get('critical_issues', [])
+            critical_issues = security.get('critical_issues', ())
             if critical_issues:
-                report_lines.append("### ⚠️ Critical Issues")
-                for issue in critical_issues[:5]:  # 상위 5개만 표시
-                    report_lines.append(f"- **{issue.get('package')}** ({issue.get('version')}): {issue.get('vulnerability_id')}")
-                report_lines.append("")
+                yield "### ⚠️ Critical Issues"
+                for issue in itertools.islice(critical_issues, 5):  # 상위 5개만 표시
+                    yield f"- **{issue.get('package')}** ({issue.get('version')}): {issue.get('vulnerability_id')}"
+                yield ""
             
             recommendations = security.get('recommendations', [])
             if recommendations:
-                report_lines.append("### 💡 Recommendations")
+                yield "### 💡 Recommendations"
                 for rec in recommendations:
-                    report_lines.append(f"- {rec}")
-                report_lines.append("")
-        
-        return "\n".join(report_lines)
+                    yield f"- {rec}"
+                yield ""
     
     def get_capabilities_status(self) -> Dict[str, Any]:
         """분석기 기능 상태 반환"""
-        return {
-            'tree_sitter': {
-                'available': self.capabilities['tree_sitter'],
-                'supported_languages': list(self.tree_sitter_analyzer.languages.keys()) if self.capabilities['tree_sitter'] else []
-            },
-            'static_analysis': {
-                'available': self.capabilities['static_analysis'],
-                'available_tools': self.static_analyzer.available_tools
-            },
-            'dependency_analysis': {
-                'available': self.capabilities['dependency_analysis'],
-                'available_tools': self.dependency_analyzer.available_tools
+        return self.capabilities_status
+    
+    @property
+    def capabilities_status(self) -> Dict[str, Any]:
+        """분석기 기능 상태 (초기화 이후 바뀌지 않으므로 처음 한 번만 생성)"""
+        if self._capabilities_status is None:
+            self._capabilities_status = {
+                'tree_sitter': {
+                    'available': self.capabilities['tree_sitter'],
+                    'supported_languages': list(self.tree_sitter_analyzer.languages.keys()) if self.capabilities['tree_sitter'] else []
+                },
+                'static_analysis': {
+                    'available': self.capabilities['static_analysis'],
+                    'available_tools': self.static_analyzer.available_tools
+                },
+                'dependency_analysis': {
+                    'available': self.capabilities['dependency_analysis'],
+                    'available_tools': self.dependency_analyzer.available_tools
+                }
             }
-        }
\ No newline at end of file
+        return self._capabilities_status
\ No newline at end of file
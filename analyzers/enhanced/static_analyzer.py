@@ -1,18 +1,127 @@
 """Static analysis tools integration for code quality analysis"""
 
 import os
+import re
+import sys
 import json
+import asyncio
+import shutil
 import subprocess
 import tempfile
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 
+from config.settings import settings
 from models.schemas import FileInfo
+from utils.disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 파싱
+    orjson = None
+
+try:
+    from radon import __version__ as _RADON_VERSION
+    from radon.cli import Config as RadonConfig
+    from radon.cli.harvest import CCHarvester, MIHarvester, RawHarvester
+    from radon.complexity import SCORE as RADON_CC_ORDER
+except ImportError:  # radon 패키지를 import할 수 없으면 radon CLI 서브프로세스로 실행
+    _RADON_VERSION = None
+
+# 도구 JSON 출력 파서 (둘 다 bytes를 직접 받으며, orjson의 예외는 json.JSONDecodeError 하위 클래스)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# 동시에 실행할 분석 도구 프로세스 수 상한 (fork 폭주 방지)
+_MAX_CONCURRENT_TOOLS = (os.cpu_count() or 1) * 2
+
+# 한 번의 도구 실행에 넘길 파일 경로 목록 크기 상한 (ARG_MAX에서 도구 옵션/여유분을 뺀 나머지)
+try:
+    _ARG_MAX = os.sysconf('SC_ARG_MAX')
+except (AttributeError, ValueError, OSError):
+    _ARG_MAX = 128 * 1024
+_ARGV_RESERVED = 8 * 1024
+
+# 결과 변환 방식이 바뀌면 올려서 기존 디스크 캐시 항목을 무효화
+STATIC_ANALYZER_VERSION = 2
+_STATIC_CACHE_VERSION = (sys.version_info[:2], STATIC_ANALYZER_VERSION)
+
+# 지원하는 정적 분석 도구 (결과/요약의 도구 순서)
+_STATIC_TOOLS = ('bandit', 'pylint', 'flake8', 'mypy', 'radon')
+
+# import한 모듈에 따라 파일의 결과가 달라지는 도구 (캐시 키에 함께 검사한 파일 전체의 해시를 포함)
+_CROSS_FILE_TOOLS = frozenset({'pylint', 'mypy'})
+
+# 도구별 버전 문자열 (사용 불가면 None) - 프로세스당 한 번만 확인
+_TOOL_VERSIONS: Dict[str, Optional[str]] = {}
+
+# --version 확인이 제한 시간을 넘긴 경우 (콜드 스타트일 수 있어 _TOOL_VERSIONS에 기억하지 않음)
+_PROBE_TIMED_OUT = object()
+
+# mypy 출력 한 줄: `경로:줄[:열]: 심각도: 메시지  [오류 코드]` (메시지에는 오류 코드 표기를 그대로 둠)
+_MYPY_LINE_RE = re.compile(
+    r'^(?P<file>[^:\n]+):(?P<line>\d+):(?:(?P<column>\d+):)?[ \t]*(?P<severity>error|warning|note):[ \t]*'
+    r'(?P<message>.*?(?:[ \t]+\[(?P<code>[\w-]+)\])?)\s*$',
+    re.MULTILINE
+)
+
+# 요약의 severity_breakdown 항목별로 더할 도구 요약 키 (그 외 도구는 심각도 분류 없음)
+_SEVERITY_SUMMARY_KEYS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'bandit': (('high', 'high_severity'), ('medium', 'medium_severity'), ('low', 'low_severity')),
+    'pylint': (('errors', 'errors'), ('warnings', 'warnings')),
+}
+
+# 서브프로세스 대신 이 프로세스 안에서 실행하는 도구와 버전 (--version 확인 생략)
+# 나머지 도구는 서버 프로세스 전역 상태를 건드리므로 서브프로세스로 유지:
+# - mypy.api.run: 재귀 한도/gc 임계값 변경, gc.disable()/gc.freeze() 호출
+# - pylint Run: 실행 중 sys.path 교체(스레드 안전하지 않음), astroid 모듈 캐시가 전역, -j 0이면 서버에서 fork
+# - flake8 legacy API: 위반 항목 없이 통계만 반환 / bandit: 공개 라이브러리 API 없음
+_IN_PROCESS_TOOLS: Dict[str, str] = {'radon': _RADON_VERSION} if _RADON_VERSION else {}
+
+# 캐시에 저장할 때 클론 경로 표기 대신 넣는 자리 표시자 (_root_forms 순서와 대응)
+_ROOT_PLACEHOLDERS = ('\0root0\0', '\0root1\0', '\0root2\0', '\0root3\0')
+
+
+def _root_forms(clone_path: str) -> Tuple[str, ...]:
+    """도구 출력에 나타날 수 있는 클론 경로 표기 (인자로 준 경로, 절대 경로, 작업 디렉터리 기준 상대 경로와 ./ 형태)"""
+    abs_path = os.path.abspath(clone_path)
+    rel_path = os.path.relpath(abs_path)
+    return (clone_path.rstrip(os.sep) or os.sep, abs_path, rel_path, os.path.join('.', rel_path))
+
+
+def _relocate(value: Any, from_roots: Tuple[str, ...], to_roots: Tuple[str, ...]) -> Any:
+    """결과 안의 경로 문자열(값과 dict 키)에서 클론 경로 접두어를 대응하는 표기로 바꿈"""
+    if isinstance(value, str):
+        for from_root, to_root in zip(from_roots, to_roots):
+            if value == from_root or value.startswith(from_root + os.sep):
+                return to_root + value[len(from_root):]
+        return value
+    if isinstance(value, dict):
+        return {
+            _relocate(key, from_roots, to_roots): _relocate(item, from_roots, to_roots)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_relocate(item, from_roots, to_roots) for item in value]
+    return value
+
+
+def _share_strings(issues: List[Dict[str, Any]], shared: Dict[str, str]) -> None:
+    """이슈 dict의 문자열 값을 같은 값끼리 한 객체로 공유 (제자리 수정)
+    
+    경로/모듈/심볼/메시지 타입처럼 이슈마다 반복되는 값이 JSON 파싱이나 캐시 로드 시
+    각각 별도 문자열로 만들어지므로, 하나로 합쳐 이슈가 많은 저장소의 메모리를 줄입니다.
+    """
+    for issue in issues:
+        for key, value in issue.items():
+            if type(value) is str:
+                issue[key] = shared.setdefault(value, value)
+
 
 @dataclass
 class StaticAnalysisResult:
@@ -27,76 +136,71 @@ class StaticAnalysisResult:
 class StaticAnalyzer:
     """정적 분석 도구들을 통합한 분석기"""
     
-    def __init__(self):
+    def __init__(self, use_cache: Optional[bool] = None):
         self.available_tools = {}
+        self.tool_versions = {}
         self._check_available_tools()
+        
+        # 도구 버전 + 파일 내용 해시 기반 디스크 캐시 (변경 없는 파일은 도구 실행 생략)
+        if use_cache is None:
+            use_cache = settings.ENABLE_AST_CACHE
+        self.cache = DiskCache(
+            settings.STATIC_ANALYSIS_CACHE_DIR, settings.AST_CACHE_MAX_ENTRIES, version=_STATIC_CACHE_VERSION,
+            max_age_seconds=settings.STATIC_ANALYSIS_CACHE_MAX_AGE_DAYS * 24 * 60 * 60
+        ) if use_cache else None
+        self._cache_writes = 0
     
     def _check_available_tools(self):
-        """사용 가능한 정적 분석 도구들을 확인"""
-        tools_to_check = {
-            'bandit': self._check_bandit,
-            'pylint': self._check_pylint,
-            'flake8': self._check_flake8,
-            'mypy': self._check_mypy,
-            'radon': self._check_radon
-        }
-        
-        for tool_name, check_func in tools_to_check.items():
-            try:
-                if check_func():
-                    self.available_tools[tool_name] = True
-                    logger.info(f"Static analysis tool '{tool_name}' is available")
+        """사용 가능한 정적 분석 도구들을 확인 (PATH에 있는 도구만 --version을 동시에 실행)"""
+        versions = {tool_name: _TOOL_VERSIONS[tool_name] for tool_name in _STATIC_TOOLS if tool_name in _TOOL_VERSIONS}
+        unchecked = [tool_name for tool_name in _STATIC_TOOLS if tool_name not in versions]
+        if unchecked:
+            installed = [
+                tool_name for tool_name in unchecked
+                if tool_name not in _IN_PROCESS_TOOLS and shutil.which(tool_name)
+            ]
+            probed = dict(_IN_PROCESS_TOOLS)
+            if installed:
+                with ThreadPoolExecutor(max_workers=len(installed)) as executor:
+                    probed.update(zip(installed, executor.map(self._probe, installed)))
+            for tool_name in unchecked:
+                version = probed.get(tool_name)
+                if version is _PROBE_TIMED_OUT:
+                    # 이번 인스턴스에서는 사용 불가로 두고 다음 StaticAnalyzer 생성 시 다시 확인
+                    version = None
                 else:
-                    self.available_tools[tool_name] = False
-                    logger.warning(f"Static analysis tool '{tool_name}' is not available")
-            except Exception as e:
+                    _TOOL_VERSIONS[tool_name] = version
+                versions[tool_name] = version
+        
+        for tool_name in _STATIC_TOOLS:
+            version = versions[tool_name]
+            if version:
+                self.available_tools[tool_name] = True
+                self.tool_versions[tool_name] = version
+                logger.info(f"Static analysis tool '{tool_name}' is available")
+            else:
                 self.available_tools[tool_name] = False
-                logger.error(f"Error checking tool '{tool_name}': {e}")
-    
-    def _check_bandit(self) -> bool:
-        """Bandit 도구 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(['bandit', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
-    
-    def _check_pylint(self) -> bool:
-        """Pylint 도구 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(['pylint', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
-    
-    def _check_flake8(self) -> bool:
-        """Flake8 도구 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(['flake8', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
+                logger.warning(f"Static analysis tool '{tool_name}' is not available")
     
-    def _check_mypy(self) -> bool:
-        """MyPy 도구 사용 가능 여부 확인"""
+    def _probe(self, tool_name: str) -> Union[str, None, object]:
+        """도구 사용 가능 여부 확인 (사용 가능하면 버전 문자열, 제한 시간 초과 시 _PROBE_TIMED_OUT 반환)"""
         try:
-            result = subprocess.run(['mypy', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
+            result = subprocess.run([tool_name, '--version'], stdin=subprocess.DEVNULL,
+                                    capture_output=True, text=True, timeout=settings.STATIC_TOOL_PROBE_TIMEOUT)
+            return self._version_string(result)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timed out checking tool '{tool_name}' after {settings.STATIC_TOOL_PROBE_TIMEOUT}s")
+            return _PROBE_TIMED_OUT
+        except Exception as e:
+            logger.error(f"Error checking tool '{tool_name}': {e}")
+            return None
     
-    def _check_radon(self) -> bool:
-        """Radon 도구 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(['radon', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
+    @staticmethod
+    def _version_string(result: subprocess.CompletedProcess) -> Optional[str]:
+        """--version 실행 결과에서 버전 문자열 추출 (실패 시 None)"""
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or 'unknown'
     
     def analyze_files(self, clone_path: str, files: List[FileInfo]) -> Dict[str, List[StaticAnalysisResult]]:
         """파일들의 정적 분석 수행"""
@@ -109,298 +213,504 @@ class StaticAnalyzer:
             logger.info("No Python files found for static analysis")
             return results
         
-        for file_info in python_files:
-            file_path = os.path.join(clone_path, file_info.path)
-            file_results = []
-            
-            # 각 도구별로 분석 수행
-            if self.available_tools.get('bandit'):
-                bandit_result = self._run_bandit(file_path)
-                if bandit_result:
-                    file_results.append(bandit_result)
-            
-            if self.available_tools.get('pylint'):
-                pylint_result = self._run_pylint(file_path)
-                if pylint_result:
-                    file_results.append(pylint_result)
-            
-            if self.available_tools.get('flake8'):
-                flake8_result = self._run_flake8(file_path)
-                if flake8_result:
-                    file_results.append(flake8_result)
-            
-            if self.available_tools.get('mypy'):
-                mypy_result = self._run_mypy(file_path)
-                if mypy_result:
-                    file_results.append(mypy_result)
-            
-            if self.available_tools.get('radon'):
-                radon_result = self._run_radon(file_path)
-                if radon_result:
-                    file_results.append(radon_result)
-            
+        self._cache_writes = 0
+        coroutine = self._analyze_files_async(clone_path, python_files)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            results = asyncio.run(coroutine)
+        else:
+            # 이벤트 루프 안에서 호출된 경우 별도 스레드에서 새 루프로 실행
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results = executor.submit(asyncio.run, coroutine).result()
+        
+        if self.cache is not None and self._cache_writes:
+            self.cache.prune()
+        return results
+    
+    async def _analyze_files_async(self, clone_path: str, python_files: List[FileInfo]) -> Dict[str, List[StaticAnalysisResult]]:
+        """도구별로 여러 파일을 한 번에 검사하는 프로세스를 동시에 실행하고 파일/도구 순서대로 결과 수집"""
+        runners = [
+            (tool_name, runner) for tool_name, runner in (
+                ('bandit', self._run_bandit),
+                ('pylint', self._run_pylint),
+                ('flake8', self._run_flake8),
+                ('mypy', self._run_mypy),
+                ('radon', self._run_radon)
+            ) if self.available_tools.get(tool_name)
+        ]
+        if not runners:
+            return {}
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TOOLS)
+        file_paths = [os.path.join(clone_path, file_info.path) for file_info in python_files]
+        file_digests = self._file_digests(python_files, file_paths) if self.cache is not None else None
+        batch_digest = self._batch_digest(file_digests) if file_digests is not None else None
+        tool_results = await asyncio.gather(*[
+            self._run_cached(tool_name, runner, clone_path, file_paths, file_digests, batch_digest, semaphore)
+            for tool_name, runner in runners
+        ])
+        
+        results = {}
+        for file_info, file_path in zip(python_files, file_paths):
+            file_results = [result for by_path in tool_results if (result := by_path.get(file_path))]
             if file_results:
                 results[file_info.path] = file_results
         
         return results
     
-    def _run_bandit(self, file_path: str) -> Optional[StaticAnalysisResult]:
-        """Bandit 보안 분석 실행"""
+    @staticmethod
+    def _file_digests(python_files: List[FileInfo], file_paths: List[str]) -> List[Optional[str]]:
+        """캐시 키에 쓸 파일별 (클론 내 상대 경로 + 내용) 해시 (읽을 수 없는 파일은 None)"""
+        digests = []
+        for file_info, file_path in zip(python_files, file_paths):
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+            except OSError:
+                digests.append(None)
+                continue
+            digests.append(DiskCache.make_key(file_info.path.encode('utf-8'), b'\0', content))
+        return digests
+    
+    @staticmethod
+    def _batch_digest(file_digests: List[Optional[str]]) -> str:
+        """함께 검사하는 파일 전체의 해시 (입력 순서와 무관, 읽을 수 없는 파일도 구분)"""
+        return DiskCache.make_key(*sorted(digest.encode('ascii') if digest else b'-' for digest in file_digests))
+    
+    async def _run_cached(self, tool_name: str,
+                          runner: Callable[[List[str], asyncio.Semaphore], Awaitable[Dict[str, StaticAnalysisResult]]],
+                          clone_path: str, file_paths: List[str],
+                          file_digests: Optional[List[Optional[str]]], batch_digest: Optional[str],
+                          semaphore: asyncio.Semaphore) -> Dict[str, StaticAnalysisResult]:
+        """캐시에 없는 파일만 도구로 검사하고 새 결과를 캐시에 저장
+        
+        pylint/mypy는 import한 다른 파일이 바뀌면 결과가 달라지므로, 함께 검사한 파일 중
+        하나라도 바뀌면 모든 파일의 캐시 항목이 미스가 되도록 batch_digest를 키에 포함합니다.
+        """
+        results = {}
+        pending = file_paths
+        cache_keys = {}
+        if self.cache is not None:
+            roots = _root_forms(clone_path)
+            shared_strings = {}
+            pending = []
+            key_prefix = f"{tool_name}\0{self.tool_versions.get(tool_name)}\0"
+            if tool_name in _CROSS_FILE_TOOLS:
+                key_prefix += f"{batch_digest}\0"
+            for file_path, digest in zip(file_paths, file_digests):
+                if digest is None:
+                    pending.append(file_path)
+                    continue
+                cache_key = DiskCache.make_key(f"{key_prefix}{digest}".encode('utf-8'))
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    result = StaticAnalysisResult(**_relocate(cached, _ROOT_PLACEHOLDERS, roots))
+                    _share_strings(result.issues, shared_strings)
+                    results[file_path] = result
+                else:
+                    cache_keys[file_path] = cache_key
+                    pending.append(file_path)
+        
+        if not pending:
+            return results
+        
+        for chunk_results in await asyncio.gather(*[runner(chunk, semaphore) for chunk in self._chunk_paths(pending)]):
+            results.update(chunk_results)
+        
+        # 저장 시 클론 경로는 자리 표시자로 바꿔 다른 경로에 클론된 같은 파일에도 재사용
+        if self.cache is not None:
+            for file_path, cache_key in cache_keys.items():
+                result = results.get(file_path)
+                if result is not None:
+                    self.cache.set(cache_key, _relocate(asdict(result), roots, _ROOT_PLACEHOLDERS))
+                    self._cache_writes += 1
+        
+        return results
+    
+    @staticmethod
+    def _chunk_paths(file_paths: List[str]) -> List[List[str]]:
+        """명령줄 길이가 ARG_MAX를 넘지 않도록 파일 경로 목록을 나눔"""
+        budget = _ARG_MAX - _ARGV_RESERVED - sum(len(key) + len(value) + 2 + 8 for key, value in os.environ.items())
+        chunks = []
+        chunk = []
+        size = 0
+        for file_path in file_paths:
+            # 인자 문자열(+NUL)과 argv 포인터 크기
+            cost = len(os.fsencode(file_path)) + 1 + 8
+            if chunk and size + cost > budget:
+                chunks.append(chunk)
+                chunk = []
+                size = 0
+            chunk.append(file_path)
+            size += cost
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
+    @staticmethod
+    def _group_by_path(issues: List[Dict[str, Any]], path_key: str, file_paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """도구가 보고한 경로(작업 디렉터리 기준 상대 경로일 수 있음)로 이슈를 파일별로 분리
+        
+        모든 도구의 이슈가 거쳐 가므로 여기서 반복되는 문자열 값도 함께 공유합니다.
+        """
+        _share_strings(issues, {})
+        issues_by_abs_path = {os.path.abspath(file_path): [] for file_path in file_paths}
+        for issue in issues:
+            file_issues = issues_by_abs_path.get(os.path.abspath(issue.get(path_key) or ''))
+            if file_issues is not None:
+                file_issues.append(issue)
+        return {file_path: issues_by_abs_path[os.path.abspath(file_path)] for file_path in file_paths}
+    
+    @staticmethod
+    def _entries_by_path(data: Dict[str, Any], file_paths: List[str]) -> Dict[str, Tuple[str, Any]]:
+        """경로를 키로 하는 도구 출력에서 파일별 (도구가 쓴 키, 값) 추출"""
+        entries_by_abs_path = {os.path.abspath(key): (key, value) for key, value in data.items()}
+        return {
+            file_path: entries_by_abs_path[abs_path]
+            for file_path in file_paths
+            if (abs_path := os.path.abspath(file_path)) in entries_by_abs_path
+        }
+    
+    @staticmethod
+    def _batch_timeout(seconds_per_file: int, file_count: int) -> float:
+        """파일 묶음 실행 제한 시간 (파일 수에 비례하되 STATIC_TOOL_BATCH_TIMEOUT을 넘지 않음)"""
+        return min(seconds_per_file * file_count, settings.STATIC_TOOL_BATCH_TIMEOUT)
+    
+    @staticmethod
+    async def _run_tool(cmd: List[str], timeout: float, semaphore: asyncio.Semaphore) -> bytes:
+        """분석 도구 프로세스를 실행하고 stdout을 bytes 그대로 반환 (시간 초과 시 subprocess.TimeoutExpired)
+        
+        stderr는 결과에 쓰지 않으므로 메모리에 모으지 않고 버립니다. stdout은 communicate가
+        이벤트 루프에서 계속 읽어 내므로 출력이 커도 파이프 버퍼가 차서 멈추지 않습니다.
+        """
+        async with semaphore:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+        return stdout
+    
+    async def _run_bandit(self, file_paths: List[str], semaphore: asyncio.Semaphore) -> Dict[str, StaticAnalysisResult]:
+        """Bandit 보안 분석 실행 (여러 파일을 한 번에 검사한 뒤 파일별 결과로 분리)"""
         try:
-            cmd = ['bandit', '-f', 'json', file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            cmd = ['bandit', '-f', 'json', *file_paths]
+            stdout = await self._run_tool(cmd, self._batch_timeout(60, len(file_paths)), semaphore)
             
             # Bandit은 이슈가 있으면 exit code 1을 반환
-            if result.stdout:
+            if stdout:
                 try:
-                    data = json.loads(result.stdout)
-                    issues = data.get('results', [])
-                    metrics = data.get('metrics', {})
+                    data = _json_loads(stdout)
+                except json.JSONDecodeError:
+                    logger.error(f"Failed to parse bandit output for {len(file_paths)} files")
+                    return {}
+                
+                issues_by_path = self._group_by_path(data.get('results', []), 'filename', file_paths)
+                metrics_by_path = self._entries_by_path(data.get('metrics', {}), file_paths)
+                
+                results = {}
+                for file_path in file_paths:
+                    issues = issues_by_path[file_path]
+                    severity_counts = Counter(i.get('issue_severity') for i in issues)
+                    # 파일 하나만 검사했을 때와 같은 형태 (_totals = 해당 파일 지표)
+                    metrics = {}
+                    if file_path in metrics_by_path:
+                        metrics_key, file_metrics = metrics_by_path[file_path]
+                        metrics = {metrics_key: file_metrics, '_totals': file_metrics}
                     
-                    return StaticAnalysisResult(
+                    results[file_path] = StaticAnalysisResult(
                         tool='bandit',
                         file_path=file_path,
                         issues=issues,
                         metrics=metrics,
                         summary={
                             'total_issues': len(issues),
-                            'high_severity': len([i for i in issues if i.get('issue_severity') == 'HIGH']),
-                            'medium_severity': len([i for i in issues if i.get('issue_severity') == 'MEDIUM']),
-                            'low_severity': len([i for i in issues if i.get('issue_severity') == 'LOW'])
+                            'high_severity': severity_counts['HIGH'],
+                            'medium_severity': severity_counts['MEDIUM'],
+                            'low_severity': severity_counts['LOW']
                         }
                     )
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse bandit output for {file_path}")
+                return results
             
-            return None
+            return {}
             
         except subprocess.TimeoutExpired:
-            logger.error(f"Bandit analysis timed out for {file_path}")
-            return None
+            logger.error(f"Bandit analysis timed out for {len(file_paths)} files")
+            return {}
         except Exception as e:
-            logger.error(f"Error running bandit on {file_path}: {e}")
-            return None
+            logger.error(f"Error running bandit on {len(file_paths)} files: {e}")
+            return {}
     
-    def _run_pylint(self, file_path: str) -> Optional[StaticAnalysisResult]:
-        """Pylint 코드 품질 분석 실행"""
+    async def _run_pylint(self, file_paths: List[str], semaphore: asyncio.Semaphore) -> Dict[str, StaticAnalysisResult]:
+        """Pylint 코드 품질 분석 실행 (자체 병렬 처리로 여러 파일을 한 번에 검사한 뒤 파일별 결과로 분리)"""
         try:
-            cmd = ['pylint', '--output-format=json', '--reports=no', file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            cmd = ['pylint', '--output-format=json', '--reports=no', '-j', '0', *file_paths]
+            stdout = await self._run_tool(cmd, self._batch_timeout(120, len(file_paths)), semaphore)
             
-            if result.stdout:
+            if stdout:
                 try:
-                    issues = json.loads(result.stdout)
-                    
-                    # 메시지 타입별 분류
-                    error_count = len([i for i in issues if i.get('type') == 'error'])
-                    warning_count = len([i for i in issues if i.get('type') == 'warning'])
-                    convention_count = len([i for i in issues if i.get('type') == 'convention'])
-                    refactor_count = len([i for i in issues if i.get('type') == 'refactor'])
-                    
-                    return StaticAnalysisResult(
-                        tool='pylint',
-                        file_path=file_path,
-                        issues=issues,
-                        metrics={},
-                        summary={
-                            'total_issues': len(issues),
-                            'errors': error_count,
-                            'warnings': warning_count,
-                            'conventions': convention_count,
-                            'refactors': refactor_count
-                        }
-                    )
+                    messages = _json_loads(stdout)
                 except json.JSONDecodeError:
-                    logger.error(f"Failed to parse pylint output for {file_path}")
+                    logger.error(f"Failed to parse pylint output for {len(file_paths)} files")
+                    return {}
+                
+                issues_by_path = self._group_by_path(messages, 'path', file_paths)
+                return {
+                    file_path: self._pylint_result(file_path, issues)
+                    for file_path, issues in issues_by_path.items()
+                }
             
-            return None
+            return {}
             
         except subprocess.TimeoutExpired:
-            logger.error(f"Pylint analysis timed out for {file_path}")
-            return None
+            logger.error(f"Pylint analysis timed out for {len(file_paths)} files")
+            return {}
         except Exception as e:
-            logger.error(f"Error running pylint on {file_path}: {e}")
-            return None
+            logger.error(f"Error running pylint on {len(file_paths)} files: {e}")
+            return {}
     
-    def _run_flake8(self, file_path: str) -> Optional[StaticAnalysisResult]:
-        """Flake8 스타일 검사 실행"""
+    @staticmethod
+    def _pylint_result(file_path: str, issues: List[Dict[str, Any]]) -> StaticAnalysisResult:
+        """파일 하나의 pylint 메시지로 결과 생성"""
+        # 메시지 타입별 분류 (한 번 순회로 집계)
+        type_counts = Counter(i.get('type') for i in issues)
+        
+        return StaticAnalysisResult(
+            tool='pylint',
+            file_path=file_path,
+            issues=issues,
+            metrics={},
+            summary={
+                'total_issues': len(issues),
+                'errors': type_counts['error'],
+                'warnings': type_counts['warning'],
+                'conventions': type_counts['convention'],
+                'refactors': type_counts['refactor']
+            }
+        )
+    
+    async def _run_flake8(self, file_paths: List[str], semaphore: asyncio.Semaphore) -> Dict[str, StaticAnalysisResult]:
+        """Flake8 스타일 검사 실행 (여러 파일을 한 번에 검사한 뒤 파일별 결과로 분리)"""
         try:
-            cmd = ['flake8', '--format=json', file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            cmd = ['flake8', '--format=json', *file_paths]
+            stdout = await self._run_tool(cmd, self._batch_timeout(60, len(file_paths)), semaphore)
             
-            issues = []
-            if result.stdout:
-                # Flake8 JSON 출력 파싱
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            issue = json.loads(line)
-                            issues.append(issue)
-                        except json.JSONDecodeError:
-                            continue
+            violations = []
+            if stdout:
+                # Flake8 JSON 출력 파싱 (전체 문서 또는 줄 단위 JSON)
+                try:
+                    documents = [_json_loads(stdout)]
+                except json.JSONDecodeError:
+                    documents = []
+                    for line in stdout.strip().split(b'\n'):
+                        if line:
+                            try:
+                                documents.append(_json_loads(line))
+                            except json.JSONDecodeError:
+                                continue
+                
+                # 위반 항목 하나 또는 {파일 경로: [위반 항목]} 형태를 위반 항목 목록으로 평탄화
+                for document in documents:
+                    if not isinstance(document, dict):
+                        continue
+                    if 'filename' in document:
+                        violations.append(document)
+                    else:
+                        for file_violations in document.values():
+                            if isinstance(file_violations, list):
+                                violations.extend(v for v in file_violations if isinstance(v, dict))
             
-            return StaticAnalysisResult(
-                tool='flake8',
-                file_path=file_path,
-                issues=issues,
-                metrics={},
-                summary={
-                    'total_issues': len(issues),
-                    'style_violations': len(issues)
-                }
-            )
+            issues_by_path = self._group_by_path(violations, 'filename', file_paths)
+            return {
+                file_path: StaticAnalysisResult(
+                    tool='flake8',
+                    file_path=file_path,
+                    issues=issues,
+                    metrics={},
+                    summary={
+                        'total_issues': len(issues),
+                        'style_violations': len(issues)
+                    }
+                )
+                for file_path, issues in issues_by_path.items()
+            }
             
         except subprocess.TimeoutExpired:
-            logger.error(f"Flake8 analysis timed out for {file_path}")
-            return None
+            logger.error(f"Flake8 analysis timed out for {len(file_paths)} files")
+            return {}
         except Exception as e:
-            logger.error(f"Error running flake8 on {file_path}: {e}")
-            return None
+            logger.error(f"Error running flake8 on {len(file_paths)} files: {e}")
+            return {}
     
-    def _run_mypy(self, file_path: str) -> Optional[StaticAnalysisResult]:
-        """MyPy 타입 검사 실행"""
+    async def _run_mypy(self, file_paths: List[str], semaphore: asyncio.Semaphore) -> Dict[str, StaticAnalysisResult]:
+        """MyPy 타입 검사 실행 (여러 파일을 한 번에 검사한 뒤 파일별 결과로 분리)"""
         try:
-            cmd = ['mypy', '--show-error-codes', '--no-error-summary', file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            cmd = ['mypy', '--show-error-codes', '--no-error-summary', *file_paths]
+            # mypy는 JSON이 아닌 줄 단위 텍스트를 출력
+            stdout = (await self._run_tool(cmd, self._batch_timeout(60, len(file_paths)), semaphore)).decode('utf-8', errors='replace')
             
-            issues = []
-            if result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line and ':' in line:
-                        parts = line.split(':', 3)
-                        if len(parts) >= 4:
-                            issues.append({
-                                'file': parts[0],
-                                'line': parts[1],
-                                'column': parts[2] if parts[2].isdigit() else None,
-                                'message': parts[3].strip(),
-                                'severity': 'error' if 'error:' in line else 'note'
-                            })
+            # 모듈 이름이 같은 파일(패키지가 아닌 디렉터리의 main.py 등)이 함께 있으면 mypy가 검사를
+            # 중단하므로 파일별 실행으로 대체
+            if len(file_paths) > 1 and 'error: Duplicate module named' in stdout:
+                logger.info(f"MyPy found duplicate module names, checking {len(file_paths)} files individually")
+                results = {}
+                for file_results in await asyncio.gather(*[
+                    self._run_mypy([file_path], semaphore) for file_path in file_paths
+                ]):
+                    results.update(file_results)
+                return results
             
-            return StaticAnalysisResult(
-                tool='mypy',
-                file_path=file_path,
-                issues=issues,
-                metrics={},
-                summary={
-                    'total_issues': len(issues),
-                    'type_errors': len([i for i in issues if i.get('severity') == 'error'])
+            # 미리 컴파일한 정규식으로 출력 전체에서 진단 줄만 한 번에 추출
+            issues = [
+                {
+                    'file': match['file'],
+                    'line': match['line'],
+                    'column': match['column'],
+                    'message': match['message'],
+                    'severity': 'error' if match['severity'] == 'error' else 'note',
+                    'code': match['code']
                 }
-            )
+                for match in _MYPY_LINE_RE.finditer(stdout)
+            ]
+            
+            issues_by_path = self._group_by_path(issues, 'file', file_paths)
+            return {
+                file_path: StaticAnalysisResult(
+                    tool='mypy',
+                    file_path=file_path,
+                    issues=file_issues,
+                    metrics={},
+                    summary={
+                        'total_issues': len(file_issues),
+                        'type_errors': len([i for i in file_issues if i.get('severity') == 'error'])
+                    }
+                )
+                for file_path, file_issues in issues_by_path.items()
+            }
             
         except subprocess.TimeoutExpired:
-            logger.error(f"MyPy analysis timed out for {file_path}")
-            return None
+            logger.error(f"MyPy analysis timed out for {len(file_paths)} files")
+            return {}
         except Exception as e:
-            logger.error(f"Error running mypy on {file_path}: {e}")
-            return None
+            logger.error(f"Error running mypy on {len(file_paths)} files: {e}")
+            return {}
     
-    def _run_radon(self, file_path: str) -> Optional[StaticAnalysisResult]:
-        """Radon 복잡도 분석 실행"""
+    async def _run_radon(self, file_paths: List[str], semaphore: asyncio.Semaphore) -> Dict[str, StaticAnalysisResult]:
+        """Radon 복잡도 분석 실행 (여러 파일을 한 번에 검사한 뒤 파일별 결과로 분리)"""
         try:
-            # 순환 복잡도 분석
-            cc_cmd = ['radon', 'cc', '-j', file_path]
-            cc_result = subprocess.run(cc_cmd, capture_output=True, text=True, timeout=30)
-            
-            # 유지보수성 지수 분석
-            mi_cmd = ['radon', 'mi', '-j', file_path]
-            mi_result = subprocess.run(mi_cmd, capture_output=True, text=True, timeout=30)
-            
-            # 원시 메트릭 분석
-            raw_cmd = ['radon', 'raw', '-j', file_path]
-            raw_result = subprocess.run(raw_cmd, capture_output=True, text=True, timeout=30)
+            # 순환 복잡도 / 유지보수성 지수 / 원시 메트릭 분석
+            if 'radon' in _IN_PROCESS_TOOLS:
+                # 인터프리터 기동 없이 radon 라이브러리로 직접 분석 (CPU 작업이므로 워커 스레드에서 실행)
+                async with semaphore:
+                    outputs = await asyncio.to_thread(self._radon_in_process, file_paths)
+            else:
+                timeout = self._batch_timeout(30, len(file_paths))
+                outputs = await asyncio.gather(
+                    self._run_tool(['radon', 'cc', '-j', *file_paths], timeout, semaphore),
+                    self._run_tool(['radon', 'mi', '-j', *file_paths], timeout, semaphore),
+                    self._run_tool(['radon', 'raw', '-j', *file_paths], timeout, semaphore)
+                )
             
-            metrics = {}
-            issues = []
-            
-            # 순환 복잡도 결과 파싱
-            if cc_result.stdout:
-                try:
-                    cc_data = json.loads(cc_result.stdout)
-                    metrics['cyclomatic_complexity'] = cc_data
-                    
-                    # 높은 복잡도를 이슈로 분류
-                    for file_data in cc_data.values():
-                        for func_data in file_data:
-                            if func_data.get('complexity', 0) > 10:
-                                issues.append({
-                                    'type': 'high_complexity',
-                                    'function': func_data.get('name'),
-                                    'complexity': func_data.get('complexity'),
-                                    'line': func_data.get('lineno')
-                                })
-                except json.JSONDecodeError:
-                    pass
-            
-            # 유지보수성 지수 결과 파싱
-            if mi_result.stdout:
-                try:
-                    mi_data = json.loads(mi_result.stdout)
-                    metrics['maintainability_index'] = mi_data
-                except json.JSONDecodeError:
-                    pass
+            # 지표별 {파일 경로: (radon이 쓴 키, 값)}
+            entries_by_metric = {}
+            for metric_name, output in zip(('cyclomatic_complexity', 'maintainability_index', 'raw_metrics'), outputs):
+                if output:
+                    try:
+                        entries_by_metric[metric_name] = self._entries_by_path(_json_loads(output), file_paths)
+                    except json.JSONDecodeError:
+                        pass
             
-            # 원시 메트릭 결과 파싱
-            if raw_result.stdout:
-                try:
-                    raw_data = json.loads(raw_result.stdout)
-                    metrics['raw_metrics'] = raw_data
-                except json.JSONDecodeError:
-                    pass
+            results = {}
+            for file_path in file_paths:
+                metrics = {}
+                for metric_name, entries in entries_by_metric.items():
+                    # radon cc는 함수/클래스가 없는 파일을 출력에서 생략하므로 빈 dict로 남김
+                    metrics[metric_name] = dict([entries[file_path]]) if file_path in entries else {}
+                
+                # 높은 복잡도를 이슈로 분류 (분석 실패 시 radon은 목록 대신 {'error': ...}를 출력)
+                issues = []
+                for file_data in metrics.get('cyclomatic_complexity', {}).values():
+                    if not isinstance(file_data, list):
+                        continue
+                    for func_data in file_data:
+                        if func_data.get('complexity', 0) > 10:
+                            issues.append({
+                                'type': 'high_complexity',
+                                'function': func_data.get('name'),
+                                'complexity': func_data.get('complexity'),
+                                'line': func_data.get('lineno')
+                            })
+                
+                results[file_path] = StaticAnalysisResult(
+                    tool='radon',
+                    file_path=file_path,
+                    issues=issues,
+                    metrics=metrics,
+                    summary={
+                        'total_issues': len(issues),
+                        'high_complexity_functions': len(issues)
+                    }
+                )
             
-            return StaticAnalysisResult(
-                tool='radon',
-                file_path=file_path,
-                issues=issues,
-                metrics=metrics,
-                summary={
-                    'total_issues': len(issues),
-                    'high_complexity_functions': len(issues)
-                }
-            )
+            return results
             
         except subprocess.TimeoutExpired:
-            logger.error(f"Radon analysis timed out for {file_path}")
-            return None
+            logger.error(f"Radon analysis timed out for {len(file_paths)} files")
+            return {}
         except Exception as e:
-            logger.error(f"Error running radon on {file_path}: {e}")
-            return None
+            logger.error(f"Error running radon on {len(file_paths)} files: {e}")
+            return {}
+    
+    @staticmethod
+    def _radon_in_process(file_paths: List[str]) -> Tuple[str, str, str]:
+        """radon cc/mi/raw -j와 같은 설정(CLI 기본값)으로 하베스터를 실행해 같은 JSON 문자열 반환"""
+        cc_config = RadonConfig(
+            min='A', max='F', exclude=None, ignore=None, show_complexity=False, average=False,
+            total_average=False, order=RADON_CC_ORDER, no_assert=False, show_closures=False,
+            include_ipynb=False, ipynb_cells=False
+        )
+        mi_config = RadonConfig(
+            min='A', max='C', exclude=None, ignore=None, multi=True, show=False, sort=False,
+            include_ipynb=False, ipynb_cells=False
+        )
+        raw_config = RadonConfig(
+            exclude=None, ignore=None, summary=False, include_ipynb=False, ipynb_cells=False
+        )
+        return (
+            CCHarvester(file_paths, cc_config).as_json(),
+            MIHarvester(file_paths, mi_config).as_json(),
+            RawHarvester(file_paths, raw_config).as_json()
+        )
     
     def get_analysis_summary(self, results: Dict[str, List[StaticAnalysisResult]]) -> Dict[str, Any]:
         """정적 분석 결과 요약"""
-        summary = {
-            'total_files_analyzed': len(results),
-            'tools_used': list(self.available_tools.keys()),
-            'available_tools': self.available_tools,
-            'issues_by_tool': {},
-            'total_issues': 0,
-            'severity_breakdown': {
-                'high': 0,
-                'medium': 0,
-                'low': 0,
-                'errors': 0,
-                'warnings': 0
-            }
-        }
+        issues_by_tool = Counter()
+        severity_breakdown = dict.fromkeys(('high', 'medium', 'low', 'errors', 'warnings'), 0)
         
-        for file_path, file_results in results.items():
+        for file_results in results.values():
             for result in file_results:
                 tool = result.tool
-                
-                if tool not in summary['issues_by_tool']:
-                    summary['issues_by_tool'][tool] = 0
-                
-                issue_count = len(result.issues)
-                summary['issues_by_tool'][tool] += issue_count
-                summary['total_issues'] += issue_count
+                issues_by_tool[tool] += len(result.issues)
                 
                 # 심각도별 분류 (도구별로 다름)
-                if tool == 'bandit':
-                    summary['severity_breakdown']['high'] += result.summary.get('high_severity', 0)
-                    summary['severity_breakdown']['medium'] += result.summary.get('medium_severity', 0)
-                    summary['severity_breakdown']['low'] += result.summary.get('low_severity', 0)
-                elif tool == 'pylint':
-                    summary['severity_breakdown']['errors'] += result.summary.get('errors', 0)
-                    summary['severity_breakdown']['warnings'] += result.summary.get('warnings', 0)
+                severity_keys = _SEVERITY_SUMMARY_KEYS.get(tool)
+                if severity_keys:
+                    tool_summary = result.summary
+                    for severity, summary_key in severity_keys:
+                        severity_breakdown[severity] += tool_summary.get(summary_key, 0)
+        
+        summary = {
+            'total_files_analyzed': len(results),
+            'tools_used': list(self.available_tools.keys()),
+            'available_tools': self.available_tools,
+            'issues_by_tool': dict(issues_by_tool),
+            'total_issues': sum(issues_by_tool.values()),
+            'severity_breakdown': severity_breakdown
+        }
         
         return summary
\ No newline at end of file
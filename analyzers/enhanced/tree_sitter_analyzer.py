@@ -1,24 +1,153 @@
 """Tree-sitter based AST analyzer for enhanced code parsing"""
 
 import os
+import sys
 import logging
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 import tree_sitter
 from tree_sitter import Language, Parser
 
-from models.schemas import ASTNode, FileInfo
+try:
+    # tree-sitter 0.25+: Query.captures가 제거되고 QueryCursor로 실행
+    from tree_sitter import QueryCursor as _QueryCursor
+except ImportError:
+    _QueryCursor = None
+
+from config.settings import settings
+from models.schemas import ASTNode, FileInfo, build_ast_nodes
+from utils.disk_cache import DiskCache
+from utils.process_pool import process_pool_context
 
 logger = logging.getLogger(__name__)
 
+# 노드 변환 결과가 바뀌면 올려서 기존 디스크 캐시 항목을 무효화
+TREE_SITTER_ANALYZER_VERSION = 3
+_TS_CACHE_VERSION = (sys.version_info[:2], TREE_SITTER_ANALYZER_VERSION)
+
+# 언어별 정의 노드 타입 (첫 번째 identifier 자식을 노드 이름으로 사용)
+_NAMED_NODE_TYPES = {
+    'Python': ('function_definition', 'class_definition'),
+    'JavaScript': ('function_declaration', 'method_definition', 'class_declaration'),
+    'TypeScript': ('function_declaration', 'method_definition', 'class_declaration'),
+    'Java': ('class_declaration', 'method_declaration', 'constructor_declaration'),
+}
+
+# 언어별로 ASTNode를 만들 노드 타입 (구두점/키워드/식 등 나머지 노드는 건너뛰고 자식만 순회)
+# 목록에 없는 언어는 모든 노드를 변환
+_INTERESTING_NODE_TYPES = {
+    'Python': frozenset({
+        'module', 'function_definition', 'class_definition', 'decorated_definition',
+        'import_statement', 'import_from_statement'
+    }),
+    'JavaScript': frozenset({
+        'program', 'function_declaration', 'method_definition', 'class_declaration',
+        'import_statement', 'export_statement'
+    }),
+    'TypeScript': frozenset({
+        'program', 'function_declaration', 'method_definition', 'class_declaration',
+        'import_statement', 'export_statement'
+    }),
+    'Java': frozenset({
+        'program', 'class_declaration', 'method_declaration', 'constructor_declaration',
+        'import_declaration'
+    }),
+}
+
+
+def _node_text(source_bytes: bytes, node) -> str:
+    """노드의 소스 텍스트 (tree-sitter 위치는 UTF-8 바이트 오프셋이므로 바이트로 잘라서 디코딩)"""
+    return source_bytes[node.start_byte:node.end_byte].decode('utf-8', 'replace')
+
+
+def _compile_name_query(language: Language, node_types: Tuple[str, ...]) -> Optional[tree_sitter.Query]:
+    """정의 노드의 identifier 자식을 캡처하는 쿼리를 컴파일
+    
+    문법상 identifier 자식이 올 수 없는 노드 타입(예: JavaScript method_definition)은
+    QueryError가 나므로 제외합니다. 자식 순회로도 이름을 찾지 못하던 경우라 결과는 같습니다.
+    """
+    patterns = []
+    for node_type in node_types:
+        pattern = f"({node_type} (identifier) @name)"
+        try:
+            tree_sitter.Query(language, pattern)
+        except Exception:
+            continue
+        patterns.append(pattern)
+    return tree_sitter.Query(language, ' '.join(patterns)) if patterns else None
+
+
+def _query_captures(query: tree_sitter.Query, root) -> List[Any]:
+    """쿼리를 실행해 캡처된 노드 목록 반환 (tree-sitter 버전별 captures API 차이 흡수)"""
+    captures = _QueryCursor(query).captures(root) if _QueryCursor is not None else query.captures(root)
+    if isinstance(captures, dict):
+        return captures.get('name', [])
+    return [node for node, _ in captures]
+
+
+def _nodes_to_raw(nodes: List[ASTNode]) -> List[Dict[str, Any]]:
+    """ASTNode 트리를 캐시 저장용 dict 트리로 변환 (모델 객체보다 pickle 로드가 빠름)"""
+    return [{**node.__dict__, 'children': _nodes_to_raw(node.children)} for node in nodes]
+
+
+# 프로세스 풀 워커마다 한 번만 생성하는 분석기 (언어/파서 로드를 작업마다 반복하지 않음)
+_worker_analyzer: Optional['TreeSitterAnalyzer'] = None
+
+
+def _init_tree_sitter_worker(use_cache: bool) -> None:
+    """프로세스 풀 initializer: 워커 프로세스 전용 TreeSitterAnalyzer 생성"""
+    global _worker_analyzer
+    _worker_analyzer = TreeSitterAnalyzer(use_cache=use_cache)
+
+
+def _analyze_chunk_worker(task: Tuple[str, List[FileInfo]]) -> Tuple[Dict[str, List[ASTNode]], int]:
+    """프로세스 풀 워커: 파일 묶음 분석 (pickle 가능하도록 모듈 수준에 정의)
+    
+    캐시 정리는 부모 프로세스에서 한 번만 하도록 (결과, 캐시 쓰기 수)를 반환합니다.
+    """
+    clone_path, files = task
+    analyzer = _worker_analyzer
+    analyzer._cache_writes = 0
+    return analyzer._analyze_files(clone_path, files), analyzer._cache_writes
+
 
 class TreeSitterAnalyzer:
     """Tree-sitter를 사용한 고급 AST 분석기"""
     
-    def __init__(self):
+    def __init__(self, use_cache: Optional[bool] = None):
         self.languages = {}
         self.parsers = {}
+        self.queries = {}
         self._initialize_languages()
+        
+        # Parser는 스레드 간 공유할 수 없으므로 스레드마다 별도 파서 사용 (생성한 스레드는 self.parsers)
+        self._thread_local = threading.local()
+        self._thread_local.parsers = self.parsers
+        
+        # 파일 내용 해시 기반 디스크 캐시 (변경 없는 파일은 파싱 생략)
+        if use_cache is None:
+            use_cache = settings.ENABLE_AST_CACHE
+        self.cache = DiskCache(
+            settings.TREE_SITTER_CACHE_DIR, settings.AST_CACHE_MAX_ENTRIES, version=_TS_CACHE_VERSION
+        ) if use_cache else None
+        self._cache_writes = 0
+        self._cache_writes_lock = threading.Lock()
+    
+    def _get_parser(self, language: str) -> Parser:
+        """현재 스레드 전용 파서 반환 (처음 사용하는 스레드에서는 언어별로 새로 생성)"""
+        parsers = getattr(self._thread_local, 'parsers', None)
+        if parsers is None:
+            parsers = self._thread_local.parsers = {}
+        
+        parser = parsers.get(language)
+        if parser is None:
+            parser = Parser()
+            parser.language = self.languages[language]
+            parsers[language] = parser
+        return parser
     
     def _initialize_languages(self):
         """지원하는 언어들을 초기화"""
@@ -50,6 +179,12 @@ class TreeSitterAnalyzer:
                     parser = Parser()
                     parser.language = language  # set_language 대신 property 사용
                     self.parsers[lang_name] = parser
+                    
+                    # 정의 노드 이름 추출용 쿼리를 언어별로 한 번만 컴파일
+                    if lang_name in _NAMED_NODE_TYPES:
+                        query = _compile_name_query(language, _NAMED_NODE_TYPES[lang_name])
+                        if query is not None:
+                            self.queries[lang_name] = query
                 except Exception as e:
                     logger.warning(f"Failed to initialize {lang_name} parser: {e}")
                     continue
@@ -60,10 +195,12 @@ class TreeSitterAnalyzer:
             logger.error(f"Failed to import tree-sitter languages: {e}")
             self.languages = {}
             self.parsers = {}
+            self.queries = {}
         except Exception as e:
             logger.error(f"Failed to initialize tree-sitter: {e}")
             self.languages = {}
             self.parsers = {}
+            self.queries = {}
     
     def is_available(self) -> bool:
         """Tree-sitter가 사용 가능한지 확인"""
@@ -75,6 +212,16 @@ class TreeSitterAnalyzer:
             logger.warning("Tree-sitter is not available, skipping analysis")
             return {}
         
+        self._cache_writes = 0
+        ast_results = self._analyze_files(clone_path, files)
+        
+        # 새 항목이 추가된 경우에만 캐시 크기 정리
+        if self.cache is not None and self._cache_writes:
+            self.cache.prune()
+        return ast_results
+    
+    def _analyze_files(self, clone_path: str, files: List[FileInfo]) -> Dict[str, List[ASTNode]]:
+        """현재 프로세스에서 파일을 하나씩 분석 (캐시 정리는 호출자가 담당)"""
         ast_results = {}
         
         for file_info in files:
@@ -93,70 +240,191 @@ class TreeSitterAnalyzer:
         
         return ast_results
     
+    def analyze_files_parallel(self, clone_path: str, files: List[FileInfo],
+                               workers: Optional[int] = None) -> Dict[str, List[ASTNode]]:
+        """파일 목록을 워커 수만큼 나눠 프로세스 풀에서 analyze_files 수행
+        
+        결과는 입력 파일 순서대로 재구성되며, 워커가 1개 이하이거나 프로세스 풀을
+        사용할 수 없으면 현재 프로세스에서 순차 분석합니다.
+        """
+        if not self.is_available():
+            logger.warning("Tree-sitter is not available, skipping analysis")
+            return {}
+        
+        targets = [file_info for file_info in files if file_info.language in self.parsers]
+        if workers is None:
+            workers = min(settings.PARALLEL_ANALYSIS_WORKERS, os.cpu_count() or 1)
+        workers = min(workers, len(targets))
+        if workers <= 1:
+            return self.analyze_files(clone_path, targets)
+        
+        # 큰 파일부터 워커에 번갈아 배분해 한 워커에 대형 파일이 몰려 마지막까지 남는 것을 방지
+        chunk_files = [[] for _ in range(workers)]
+        for index, file_info in enumerate(sorted(targets, key=lambda f: f.size or 0, reverse=True)):
+            chunk_files[index % workers].append(file_info)
+        chunks = [(clone_path, chunk) for chunk in chunk_files]
+        
+        try:
+            ast_results = {}
+            cache_writes = 0
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=process_pool_context(__name__),
+                initializer=_init_tree_sitter_worker,
+                initargs=(self.cache is not None,)
+            ) as executor:
+                for chunk_results, chunk_writes in executor.map(_analyze_chunk_worker, chunks):
+                    ast_results.update(chunk_results)
+                    cache_writes += chunk_writes
+            
+            if self.cache is not None and cache_writes:
+                self.cache.prune()
+            
+            # 입력 파일 순서대로 결과 재구성
+            return {
+                file_info.path: ast_results[file_info.path]
+                for file_info in targets if file_info.path in ast_results
+            }
+        except Exception as e:
+            # 프로세스 풀을 사용할 수 없는 환경에서는 현재 프로세스의 스레드 풀로 대체
+            logger.warning(f"Parallel tree-sitter analysis unavailable, falling back to threads: {e}")
+            return self._analyze_files_threaded(clone_path, targets, workers)
+    
+    def _analyze_files_threaded(self, clone_path: str, files: List[FileInfo], workers: int) -> Dict[str, List[ASTNode]]:
+        """현재 프로세스의 스레드 풀에서 파일별 분석
+        
+        parser.parse는 GIL을 놓고 C에서 실행되므로 파일 읽기와 파싱이 스레드 간에 겹칩니다.
+        노드 변환은 GIL을 잡으므로 프로세스 풀보다는 효과가 작습니다.
+        """
+        self._cache_writes = 0
+        ast_results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map은 입력 순서대로 결과를 돌려주므로 파일 순서가 유지됨
+            for file_results in executor.map(lambda file_info: self._analyze_files(clone_path, [file_info]), files):
+                ast_results.update(file_results)
+        
+        if self.cache is not None and self._cache_writes:
+            self.cache.prune()
+        return ast_results
+    
     def _analyze_file(self, file_path: str, language: str) -> List[ASTNode]:
         """단일 파일의 Tree-sitter AST 분석"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                source_code = f.read()
+            # 디코딩 없이 바이트 그대로 파싱 (노드의 start_byte/end_byte가 이 버퍼 기준)
+            source_bytes = Path(file_path).read_bytes()
+            if self.cache is None:
+                return self._parse_source(source_bytes, language)
             
-            parser = self.parsers[language]
-            tree = parser.parse(bytes(source_code, 'utf8'))
+            cache_key = DiskCache.make_key(f"{_TS_CACHE_VERSION}\0{language}\0".encode('utf-8'), source_bytes)
+            cached_nodes = self.cache.get(cache_key)
+            if cached_nodes is not None:
+                return build_ast_nodes(cached_nodes)
             
-            return self._convert_tree_to_nodes(tree.root_node, source_code, language)
+            ast_nodes = self._parse_source(source_bytes, language)
+            self.cache.set(cache_key, _nodes_to_raw(ast_nodes))
+            with self._cache_writes_lock:
+                self._cache_writes += 1
+            return ast_nodes
             
         except Exception as e:
             logger.error(f"Error analyzing {file_path} with tree-sitter: {e}")
             return []
     
-    def _convert_tree_to_nodes(self, node, source_code: str, language: str, parent_name: str = "") -> List[ASTNode]:
-        """Tree-sitter 노드를 ASTNode 객체로 변환"""
-        nodes = []
+    def _parse_source(self, source_bytes: bytes, language: str) -> List[ASTNode]:
+        """소스를 파싱해 ASTNode 목록으로 변환"""
+        tree = self._get_parser(language).parse(source_bytes)
+        def_names = self._get_definition_names(tree.root_node, source_bytes, language)
+        return self._convert_tree_to_nodes(tree, source_bytes, language, def_names)
+    
+    def _get_definition_names(self, root, source_bytes: bytes, language: str) -> Dict[int, str]:
+        """컴파일된 쿼리를 트리 전체에 한 번 실행해 {정의 노드 id: 이름} 생성"""
+        query = self.queries.get(language)
+        if query is None:
+            return {}
+        
+        first_identifiers = {}
+        for identifier in _query_captures(query, root):
+            # 자식 순회와 같도록 정의 노드마다 가장 앞선 identifier 자식만 사용
+            parent_id = identifier.parent.id
+            current = first_identifiers.get(parent_id)
+            if current is None or identifier.start_byte < current.start_byte:
+                first_identifiers[parent_id] = identifier
+        
+        return {
+            node_id: _node_text(source_bytes, identifier)
+            for node_id, identifier in first_identifiers.items()
+        }
+    
+    def _convert_tree_to_nodes(self, tree, source_bytes: bytes, language: str,
+                               def_names: Dict[int, str]) -> List[ASTNode]:
+        """Tree-sitter 트리를 ASTNode 객체로 변환
+        
+        TreeCursor로 전위 순회하며 노드를 평탄한 목록에 만들고 부모 인덱스만 기록한 뒤,
+        마지막에 한 번에 children을 연결합니다. 재귀를 쓰지 않아 깊은 트리에서도
+        RecursionError가 나지 않습니다.
         
-        # 노드 정보 추출
-        node_type = node.type
-        node_name = self._get_node_name(node, source_code, language)
+        루트와 _INTERESTING_NODE_TYPES에 있는 노드만 ASTNode로 만들고, 나머지 노드는
+        자식만 순회하므로 그 아래의 노드는 가장 가까운 변환된 조상의 children에 붙습니다.
+        """
+        interesting_types = _INTERESTING_NODE_TYPES.get(language)
+        ast_nodes = []
+        parent_indices = []
+        ancestors = []  # 커서 깊이별로 가장 가까운 변환된 조상(자신 포함)의 인덱스 스택
+        cursor = tree.walk()
         
-        # 위치 정보
-        start_point = node.start_point
-        end_point = node.end_point
-        line_start = start_point[0] + 1  # 1-based indexing
-        line_end = end_point[0] + 1
+        while True:
+            node = cursor.node
+            nearest_index = ancestors[-1] if ancestors else -1
+            if not ancestors or interesting_types is None or node.type in interesting_types:
+                ast_nodes.append(self._create_ast_node(node, source_bytes, language, def_names))
+                parent_indices.append(nearest_index)
+                nearest_index = len(ast_nodes) - 1
+            
+            if cursor.goto_first_child():
+                ancestors.append(nearest_index)
+                continue
+            # 다음 형제가 있는 조상까지 올라감 (루트로 돌아오면 순회 종료)
+            while ancestors and not cursor.goto_next_sibling():
+                cursor.goto_parent()
+                ancestors.pop()
+            if not ancestors:
+                break
         
+        # 전위 순회 순서이므로 자식 순서가 그대로 유지됨
+        for index, parent_index in enumerate(parent_indices):
+            if parent_index >= 0:
+                ast_nodes[parent_index].children.append(ast_nodes[index])
+        
+        return ast_nodes[:1]
+    
+    def _create_ast_node(self, node, source_bytes: bytes, language: str, def_names: Dict[int, str]) -> ASTNode:
+        """Tree-sitter 노드 하나를 자식 없는 ASTNode로 변환"""
         # 메타데이터 수집
-        metadata = self._get_node_metadata(node, source_code, language)
+        metadata = self._get_node_metadata(node, source_bytes, language)
         metadata['language'] = language
         metadata['tree_sitter'] = True
         
-        # 현재 노드 생성
-        ast_node = ASTNode(
-            type=node_type,
-            name=node_name,
-            line_start=line_start,
-            line_end=line_end,
+        return ASTNode(
+            type=node.type,
+            name=self._get_node_name(node, source_bytes, language, def_names),
+            line_start=node.start_point[0] + 1,  # 1-based indexing
+            line_end=node.end_point[0] + 1,
             metadata=metadata
         )
-        
-        # 자식 노드들 처리
-        for child in node.children:
-            child_nodes = self._convert_tree_to_nodes(child, source_code, language, node_name or parent_name)
-            ast_node.children.extend(child_nodes)
-        
-        nodes.append(ast_node)
-        return nodes
     
-    def _get_node_name(self, node, source_code: str, language: str) -> Optional[str]:
-        """노드에서 이름 추출"""
+    def _get_node_name(self, node, source_bytes: bytes, language: str, def_names: Dict[int, str]) -> Optional[str]:
+        """노드에서 이름 추출 (정의 노드 이름은 쿼리로 미리 구한 def_names에서 조회)"""
         try:
             # 언어별 이름 추출 로직
             if language == 'Python':
-                return self._get_python_node_name(node, source_code)
+                return self._get_python_node_name(node, source_bytes, def_names)
             elif language in ['JavaScript', 'TypeScript']:
-                return self._get_js_node_name(node, source_code)
+                return self._get_js_node_name(node, source_bytes, def_names)
             elif language == 'Java':
-                return self._get_java_node_name(node, source_code)
+                return self._get_java_node_name(node, source_bytes, def_names)
             
             # 기본적으로 텍스트 내용 반환 (짧은 경우만)
-            text = source_code[node.start_byte:node.end_byte]
+            text = _node_text(source_bytes, node)
             if len(text) <= 100 and '\n' not in text:
                 return text.strip()
             
@@ -166,64 +434,55 @@ class TreeSitterAnalyzer:
             logger.debug(f"Error extracting node name: {e}")
             return None
     
-    def _get_python_node_name(self, node, source_code: str) -> Optional[str]:
+    def _get_python_node_name(self, node, source_bytes: bytes, def_names: Dict[int, str]) -> Optional[str]:
         """Python 노드 이름 추출"""
         if node.type in ['function_definition', 'class_definition']:
-            # 이름 노드 찾기
-            for child in node.children:
-                if child.type == 'identifier':
-                    return source_code[child.start_byte:child.end_byte]
+            return def_names.get(node.id)
         elif node.type == 'import_statement':
-            return source_code[node.start_byte:node.end_byte].strip()
+            return _node_text(source_bytes, node).strip()
         elif node.type == 'import_from_statement':
-            return source_code[node.start_byte:node.end_byte].strip()
+            return _node_text(source_bytes, node).strip()
         
         return None
     
-    def _get_js_node_name(self, node, source_code: str) -> Optional[str]:
+    def _get_js_node_name(self, node, source_bytes: bytes, def_names: Dict[int, str]) -> Optional[str]:
         """JavaScript/TypeScript 노드 이름 추출"""
         if node.type in ['function_declaration', 'method_definition', 'class_declaration']:
-            # 이름 노드 찾기
-            for child in node.children:
-                if child.type == 'identifier':
-                    return source_code[child.start_byte:child.end_byte]
+            return def_names.get(node.id)
         elif node.type in ['import_statement', 'export_statement']:
-            return source_code[node.start_byte:node.end_byte].strip()
+            return _node_text(source_bytes, node).strip()
         
         return None
     
-    def _get_java_node_name(self, node, source_code: str) -> Optional[str]:
+    def _get_java_node_name(self, node, source_bytes: bytes, def_names: Dict[int, str]) -> Optional[str]:
         """Java 노드 이름 추출"""
         if node.type in ['class_declaration', 'method_declaration', 'constructor_declaration']:
-            # 이름 노드 찾기
-            for child in node.children:
-                if child.type == 'identifier':
-                    return source_code[child.start_byte:child.end_byte]
+            return def_names.get(node.id)
         elif node.type == 'import_declaration':
-            return source_code[node.start_byte:node.end_byte].strip()
+            return _node_text(source_bytes, node).strip()
         
         return None
     
-    def _get_node_metadata(self, node, source_code: str, language: str) -> Dict[str, Any]:
+    def _get_node_metadata(self, node, source_bytes: bytes, language: str) -> Dict[str, Any]:
         """노드 메타데이터 추출"""
         metadata = {
             'node_type': node.type,
             'start_byte': node.start_byte,
             'end_byte': node.end_byte,
-            'child_count': len(node.children)
+            'child_count': node.child_count
         }
         
         # 언어별 특화 메타데이터
         if language == 'Python':
-            metadata.update(self._get_python_metadata(node, source_code))
+            metadata.update(self._get_python_metadata(node, source_bytes))
         elif language in ['JavaScript', 'TypeScript']:
-            metadata.update(self._get_js_metadata(node, source_code))
+            metadata.update(self._get_js_metadata(node, source_bytes))
         elif language == 'Java':
-            metadata.update(self._get_java_metadata(node, source_code))
+            metadata.update(self._get_java_metadata(node, source_bytes))
         
         return metadata
     
-    def _get_python_metadata(self, node, source_code: str) -> Dict[str, Any]:
+    def _get_python_metadata(self, node, source_bytes: bytes) -> Dict[str, Any]:
         """Python 특화 메타데이터"""
         metadata = {}
         
@@ -241,7 +500,7 @@ class TreeSitterAnalyzer:
         
         return metadata
     
-    def _get_js_metadata(self, node, source_code: str) -> Dict[str, Any]:
+    def _get_js_metadata(self, node, source_bytes: bytes) -> Dict[str, Any]:
         """JavaScript/TypeScript 특화 메타데이터"""
         metadata = {}
         
@@ -256,7 +515,7 @@ class TreeSitterAnalyzer:
         
         return metadata
     
-    def _get_java_metadata(self, node, source_code: str) -> Dict[str, Any]:
+    def _get_java_metadata(self, node, source_bytes: bytes) -> Dict[str, Any]:
         """Java 특화 메타데이터"""
         metadata = {}
         
@@ -273,27 +532,20 @@ class TreeSitterAnalyzer:
     
     def get_ast_summary(self, ast_results: Dict[str, List[ASTNode]]) -> Dict[str, Any]:
         """Tree-sitter AST 분석 결과 요약"""
-        summary = {
-            'total_files': len(ast_results),
-            'languages': {},
-            'node_types': {},
-            'total_nodes': 0,
-            'analyzer': 'tree-sitter'
-        }
+        languages = Counter()
+        node_types = Counter()
+        total_nodes = 0
         
-        for file_path, nodes in ast_results.items():
-            for node in nodes:
-                summary['total_nodes'] += 1
-                
-                # 언어별 통계
-                language = node.metadata.get('language', 'Unknown')
-                if language not in summary['languages']:
-                    summary['languages'][language] = 0
-                summary['languages'][language] += 1
-                
-                # 노드 타입별 통계
-                if node.type not in summary['node_types']:
-                    summary['node_types'][node.type] = 0
-                summary['node_types'][node.type] += 1
+        # 파일 단위로 Counter.update에 넘겨 언어/노드 타입별 집계를 C 수준에서 수행
+        for nodes in ast_results.values():
+            total_nodes += len(nodes)
+            languages.update(node.metadata.get('language', 'Unknown') for node in nodes)
+            node_types.update(node.type for node in nodes)
         
-        return summary
\ No newline at end of file
+        return {
+            'total_files': len(ast_results),
+            'languages': dict(languages),
+            'node_types': dict(node_types),
+            'total_nodes': total_nodes,
+            'analyzer': 'tree-sitter'
+        }
\ No newline at end of file
@@ -49,6 +49,27 @@ class Settings:
     MAX_REPO_SIZE_MB: int = int(os.getenv("MAX_REPO_SIZE_MB", "1000"))
     ANALYSIS_TIMEOUT_MINUTES: int = int(os.getenv("ANALYSIS_TIMEOUT_MINUTES", "60"))
     PARALLEL_ANALYSIS_WORKERS: int = int(os.getenv("PARALLEL_ANALYSIS_WORKERS", "4"))
+
+    # AST 분석 캐시 설정 (파일 내용 해시 기반, 변경 없는 파일은 재파싱 생략)
+    ENABLE_AST_CACHE: bool = os.getenv("ENABLE_AST_CACHE", "true").lower() == "true"
+    AST_CACHE_DIR: str = os.getenv("AST_CACHE_DIR", "cache/ast")
+    AST_CACHE_MAX_ENTRIES: int = int(os.getenv("AST_CACHE_MAX_ENTRIES", "5000"))
+    PIP_AUDIT_CACHE_DIR: str = os.getenv("PIP_AUDIT_CACHE_DIR", "cache/pip_audit")
+    PIP_AUDIT_CACHE_MAX_ENTRIES: int = int(os.getenv("PIP_AUDIT_CACHE_MAX_ENTRIES", "500"))
+    TREE_SITTER_CACHE_DIR: str = os.getenv("TREE_SITTER_CACHE_DIR", "cache/tree_sitter")
+    STATIC_ANALYSIS_CACHE_DIR: str = os.getenv("STATIC_ANALYSIS_CACHE_DIR", "cache/static_analysis")
+    STATIC_ANALYSIS_CACHE_MAX_AGE_DAYS: int = int(os.getenv("STATIC_ANALYSIS_CACHE_MAX_AGE_DAYS", "30"))
+    # 정적 분석 도구 --version 확인 제한 시간(초) - 도구들을 동시에 확인하므로 전체 대기도 이 시간으로 제한됨
+    STATIC_TOOL_PROBE_TIMEOUT: float = float(os.getenv("STATIC_TOOL_PROBE_TIMEOUT", "5"))
+    # 정적 분석 도구 한 번 실행(파일 묶음)의 제한 시간 상한(초) - 파일 수에 비례한 제한 시간도 이 값을 넘지 않음
+    STATIC_TOOL_BATCH_TIMEOUT: float = float(os.getenv("STATIC_TOOL_BATCH_TIMEOUT", "900"))
+    
+    # AST 분석 대상 파일 크기 제한 (생성/압축된 대형 파일은 분석 생략)
+    AST_MAX_FILE_BYTES: int = int(os.getenv("AST_MAX_FILE_BYTES", str(2 * 1024 * 1024)))
+    AST_MAX_PYTHON_LINES: int = int(os.getenv("AST_MAX_PYTHON_LINES", "50000"))
+    
+    # Python 함수 본문을 건너뛰고 모듈/클래스 수준 선언만 수집 (시그니처 요약만 필요한 경우)
+    AST_PYTHON_SHALLOW: bool = os.getenv("AST_PYTHON_SHALLOW", "false").lower() == "true"
     
     # 토큰 관리 설정
     MAX_TOKENS_PER_CHUNK: int = int(os.getenv("MAX_TOKENS_PER_CHUNK", "100000"))
@@ -59,6 +59,35 @@ class ASTNode(BaseModel):
         }
 
 
+# 검증 없이 ASTNode를 만들 때 모든 노드가 공유하는 fields_set (모든 필드가 설정된 것으로 취급)
+_AST_NODE_FIELDS = set(ASTNode.model_fields)
+_new_ast_node = ASTNode.__new__
+_object_setattr = object.__setattr__
+
+
+def build_ast_nodes(raw_nodes: List[Dict[str, Any]]) -> List[ASTNode]:
+    """분석기가 만든 dict 트리를 검증 없이 ASTNode 트리로 변환
+
+    dict는 분석기 내부(또는 그 결과를 저장한 캐시)에서만 만들어져 필드 타입이 이미 맞으므로,
+    model_construct와 같은 방식으로 원본 dict를 그대로 인스턴스 __dict__로 사용합니다
+    (노드마다 dict·fields_set 사본을 만들지 않음).
+    """
+    nodes = []
+    append = nodes.append
+    for raw in raw_nodes:
+        children = raw['children']
+        if children:
+            raw['children'] = build_ast_nodes(children)
+
+        node = _new_ast_node(ASTNode)
+        _object_setattr(node, '__dict__', raw)
+        _object_setattr(node, '__pydantic_fields_set__', _AST_NODE_FIELDS)
+        _object_setattr(node, '__pydantic_extra__', None)
+        _object_setattr(node, '__pydantic_private__', None)
+        append(node)
+    return nodes
+
+
 class TechSpec(BaseModel):
     language: str
     framework: Optional[str] = None
@@ -1,4 +1,3 @@
-import json
 import uuid
 import logging
 from typing import List, Optional, Dict, Any
@@ -149,7 +148,7 @@ class AnalysisService:
                                     
                                     # 분석 결과 저장 (commit 정보 포함)
                                     languages = list(set(f.language for f in repo.files if f.language))
-                                    ast_data_json = json.dumps(repo.ast_analysis, default=lambda o: o.__dict__, indent=2) if repo.ast_analysis else None
+                                    ast_data_json = ASTAnalyzer.dump(repo.ast_analysis, indent=True).decode('utf-8') if repo.ast_analysis else None
 
                                     RagRepositoryAnalysisService.save_analysis_results(
                                         db=db,
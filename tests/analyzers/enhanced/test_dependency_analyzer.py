@@ -0,0 +1,110 @@
+import os
+import stat
+
+import pytest
+
+from analyzers.enhanced import dependency_analyzer
+from analyzers.enhanced.dependency_analyzer import DependencyAnalyzer
+from config.settings import settings
+from models.schemas import FileInfo
+
+_REPORT = '{"dependencies": [{"name": "requests", "version": "2.0.0", "vulns": [{"id": "PYSEC-1"}]}]}'
+
+
+def _write_pip_audit_stub(bin_dir, calls_file, writes_report: bool):
+    """실행 횟수를 기록하는 가짜 pip-audit (writes_report=False면 리포트 없이 종료 코드 1)"""
+    report = f"printf '%s' '{_REPORT}' > \"$out\"" if writes_report else ":"
+    script = bin_dir / "pip-audit"
+    script.write_text(
+        "#!/bin/sh\n"
+        'if [ "$1" = "--version" ]; then echo "pip-audit 0.0.0"; exit 0; fi\n'
+        f'echo run >> "{calls_file}"\n'
+        'out=""\n'
+        'while [ $# -gt 0 ]; do\n'
+        '  if [ "$1" = "--output" ]; then out="$2"; fi\n'
+        '  shift\n'
+        'done\n'
+        f"{report}\n"
+        "exit 1\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """requirements.txt가 있는 프로젝트와 임시 캐시 디렉터리 준비"""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "requirements.txt").write_text("requests==2.0.0\n")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    cache_dir = tmp_path / "cache"
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setattr(settings, "PIP_AUDIT_CACHE_DIR", str(cache_dir))
+    dependency_analyzer._pip_audit_version.cache_clear()
+    yield project_dir, bin_dir, cache_dir, tmp_path / "calls"
+    dependency_analyzer._pip_audit_version.cache_clear()
+
+
+def _analyze(project_dir):
+    analyzer = DependencyAnalyzer(use_cache=True)
+    analyzer.available_tools = {'pip-audit': True}
+    files = [FileInfo(path="requirements.txt", size=16)]
+    return analyzer.analyze_project_with_status(str(project_dir), files)
+
+
+def _cached_entries(cache_dir):
+    return [name for _, _, names in os.walk(cache_dir) for name in names]
+
+
+def test_failed_pip_audit_run_is_not_cached(project):
+    project_dir, bin_dir, cache_dir, calls_file = project
+    _write_pip_audit_stub(bin_dir, calls_file, writes_report=False)
+
+    for _ in range(2):
+        results, completed = _analyze(project_dir)
+        assert results == []
+        assert completed is False
+
+    assert _cached_entries(cache_dir) == []
+    assert calls_file.read_text().splitlines() == ["run", "run"]
+
+
+def test_pip_audit_report_is_reused_across_analyzers(project):
+    project_dir, bin_dir, cache_dir, calls_file = project
+    _write_pip_audit_stub(bin_dir, calls_file, writes_report=True)
+
+    for _ in range(2):
+        results, completed = _analyze(project_dir)
+        assert completed is True
+        assert [result.summary['total_vulnerabilities'] for result in results] == [1]
+
+    assert len(_cached_entries(cache_dir)) == 1
+    assert calls_file.read_text().splitlines() == ["run"]
+
+
+def test_requirements_file_keeps_operator_extras_and_drops_markers(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text(
+        "# comment\n"
+        "-r base.txt\n"
+        "foo!=1.0\n"
+        "bar~=2.1\n"
+        "baz[security,socks]==3.0\n"
+        'qux>=1.2; python_version < "3.9"\n'
+        'plain ; sys_platform == "win32"\n'
+    )
+
+    result = DependencyAnalyzer().analyze_requirements_file(str(requirements))
+
+    assert [
+        (dep['package'], dep['operator'], dep['version']) for dep in result['dependencies']
+    ] == [
+        ('foo', '!=', '1.0'),
+        ('bar', '~=', '2.1'),
+        ('baz[security,socks]', '==', '3.0'),
+        ('qux', '>=', '1.2'),
+        ('plain', None, None),
+    ]
+    assert result['total_dependencies'] == 5
@@ -0,0 +1,65 @@
+import asyncio
+import os
+import shutil
+import time
+
+import pytest
+
+from analyzers.enhanced.static_analyzer import StaticAnalyzer
+from config.settings import settings
+from models.schemas import FileInfo
+
+
+def _file_infos(project_dir):
+    return [
+        FileInfo(path=path.name, size=path.stat().st_size, language="Python")
+        for path in sorted(project_dir.glob("*.py"))
+    ]
+
+
+def _mypy_errors(project_dir):
+    analyzer = StaticAnalyzer(use_cache=True)
+    analyzer.available_tools = {'mypy': True}
+    results = analyzer.analyze_files(str(project_dir), _file_infos(project_dir))
+    return {
+        path: [issue['code'] for result in file_results for issue in result.issues]
+        for path, file_results in results.items()
+    }
+
+
+@pytest.mark.skipif(shutil.which("mypy") is None, reason="mypy is not installed")
+def test_cached_mypy_result_is_invalidated_when_imported_module_changes(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "STATIC_ANALYSIS_CACHE_DIR", str(tmp_path / "cache"))
+
+    (project_dir / "lib.py").write_text("def f(x: int) -> int:\n    return x\n")
+    (project_dir / "app.py").write_text("from lib import f\n\nf(1)\n")
+    assert _mypy_errors(project_dir).get("app.py", []) == []
+
+    # app.py는 그대로 두고 import 대상의 시그니처만 변경
+    (project_dir / "lib.py").write_text("def f(x: str) -> str:\n    return x\n")
+    assert _mypy_errors(project_dir)["app.py"] == ["arg-type"]
+
+
+def test_hung_tool_is_killed_at_batch_timeout_cap(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "flake8"
+    script.write_text("#!/bin/sh\nexec sleep 60\n")
+    script.chmod(0o755)
+    source = tmp_path / "app.py"
+    source.write_text("x = 1\n")
+
+    analyzer = StaticAnalyzer(use_cache=False)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setattr(settings, "STATIC_TOOL_BATCH_TIMEOUT", 0.5)
+    # 파일 수에 비례한 제한 시간(60초 x 1000)보다 상한이 우선
+    assert analyzer._batch_timeout(60, 1000) == 0.5
+
+    started = time.monotonic()
+    results = asyncio.run(analyzer._run_flake8([str(source)], asyncio.Semaphore(1)))
+
+    assert results == {}
+    assert time.monotonic() - started < 10
@@ -0,0 +1,23 @@
+from analyzers.ast_analyzer import ASTAnalyzer
+from models.schemas import FileInfo
+
+
+def _walk(nodes):
+    for node in nodes:
+        yield node
+        yield from _walk(node.children)
+
+
+def test_result_nodes_do_not_share_module_metadata(tmp_path):
+    for name in ("A", "B"):
+        (tmp_path / f"{name}.java").write_text(f"package p;\npublic class {name} {{ void m() {{}} }}\n")
+        (tmp_path / f"{name.lower()}.py").write_text("import os\nx = 1\n")
+    files = [
+        FileInfo(path=path.name, size=path.stat().st_size, language="Java" if path.suffix == ".java" else "Python")
+        for path in sorted(tmp_path.iterdir())
+    ]
+
+    results = ASTAnalyzer(use_cache=False).analyze_files(str(tmp_path), files, parallel=False)
+    metadata = [node.metadata for nodes in results.values() for node in _walk(nodes)]
+
+    assert len({id(value) for value in metadata}) == len(metadata)
@@ -0,0 +1,52 @@
+import copy
+
+from models.schemas import ASTNode, build_ast_nodes
+
+
+def _raw(type, name=None, line_start=None, line_end=None, children=None, metadata=None):
+    return {
+        'type': type,
+        'name': name,
+        'line_start': line_start,
+        'line_end': line_end,
+        'children': children or [],
+        'metadata': metadata or {},
+    }
+
+
+def _raw_tree():
+    return [
+        _raw('class', 'A', 1, 10, children=[
+            _raw('function', 'm', 2, 4, metadata={'args': ['self'], 'decorators': []}),
+            _raw('function', 'n', 5, 9, children=[_raw('call', 'print', 6, 6)]),
+        ], metadata={'bases': ['Base']}),
+        _raw('import', 'os', 12, 12),
+    ]
+
+
+def test_build_ast_nodes_matches_model_validate():
+    expected = [ASTNode.model_validate(raw) for raw in _raw_tree()]
+
+    nodes = build_ast_nodes(_raw_tree())
+
+    assert nodes == expected
+    assert [node.model_dump() for node in nodes] == [node.model_dump() for node in expected]
+    assert [node.model_dump_json() for node in nodes] == [node.model_dump_json() for node in expected]
+    assert [node.to_dict() for node in nodes] == [node.to_dict() for node in expected]
+    assert all(type(child) is ASTNode for child in nodes[0].children)
+    assert nodes[0].model_fields_set == set(ASTNode.model_fields)
+
+
+def test_built_nodes_support_model_copy():
+    node = build_ast_nodes(_raw_tree())[0]
+
+    shallow = node.model_copy(update={'name': 'B'})
+    deep = node.model_copy(deep=True)
+    deep.children[0].metadata['args'].append('x')
+    deep.children.append(ASTNode(type='function', name='o'))
+
+    assert shallow.name == 'B' and node.name == 'A'
+    assert deep == copy.deepcopy(deep)
+    assert node.children[0].metadata['args'] == ['self']
+    assert len(node.children) == 2
+    assert ASTNode.model_validate(node.model_dump()) == node
@@ -0,0 +1,78 @@
+import os
+import time
+
+from utils.disk_cache import DiskCache
+
+
+def _key(name: str) -> str:
+    return DiskCache.make_key(name.encode('utf-8'))
+
+
+def _set_mtime(cache: DiskCache, key: str, mtime: float) -> None:
+    os.utime(cache._entry_path(key), (mtime, mtime))
+
+
+def test_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path), version=1)
+    value = {'nodes': [1, 2, 3], 'name': 'module'}
+
+    cache.set(_key('a'), value)
+
+    assert cache.get(_key('a')) == value
+    assert DiskCache(str(tmp_path), version=1).get(_key('a')) == value
+    assert cache.get(_key('missing')) is None
+
+
+def test_make_key_depends_on_all_parts():
+    assert DiskCache.make_key(b'a', b'b') == DiskCache.make_key(b'ab')
+    assert DiskCache.make_key(b'a', b'b') != DiskCache.make_key(b'a', b'c')
+
+
+def test_version_mismatch_is_a_miss(tmp_path):
+    DiskCache(str(tmp_path), version=('3.11', 1)).set(_key('a'), 'old')
+
+    assert DiskCache(str(tmp_path), version=('3.11', 2)).get(_key('a')) is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = DiskCache(str(tmp_path), version=1)
+    cache.set(_key('a'), 'value')
+    with open(cache._entry_path(_key('a')), 'wb') as f:
+        f.write(b'not a pickle')
+
+    assert cache.get(_key('a')) is None
+
+    cache.set(_key('a'), 'rewritten')
+    assert cache.get(_key('a')) == 'rewritten'
+
+
+def test_prune_evicts_least_recently_used_beyond_max_entries(tmp_path):
+    cache = DiskCache(str(tmp_path), max_entries=2)
+    now = time.time()
+    for offset, name in enumerate(('a', 'b', 'c')):
+        cache.set(_key(name), name)
+        _set_mtime(cache, _key(name), now - 300 + offset * 100)
+    # 조회하면 최근 사용 시각이 갱신되어 가장 오래된 항목이 b가 됨
+    assert cache.get(_key('a')) == 'a'
+
+    assert cache.prune() == 1
+
+    assert cache.get(_key('b')) is None
+    assert cache.get(_key('a')) == 'a'
+    assert cache.get(_key('c')) == 'c'
+
+
+def test_prune_evicts_entries_older_than_max_age(tmp_path):
+    cache = DiskCache(str(tmp_path), max_entries=10, max_age_seconds=60)
+    cache.set(_key('stale'), 'stale')
+    cache.set(_key('fresh'), 'fresh')
+    _set_mtime(cache, _key('stale'), time.time() - 120)
+
+    assert cache.prune() == 1
+
+    assert cache.get(_key('stale')) is None
+    assert cache.get(_key('fresh')) == 'fresh'
+
+
+def test_prune_without_cache_dir(tmp_path):
+    assert DiskCache(str(tmp_path / 'missing')).prune() == 0
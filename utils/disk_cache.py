@@ -0,0 +1,114 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """콘텐츠 해시를 키로 사용하는 pickle 기반 디스크 캐시
+
+    항목은 `<cache_dir>/<key[:2]>/<key[2:]>.pkl` 경로에 `(version, value)` 형태로 저장되며,
+    쓰기는 임시 파일 + os.replace로 원자적으로 수행합니다. 저장된 version이 현재
+    version과 다르면(인터프리터/분석기 버전 변경) 미스로 처리합니다.
+    """
+
+    SUFFIX = ".pkl"
+    PICKLE_PROTOCOL = 5
+
+    def __init__(self, cache_dir: str, max_entries: int = 5000, version: Any = None,
+                 max_age_seconds: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.version = version
+        self.max_age_seconds = max_age_seconds
+
+    @staticmethod
+    def make_key(*parts: bytes) -> str:
+        """주어진 바이트 조각들로 캐시 키(SHA-256 hex) 생성"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key[2:] + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 항목 조회 (없거나 손상된 경우 None)"""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                version, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if version != self.version:
+            return None
+
+        # LRU 정리를 위해 최근 사용 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 항목 저장 (실패해도 분석 흐름은 계속 진행)"""
+        path = self._entry_path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((self.version, value), f, protocol=self.PICKLE_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def prune(self) -> int:
+        """max_age_seconds 동안 사용되지 않은 항목과 max_entries를 초과한 항목을 오래 사용되지 않은 순서로 삭제"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as items:
+                        for item in items:
+                            if item.name.endswith(self.SUFFIX):
+                                entries.append((item.stat().st_mtime, item.path))
+        except FileNotFoundError:
+            return 0
+
+        entries.sort()
+        excess = max(len(entries) - self.max_entries, 0)
+        if self.max_age_seconds is not None:
+            cutoff = time.time() - self.max_age_seconds
+            while excess < len(entries) and entries[excess][0] < cutoff:
+                excess += 1
+        if excess <= 0:
+            return 0
+
+        removed = 0
+        for _, path in entries[:excess]:
+            try:
+                os.unlink(path)
+                removed += 1
+            except OSError:
+                continue
+
+        logger.info(f"Pruned {removed} entries from cache {self.cache_dir}")
+        return removed
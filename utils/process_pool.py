@@ -0,0 +1,27 @@
+import multiprocessing
+import threading
+from multiprocessing.context import BaseContext
+from typing import List
+
+# forkserver가 미리 import할 모듈 (분석기마다 추가, 서버가 시작되기 전에 등록된 모듈만 반영됨)
+_FORKSERVER_PRELOAD: List[str] = []
+_PRELOAD_LOCK = threading.Lock()
+
+
+def process_pool_context(preload_module: str) -> BaseContext:
+    """ProcessPoolExecutor용 시작 방식 (forkserver 우선, 지원하지 않는 플랫폼은 spawn)
+
+    분석은 다른 스레드(로깅, 이벤트 루프, 다른 분석기)가 동작 중인 프로세스에서 시작되므로,
+    fork로 복제하면 다른 스레드가 잡고 있던 잠금(로깅 핸들러 등)을 그대로 물려받아 워커가
+    멈출 수 있습니다. 멈춤은 예외가 아니어서 순차/스레드 대체 경로도 타지 않습니다.
+    preload_module은 forkserver가 미리 import해 두어 워커마다 다시 import하지 않도록 합니다.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+
+    context = multiprocessing.get_context('forkserver')
+    with _PRELOAD_LOCK:
+        if preload_module not in _FORKSERVER_PRELOAD:
+            _FORKSERVER_PRELOAD.append(preload_module)
+            context.set_forkserver_preload(list(_FORKSERVER_PRELOAD))
+    return context